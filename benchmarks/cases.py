@@ -0,0 +1,254 @@
+"""
+Benchmark case definitions.
+
+Each case pairs a name with a setup callable. Setup runs only for the
+cases selected to run and returns the zero-argument callable that is
+timed, so only the operation under test is measured and filtered-out
+cases (such as the large CLI fixtures) cost nothing.
+"""
+
+import os
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+from shamir.core import combine, reconstruct_secret, split, split_secret
+from shamir import backends, encoding, fields, vss
+from shamir.format import ShareHeader, decode_share, encode_share
+from shamir.randomness import SystemRandomSource
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+THRESHOLDS = ((2, 3), (3, 5), (5, 10), (10, 20))
+PAYLOAD_SIZES = (32, 4096, 1 << 20)
+SECRET_SIZES = (16, 1 << 10, 1 << 20)
+CLI_SIZES = (1 << 10, 1 << 24)
+
+Case = Tuple[str, Callable[[], Callable[[], object]]]
+
+
+def core_cases() -> Iterator[Case]:
+    secret = int.from_bytes(os.urandom(31), "big")
+
+    for k, n in THRESHOLDS:
+        yield f"core.split_secret[k={k},n={n}]", (
+            lambda k=k, n=n: lambda: split_secret(secret, k, n)
+        )
+
+        def reconstruct(k=k, n=n):
+            shares = split_secret(secret, k, n)[:k]
+            return lambda: reconstruct_secret(shares)
+
+        yield f"core.reconstruct_secret[k={k},n={n}]", reconstruct
+
+    # Every registered prime field, with a full-width secret.
+    for field in _prime_fields():
+        label = f"field=0x{field.field_id:02x}"
+
+        def split_field(field=field):
+            value = _below(field.prime)
+            return lambda: split_secret(value, 3, 5, field_id=field.field_id)
+
+        def reconstruct_field(field=field):
+            shares = split_secret(
+                _below(field.prime), 3, 5, field_id=field.field_id
+            )[:3]
+            return lambda: reconstruct_secret(shares, field_id=field.field_id)
+
+        yield f"core.split_secret[{label},k=3,n=5]", split_field
+        yield f"core.reconstruct_secret[{label},k=3,n=5]", reconstruct_field
+
+    # Byte secrets of increasing size through the GF(256) core API.
+    for size in SECRET_SIZES:
+
+        def split_bytes(size=size):
+            secret = os.urandom(size)
+            return lambda: split(secret, 3, 5)
+
+        def combine_bytes(size=size):
+            shares = split(os.urandom(size), 3, 5)[:3]
+            return lambda: combine(shares)
+
+        yield f"core.split[k=3,n=5,{size}B]", split_bytes
+        yield f"core.combine[k=3,{size}B]", combine_bytes
+
+
+def _prime_fields():
+    registered = (
+        fields.get_field(field_id)
+        for field_id in range(1, 0x100)
+        if fields.is_registered(field_id)
+    )
+    return [field for field in registered if isinstance(field, fields.PrimeField)]
+
+
+def _below(prime: int) -> int:
+    # A uniformly random field element of full width.
+    return int.from_bytes(os.urandom((prime.bit_length() + 7) // 8), "big") % prime
+
+
+def _environment_backends():
+    # The selection shamir.backends makes at import time.
+    names = os.environ.get("SHAMIR_BACKEND", "").split(",")
+    return [name.strip() for name in names if name.strip()]
+
+
+def _gf256_backend(name: str):
+    # Borrow a backend through the public selection API, then restore
+    # the default so other groups run on the usual backends.
+    try:
+        backends.use([name])
+        return backends.gf256_backend()
+    finally:
+        backends.use(_environment_backends())
+
+
+def gf256_cases() -> Iterator[Case]:
+    rng = SystemRandomSource()
+    xs = tuple(range(1, 6))
+
+    for name in backends.available()["gf256"]:
+        for size in PAYLOAD_SIZES:
+            # The byte-at-a-time reference is too slow for large payloads.
+            if name == "pure" and size > 4096:
+                continue
+
+            def split(name=name, size=size):
+                backend = _gf256_backend(name)
+                secret = os.urandom(size)
+                return lambda: backend.split(secret, 3, xs, rng)
+
+            def combine(name=name, size=size):
+                backend = _gf256_backend(name)
+                shares = backend.split(os.urandom(size), 3, xs, rng)
+                return lambda: backend.interpolate(xs[:3], shares[:3])
+
+            yield f"gf256.split[{name},k=3,n=5,{size}B]", split
+            yield f"gf256.combine[{name},k=3,{size}B]", combine
+
+
+def format_cases() -> Iterator[Case]:
+    header = ShareHeader(threshold=3, share_count=5, share_index=1)
+
+    for size in PAYLOAD_SIZES:
+        for label, key in (("plain", None), ("hmac", b"benchmark-key")):
+
+            def encode(size=size, key=key):
+                payload = os.urandom(size)
+                return lambda: encode_share(header, payload, key)
+
+            def decode(size=size, key=key):
+                encoded = encode_share(header, os.urandom(size), mac_key=key)
+                return lambda: decode_share(encoded, key)
+
+            yield f"format.encode_share[{label},{size}B]", encode
+            yield f"format.decode_share[{label},{size}B]", decode
+
+
+def encoding_cases() -> Iterator[Case]:
+    @lru_cache(maxsize=None)
+    def shares():
+        return split_secret(int.from_bytes(os.urandom(31), "big"), 2, 1000)
+
+    def encode_one():
+        share = shares()[0]
+        return lambda: encoding.encode_share(share)
+
+    def decode_one():
+        encoded = encoding.encode_share(shares()[0])
+        return lambda: encoding.decode_share(encoded)
+
+    def encode_many():
+        batch = shares()
+        return lambda: encoding.encode_shares(batch)
+
+    def decode_many():
+        batch = encoding.encode_shares(shares())
+        return lambda: encoding.decode_shares(batch)
+
+    yield "encoding.encode_share", encode_one
+    yield "encoding.decode_share", decode_one
+    yield "encoding.encode_shares[1000]", encode_many
+    yield "encoding.decode_shares[1000]", decode_many
+
+
+def vss_cases() -> Iterator[Case]:
+    for k, n in ((3, 5), (10, 100)):
+
+        def verify_one(k=k, n=n):
+            shares, commitments = vss.feldman_split(12345, k, n)
+            return lambda: vss.verify_share(shares[0], commitments)
+
+        def verify_batch(k=k, n=n):
+            shares, commitments = vss.feldman_split(12345, k, n)
+            return lambda: vss.verify_shares(shares, commitments)
+
+        yield f"vss.verify_share[k={k}]", verify_one
+        yield f"vss.verify_shares[k={k},m={n}]", verify_batch
+
+
+def _run_cli(*args: str) -> None:
+    subprocess.run(
+        [sys.executable, "-m", "shamir", *args],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+    )
+
+
+def cli_cases(workdir: Path) -> Iterator[Case]:
+    for size in CLI_SIZES:
+        secret_path = workdir / f"secret-{size}.bin"
+        prefix = workdir / f"share-{size}"
+        output = workdir / f"recovered-{size}.bin"
+
+        split_args = (
+            "split", "-k", "3", "-n", "5",
+            "-i", str(secret_path), "-o", str(prefix),
+        )
+
+        def split(size=size, secret_path=secret_path, args=split_args):
+            secret_path.write_bytes(os.urandom(size))
+            return lambda: _run_cli(*args)
+
+        def combine(size=size, secret_path=secret_path, args=split_args,
+                    prefix=prefix, output=output):
+            secret_path.write_bytes(os.urandom(size))
+            _run_cli(*args)
+            return lambda: _run_cli(
+                "combine", "-i", f"{prefix}.1", f"{prefix}.3", f"{prefix}.5",
+                "-o", str(output),
+            )
+
+        yield f"cli.split[k=3,n=5,{size}B]", split
+        yield f"cli.combine[k=3,{size}B]", combine
+
+
+GROUPS = {
+    "core": lambda workdir: core_cases(),
+    "gf256": lambda workdir: gf256_cases(),
+    "format": lambda workdir: format_cases(),
+    "encoding": lambda workdir: encoding_cases(),
+    "vss": lambda workdir: vss_cases(),
+    "cli": cli_cases,
+}
+
+
+def build_cases(
+    workdir: Path,
+    groups: Iterable[str] = tuple(GROUPS),
+    substring: str = "",
+) -> Dict[str, Callable[[], object]]:
+    """
+    Build the cases of the selected groups whose names contain
+    substring, running setup only for those.
+    """
+    cases = {}
+    for group in groups:
+        for name, setup in GROUPS[group](workdir):
+            if substring in name:
+                cases[name] = setup()
+    return cases
@@ -0,0 +1,122 @@
+"""
+Benchmark runner with JSON output and baseline comparison.
+
+Usage:
+
+    python -m benchmarks.run [--group core --group format ...]
+                             [--filter SUBSTRING]
+                             [--output results.json]
+                             [--baseline baseline.json --threshold 0.10]
+
+Each case is timed with timeit: the iteration count is calibrated so
+one round takes at least --min-time seconds, then --repeat rounds are
+taken and the per-call median and minimum are reported. With
+--baseline, any case whose median exceeds the stored median by more
+than --threshold (a fraction) is reported as a regression and the
+process exits with status 1.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .cases import GROUPS, build_cases
+
+
+def measure(function: Callable[[], object], repeat: int, min_time: float) -> Dict:
+    timer = timeit.Timer(function)
+
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    per_call = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "median_s": statistics.median(per_call),
+        "min_s": min(per_call),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Return a description of every case slower than baseline by more
+    than threshold. Cases missing from either side are ignored.
+    """
+    regressions = []
+    for name, current in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        ratio = current["median_s"] / reference["median_s"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {reference['median_s']:.3e}s -> "
+                f"{current['median_s']:.3e}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Shamir benchmark suite")
+    parser.add_argument("--group", action="append", choices=sorted(GROUPS))
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output", help="Write JSON results to this path")
+    parser.add_argument("--baseline", help="Compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="shamir-bench-") as tmp:
+        cases = build_cases(
+            Path(tmp), args.group or sorted(GROUPS), args.filter
+        )
+        for name, function in cases.items():
+            results[name] = measure(function, args.repeat, args.min_time)
+            print(
+                f"{name:<48} {results[name]['median_s']:.3e}s",
+                file=sys.stderr,
+            )
+
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"regression: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import asyncio
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from shamir.aio import Offloader, default_offloader
+
+from . import lifecycle
+from .context import OperationContext, OperationStage
+from .errors import OperationError
+from .lifecycle import OperationResult
+
+
+# Stage bodies run on the offloader without timing or metrics; every
+# result is finished on the event loop, exactly once. A stage that times
+# out keeps running in its thread, but its late result is discarded, so
+# one operation never reports both a timeout and an outcome.
+
+
+def _timed_out(stage: OperationStage) -> OperationResult:
+    return OperationResult(
+        stage=stage,
+        success=False,
+        error_code=OperationError.OPERATION_TIMEOUT.value,
+        message="Stage did not complete within the allotted time",
+    )
+
+
+async def _offload(offloader, timeout, function, *args):
+    # Returns None when the stage did not complete in time.
+    try:
+        return await (offloader or default_offloader()).run(
+            function, *args, timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        return None
+
+
+async def async_initialize(context: OperationContext) -> OperationResult:
+    """
+    Asynchronous initialize stage.
+
+    Context validation is constant-time and runs on the event loop.
+    """
+    return lifecycle.initialize(context)
+
+
+async def async_split(
+    secret: bytes,
+    context: OperationContext,
+    splitter,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[OperationResult, Optional[List]]:
+    """
+    Asynchronous split stage; the splitter runs on the offloader.
+
+    A timeout is reported as OPERATION_TIMEOUT rather than raised.
+    Cancellation propagates to the caller.
+    """
+    started = perf_counter()
+    outcome = await _offload(
+        offloader, timeout, lifecycle._run_split, secret, context, splitter
+    )
+    result, shares = outcome or (_timed_out(OperationStage.SPLIT), None)
+    return (
+        lifecycle._finish(
+            result,
+            context,
+            started,
+            shares=shares,
+            payload_bytes=lifecycle._payload_size(secret),
+        ),
+        shares,
+    )
+
+
+async def async_verify(
+    shares: List,
+    context: OperationContext,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+    commitments=None,
+) -> OperationResult:
+    """
+    Asynchronous verify stage.
+    """
+    started = perf_counter()
+    result = await _offload(
+        offloader, timeout, lifecycle._run_verify, shares, context, commitments
+    )
+    return lifecycle._finish(
+        result or _timed_out(OperationStage.VERIFY),
+        context,
+        started,
+        shares=shares,
+    )
+
+
+async def async_reconstruct(
+    shares: List,
+    context: OperationContext,
+    reconstructor,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+) -> Tuple[OperationResult, Optional[bytes]]:
+    """
+    Asynchronous reconstruct stage, including its mandatory verification.
+
+    timeout bounds verification and reconstruction together. A timeout
+    is reported as OPERATION_TIMEOUT rather than raised. Cancellation
+    propagates to the caller.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    verification = await async_verify(shares, context, offloader, timeout)
+    if not verification.success:
+        return verification, None
+
+    started = perf_counter()
+    remaining = None if deadline is None else max(deadline - loop.time(), 0)
+    outcome = await _offload(
+        offloader, remaining, lifecycle._run_reconstruct, shares, reconstructor
+    )
+    result, secret = outcome or (_timed_out(OperationStage.RECONSTRUCT), None)
+    return lifecycle._finish(result, context, started, shares=shares), secret
@@ -22,6 +22,9 @@ class OperationError(Enum):
     DUPLICATE_SHARE = "DUPLICATE_SHARE"
     CORRUPTED_INPUT = "CORRUPTED_INPUT"
     SHARE_CONTEXT_MISMATCH = "SHARE_CONTEXT_MISMATCH"
+    VERIFICATION_FAILED = "VERIFICATION_FAILED"
 
     SPLIT_FAILED = "SPLIT_FAILED"
     RECONSTRUCTION_FAILED = "RECONSTRUCTION_FAILED"
+
+    OPERATION_TIMEOUT = "OPERATION_TIMEOUT"
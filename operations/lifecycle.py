@@ -1,5 +1,9 @@
+from time import perf_counter
 from typing import List, Tuple, Optional
 
+from shamir.share import ShareSet
+
+from . import metrics
 from .context import OperationContext, OperationStage
 from .errors import OperationError
 from .verify import verify_shares
@@ -8,6 +12,13 @@ from .verify import verify_shares
 class OperationResult:
     """
     Deterministic result of a single operational stage.
+
+    duration is the monotonic wall time spent in the stage, in seconds.
+    share_count is the number of shares handled and payload_bytes the
+    size of the stage input: the secret for split, shares otherwise.
+    Summing share sizes costs a pass over the shares, so for share
+    inputs payload_bytes is only filled in while a metrics sink is
+    registered and is 0 otherwise.
     """
 
     def __init__(
@@ -16,41 +27,101 @@ class OperationResult:
         success: bool,
         error_code: Optional[str] = None,
         message: Optional[str] = None,
+        duration: Optional[float] = None,
+        share_count: int = 0,
+        payload_bytes: int = 0,
     ):
         self.stage = stage
         self.success = success
         self.error_code = error_code
         self.message = message
+        self.duration = duration
+        self.share_count = share_count
+        self.payload_bytes = payload_bytes
+
+
+def _payload_size(value) -> int:
+    """
+    Best-effort byte size of a secret or a single share.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, int):
+        return (value.bit_length() + 7) // 8
+    if isinstance(value, tuple) and len(value) == 2:
+        return _payload_size(value[1])
+
+    payload = getattr(value, "payload", None)
+    if payload is not None:
+        return _payload_size(payload)
+    return 0
+
+
+def _shares_size(shares) -> int:
+    if not shares:
+        return 0
+    if isinstance(shares, ShareSet):
+        return shares.nbytes
+    return sum(map(_payload_size, shares))
+
+
+def _finish(
+    result: OperationResult,
+    context: OperationContext,
+    started: float,
+    shares=None,
+    payload_bytes: Optional[int] = None,
+) -> OperationResult:
+    result.duration = perf_counter() - started
+    if shares:
+        result.share_count = len(shares)
+    if payload_bytes is not None:
+        result.payload_bytes = payload_bytes
+
+    if metrics.enabled():
+        if payload_bytes is None:
+            result.payload_bytes = _shares_size(shares)
+        metrics.emit(result, context)
+    return result
 
 
 def initialize(context: OperationContext) -> OperationResult:
     """
     Initialize and validate an operational context.
     """
+    started = perf_counter()
+
     error = context.validate()
     if error:
-        return OperationResult(
-            stage=OperationStage.INITIALIZE,
-            success=False,
-            error_code=error,
-            message="Context validation failed",
+        return _finish(
+            OperationResult(
+                stage=OperationStage.INITIALIZE,
+                success=False,
+                error_code=error,
+                message="Context validation failed",
+            ),
+            context,
+            started,
         )
 
-    return OperationResult(
-        stage=OperationStage.INITIALIZE,
-        success=True,
-        message="Context initialized successfully",
+    return _finish(
+        OperationResult(
+            stage=OperationStage.INITIALIZE,
+            success=True,
+            message="Context initialized successfully",
+        ),
+        context,
+        started,
     )
 
 
-def split(
+def _run_split(
     secret: bytes,
     context: OperationContext,
     splitter,
 ) -> Tuple[OperationResult, Optional[List]]:
-    """
-    Split a secret into shares using the provided splitter implementation.
-    """
+    # The stage body without timing or metrics, so that the synchronous
+    # and asynchronous lifecycles finish each result exactly once.
     if context.dry_run:
         return (
             OperationResult(
@@ -89,14 +160,34 @@ def split(
     )
 
 
-def verify(
-    shares: List,
+def split(
+    secret: bytes,
     context: OperationContext,
-) -> OperationResult:
+    splitter,
+) -> Tuple[OperationResult, Optional[List]]:
     """
-    Verify structural and procedural correctness of shares.
+    Split a secret into shares using the provided splitter implementation.
     """
-    error = verify_shares(shares, context)
+    started = perf_counter()
+    result, shares = _run_split(secret, context, splitter)
+    return (
+        _finish(
+            result,
+            context,
+            started,
+            shares=shares,
+            payload_bytes=_payload_size(secret),
+        ),
+        shares,
+    )
+
+
+def _run_verify(
+    shares: List,
+    context: OperationContext,
+    commitments=None,
+) -> OperationResult:
+    error = verify_shares(shares, context, commitments)
     if error:
         return OperationResult(
             stage=OperationStage.VERIFY,
@@ -112,18 +203,26 @@ def verify(
     )
 
 
-def reconstruct(
+def verify(
     shares: List,
     context: OperationContext,
-    reconstructor,
-) -> Tuple[OperationResult, Optional[bytes]]:
+    commitments=None,
+) -> OperationResult:
     """
-    Reconstruct a secret from verified shares.
+    Verify structural and procedural correctness of shares.
+
+    commitments, when given, are shamir.vss Feldman commitments the
+    share values are checked against.
     """
-    verification = verify(shares, context)
-    if not verification.success:
-        return verification, None
+    started = perf_counter()
+    result = _run_verify(shares, context, commitments)
+    return _finish(result, context, started, shares=shares)
+
 
+def _run_reconstruct(
+    shares: List,
+    reconstructor,
+) -> Tuple[OperationResult, Optional[bytes]]:
     try:
         secret = reconstructor(shares)
     except Exception:
@@ -145,3 +244,23 @@ def reconstruct(
         ),
         secret,
     )
+
+
+def reconstruct(
+    shares: List,
+    context: OperationContext,
+    reconstructor,
+) -> Tuple[OperationResult, Optional[bytes]]:
+    """
+    Reconstruct a secret from verified shares.
+
+    The verify stage is recorded separately; the reconstruct stage
+    covers only the reconstructor call.
+    """
+    verification = verify(shares, context)
+    if not verification.success:
+        return verification, None
+
+    started = perf_counter()
+    result, secret = _run_reconstruct(shares, reconstructor)
+    return _finish(result, context, started, shares=shares), secret
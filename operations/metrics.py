@@ -0,0 +1,130 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, TextIO, Tuple
+
+from .context import OperationContext
+
+
+class MetricsSink(ABC):
+    """
+    Receiver for per-stage operational measurements.
+
+    Sinks are registered explicitly with register_sink(). When no sink
+    is registered, lifecycle stages skip emission entirely.
+    """
+
+    @abstractmethod
+    def record(self, result, context: OperationContext) -> None:
+        """
+        Receive the result of one completed stage.
+
+        The result carries stage, success, error_code, duration,
+        share_count and payload_bytes.
+        """
+
+
+_sinks: List[MetricsSink] = []
+
+
+def register_sink(sink: MetricsSink) -> None:
+    """
+    Register a sink to receive every subsequent stage result.
+    """
+    if sink not in _sinks:
+        _sinks.append(sink)
+
+
+def unregister_sink(sink: MetricsSink) -> None:
+    """
+    Stop delivering stage results to a previously registered sink.
+    """
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def enabled() -> bool:
+    """
+    Return True if at least one sink is registered.
+    """
+    return bool(_sinks)
+
+
+def emit(result, context: OperationContext) -> None:
+    """
+    Deliver a stage result to all registered sinks.
+    """
+    for sink in tuple(_sinks):
+        sink.record(result, context)
+
+
+class JsonLinesSink(MetricsSink):
+    """
+    Writes one JSON object per stage result to a text stream.
+    """
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def record(self, result, context: OperationContext) -> None:
+        line = json.dumps(
+            {
+                "session_id": context.session_id,
+                "stage": result.stage.value,
+                "success": result.success,
+                "error_code": result.error_code,
+                "duration_seconds": result.duration,
+                "share_count": result.share_count,
+                "payload_bytes": result.payload_bytes,
+            },
+            sort_keys=True,
+        )
+        with self._lock:
+            self._stream.write(line + "\n")
+
+
+class PrometheusTextSink(MetricsSink):
+    """
+    Aggregates stage results for the Prometheus text exposition format.
+
+    Series are labelled by stage and outcome only; session identifiers
+    are deliberately not used as labels.
+    """
+
+    def __init__(self, namespace: str = "shamir"):
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], List[float]] = {}
+
+    def record(self, result, context: OperationContext) -> None:
+        key = (result.stage.value, "success" if result.success else "failure")
+        with self._lock:
+            totals = self._series.setdefault(key, [0, 0.0, 0, 0])
+            totals[0] += 1
+            totals[1] += result.duration or 0.0
+            totals[2] += result.share_count or 0
+            totals[3] += result.payload_bytes or 0
+
+    def render(self) -> str:
+        """
+        Return the current aggregates in Prometheus text format.
+        """
+        prefix = self._namespace
+        with self._lock:
+            series = sorted((key, list(v)) for key, v in self._series.items())
+
+        def samples(name, position):
+            return [
+                f'{name}{{stage="{stage}",outcome="{outcome}"}} {totals[position]}'
+                for (stage, outcome), totals in series
+            ]
+
+        lines = [f"# TYPE {prefix}_stage_duration_seconds summary"]
+        lines += samples(f"{prefix}_stage_duration_seconds_sum", 1)
+        lines += samples(f"{prefix}_stage_duration_seconds_count", 0)
+        lines.append(f"# TYPE {prefix}_stage_shares_total counter")
+        lines += samples(f"{prefix}_stage_shares_total", 2)
+        lines.append(f"# TYPE {prefix}_stage_payload_bytes_total counter")
+        lines += samples(f"{prefix}_stage_payload_bytes_total", 3)
+        return "\n".join(lines) + "\n"
@@ -1,15 +1,43 @@
-from typing import List
+from typing import List, Optional
+
+from shamir import vss
+from shamir.errors import VerificationError
+from shamir.share import ShareSet
 
 from .context import OperationContext
 from .errors import OperationError
 
 
-def verify_shares(shares: List, context: OperationContext):
+def _share_value(payload) -> int:
+    if isinstance(payload, int):
+        return payload
+    return int.from_bytes(payload, "big")
+
+
+def _verify_commitments(shares, commitments: vss.Commitments):
+    try:
+        pairs = [(share.index, _share_value(share.payload)) for share in shares]
+        invalid = vss.verify_shares(pairs, commitments)
+    except (AttributeError, TypeError, VerificationError):
+        return OperationError.CORRUPTED_INPUT.value
+
+    if invalid:
+        return OperationError.VERIFICATION_FAILED.value
+    return None
+
+
+def verify_shares(
+    shares: List,
+    context: OperationContext,
+    commitments: Optional[vss.Commitments] = None,
+):
     """
     Perform procedural verification of Shamir shares.
 
     This function validates structural and contextual correctness of shares
-    without performing cryptographic reconstruction.
+    without performing cryptographic reconstruction. With Feldman
+    commitments from shamir.vss, share values are also checked against
+    the dealer's polynomial in one batch.
     """
 
     if not shares:
@@ -18,6 +46,15 @@ def verify_shares(shares: List, context: OperationContext):
     if len(shares) < context.threshold:
         return OperationError.INSUFFICIENT_SHARES.value
 
+    # A ShareSet rejects duplicates on insertion and carries a single
+    # session identifier, so only the session needs checking.
+    if isinstance(shares, ShareSet):
+        if shares.session_id != context.session_id:
+            return OperationError.SHARE_CONTEXT_MISMATCH.value
+        if commitments is not None:
+            return _verify_commitments(shares, commitments)
+        return None
+
     seen = set()
     for share in shares:
         identifier = getattr(share, "id", None)
@@ -34,4 +71,7 @@ def verify_shares(shares: List, context: OperationContext):
         if session_id != context.session_id:
             return OperationError.SHARE_CONTEXT_MISMATCH.value
 
+    if commitments is not None:
+        return _verify_commitments(shares, commitments)
+
     return None
@@ -0,0 +1,8 @@
+"""
+Entry point for `python -m shamir`; runs the command-line interface.
+"""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
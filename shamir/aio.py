@@ -0,0 +1,213 @@
+"""
+asyncio integration for the Shamir core.
+
+Split and reconstruction are CPU-bound and would block the event loop
+if called directly from a coroutine. The coroutines in this module
+offload them to an executor through an Offloader, which also bounds
+the number of in-flight operations (backpressure) and applies an
+optional timeout.
+
+Timeouts and cancellation return control to the caller immediately,
+but work already running in a thread cannot be interrupted; its slot
+stays occupied until the executor finishes it, so abandoned calls
+still count against the concurrency bound. Batched operations are
+submitted in slices, so cancellation takes effect at the next slice
+boundary.
+"""
+
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, List, Optional, Sequence
+
+from . import core
+
+
+class Offloader:
+    """
+    Runs blocking callables on an executor with bounded concurrency.
+
+    executor defaults to the running loop's default executor. At most
+    max_pending calls run or wait for the executor at once; further
+    callers wait in FIFO order without consuming executor capacity.
+    timeout, in seconds, applies to each call unless overridden.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_pending: int = 32,
+        timeout: Optional[float] = None,
+    ):
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+
+        self.executor = executor
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_pending)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(
+        self,
+        function: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        Run function(*args, **kwargs) on the executor and await the result.
+
+        Raises asyncio.TimeoutError if the call does not complete in time.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore()
+
+        await semaphore.acquire()
+        try:
+            future = loop.run_in_executor(
+                self.executor, partial(function, *args, **kwargs)
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+        future.add_done_callback(lambda _: semaphore.release())
+
+        # The shield keeps the slot accounted for until the executor is
+        # done, even when the awaiting caller gives up.
+        return await asyncio.wait_for(
+            asyncio.shield(future), self.timeout if timeout is None else timeout
+        )
+
+
+_default_offloader = Offloader()
+
+
+def configure(
+    executor: Optional[Executor] = None,
+    max_pending: int = 32,
+    timeout: Optional[float] = None,
+) -> Offloader:
+    """
+    Replace the module-wide default Offloader and return it.
+    """
+    global _default_offloader
+    _default_offloader = Offloader(executor, max_pending, timeout)
+    return _default_offloader
+
+
+def default_offloader() -> Offloader:
+    """
+    Return the module-wide default Offloader.
+    """
+    return _default_offloader
+
+
+def _resolve(offloader: Optional[Offloader]) -> Offloader:
+    return _default_offloader if offloader is None else offloader
+
+
+async def async_split(
+    secret: bytes,
+    threshold: int,
+    shares: int,
+    seed=None,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+):
+    """
+    Asynchronous core.split.
+    """
+    return await _resolve(offloader).run(
+        core.split, secret, threshold, shares, seed=seed, timeout=timeout
+    )
+
+
+async def async_combine(
+    shares,
+    threshold: Optional[int] = None,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+) -> bytes:
+    """
+    Asynchronous core.combine.
+    """
+    return await _resolve(offloader).run(
+        core.combine, shares, threshold, timeout=timeout
+    )
+
+
+async def async_split_secret(
+    secret: int,
+    threshold: int,
+    shares_count: int,
+    prime: int = core.PRIME,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+):
+    """
+    Asynchronous core.split_secret.
+    """
+    return await _resolve(offloader).run(
+        core.split_secret, secret, threshold, shares_count, prime, timeout=timeout
+    )
+
+
+async def async_reconstruct_secret(
+    shares,
+    prime: int = core.PRIME,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+) -> int:
+    """
+    Asynchronous core.reconstruct_secret.
+    """
+    return await _resolve(offloader).run(
+        core.reconstruct_secret, shares, prime, timeout=timeout
+    )
+
+
+async def async_reconstruct_many(
+    x_values: Sequence[int],
+    y_matrix: Sequence[Sequence[int]],
+    prime: int = core.PRIME,
+    batch_size: int = 4096,
+    offloader: Optional[Offloader] = None,
+    timeout: Optional[float] = None,
+) -> List[int]:
+    """
+    Asynchronous core.reconstruct_many, submitted in slices of
+    batch_size secrets so that other work interleaves and
+    cancellation takes effect between slices.
+
+    timeout bounds the whole batch rather than each slice; without it
+    the offloader's per-call timeout applies to every slice.
+    """
+    offloader = _resolve(offloader)
+    columns = [list(column) for column in y_matrix]
+    total = len(columns[0]) if columns else 0
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+
+    secrets = []
+    for start in range(0, max(total, 1), batch_size):
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+
+        piece = [column[start : start + batch_size] for column in columns]
+        secrets += await offloader.run(
+            core.reconstruct_many, x_values, piece, prime, timeout=remaining
+        )
+    return secrets
@@ -0,0 +1,120 @@
+"""
+Interchangeable arithmetic backends.
+
+Two kinds of arithmetic are pluggable:
+
+- prime fields: "pure" (Python ints) or "gmpy2" (GMP mpz);
+- GF(256) bulk operations: "stdlib" (bytes.translate and big-integer
+  XOR, no third-party packages), "numpy" or "pure" (a byte-at-a-time
+  reference).
+
+At import time the first installed backend of each kind, in the order
+listed in PRIME_BACKENDS and GF256_BACKENDS, is selected. The
+SHAMIR_BACKEND environment variable overrides the choice with a
+comma-separated list of names, e.g. "pure" or "gmpy2,numpy"; "pure"
+applies to both kinds and a kind left unnamed is selected
+automatically. Naming a backend that is not installed raises
+BackendError instead of silently falling back.
+"""
+
+import importlib
+import os
+from typing import Dict, List, Optional, Sequence
+
+from ..errors import BackendError
+
+
+# Preference order: fastest first, pure Python always last.
+PRIME_BACKENDS = {
+    "gmpy2": "shamir.backends.gmpy2_backend",
+    "pure": "shamir.backends.pure",
+}
+
+# stdlib measures faster than NumPy table indexing for both split and
+# combine at every payload size in benchmarks/, so it comes first.
+GF256_BACKENDS = {
+    "stdlib": "shamir.backends.stdlib",
+    "numpy": "shamir.backends.numpy_backend",
+    "pure": "shamir.backends.pure",
+}
+
+_KINDS = {
+    "prime": (PRIME_BACKENDS, "PRIME_BACKEND"),
+    "gf256": (GF256_BACKENDS, "GF256_BACKEND"),
+}
+
+_selected: Dict[str, object] = {}
+
+
+def _load(kind: str, name: str):
+    registry, attribute = _KINDS[kind]
+    try:
+        module = importlib.import_module(registry[name])
+    except ImportError:
+        return None
+    return getattr(module, attribute)
+
+
+def available() -> Dict[str, List[str]]:
+    """
+    Return the names of the installed backends of each kind.
+    """
+    return {
+        kind: [name for name in registry if _load(kind, name) is not None]
+        for kind, (registry, _) in _KINDS.items()
+    }
+
+
+def _choose(kind: str, requested: Optional[str]):
+    registry, _ = _KINDS[kind]
+    if requested is not None:
+        backend = _load(kind, requested)
+        if backend is None:
+            raise BackendError(f"Backend {requested!r} is not installed")
+        return backend
+
+    for name in registry:
+        backend = _load(kind, name)
+        if backend is not None:
+            return backend
+    raise BackendError(f"No {kind} backend available")
+
+
+def use(names: Sequence[str] = ()) -> None:
+    """
+    Select backends by name; kinds not named are selected automatically.
+
+    Raises BackendError for unknown or uninstalled backends.
+    """
+    requested = {}
+    for name in names:
+        kinds = [kind for kind, (registry, _) in _KINDS.items() if name in registry]
+        if not kinds:
+            raise BackendError(f"Unknown backend {name!r}")
+        for kind in kinds:
+            requested[kind] = name
+
+    selected = {kind: _choose(kind, requested.get(kind)) for kind in _KINDS}
+    _selected.clear()
+    _selected.update(selected)
+
+
+def prime_backend():
+    """
+    Return the active prime-field backend.
+    """
+    return _selected["prime"]
+
+
+def gf256_backend():
+    """
+    Return the active GF(256) backend.
+    """
+    return _selected["gf256"]
+
+
+use([
+    name.strip()
+    for name in os.environ.get("SHAMIR_BACKEND", "").split(",")
+    if name.strip()
+])
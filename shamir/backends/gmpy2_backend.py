@@ -0,0 +1,26 @@
+"""
+Prime-field backend on GMP integers via gmpy2.
+
+Values are converted to mpz on entry so every multiplication and
+reduction in the core runs in GMP; results are converted back to int
+before they leave the library.
+"""
+
+import gmpy2
+
+
+class Gmpy2PrimeBackend:
+    """
+    Prime-field arithmetic on gmpy2.mpz.
+    """
+
+    name = "gmpy2"
+
+    def element(self, value: int):
+        return gmpy2.mpz(value)
+
+    def invert(self, value, prime: int):
+        return gmpy2.invert(value, prime)
+
+
+PRIME_BACKEND = Gmpy2PrimeBackend()
@@ -0,0 +1,121 @@
+"""
+GF(256) backend on NumPy arrays.
+
+A payload is treated as a uint8 array and every product is resolved
+through a single 256x256 multiplication table, so evaluating a
+polynomial over all secret bytes and all share indices costs one table
+lookup per coefficient rather than one Python-level step per byte.
+"""
+
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .. import gf256
+
+
+def _build_mul_table() -> np.ndarray:
+    exp = np.frombuffer(gf256.EXP, dtype=np.uint8)
+    log = np.frombuffer(gf256.LOG, dtype=np.uint8).astype(np.intp)
+
+    table = exp[log[:, None] + log[None, :]]
+    table[0, :] = 0
+    table[:, 0] = 0
+    table.setflags(write=False)
+    return table
+
+
+# MUL_TABLE[a, b] == gf256.mul(a, b). 64 KiB, shared by all operations.
+MUL_TABLE = _build_mul_table()
+
+
+@lru_cache(maxsize=256)
+def _weights(xs: Tuple[int, ...], target: int) -> np.ndarray:
+    weights = np.array(gf256.lagrange_weights_at(xs, target), dtype=np.uint8)
+    weights.setflags(write=False)
+    return weights
+
+
+def evaluate(coefficients: np.ndarray, xs: Sequence[int]) -> np.ndarray:
+    """
+    Evaluate byte-wise polynomials at several points.
+
+    coefficients has shape (k, L): row j holds the j-th coefficient of
+    each of the L independent polynomials. Returns an array of shape
+    (len(xs), L) whose row i holds the evaluations at xs[i].
+
+    Uses Horner's rule, so the cost is k - 1 vectorized table lookups
+    over an (n, L) array.
+    """
+    points = np.asarray(xs, dtype=np.uint8)[:, None]
+    result = np.repeat(coefficients[-1][None, :], len(points), axis=0)
+
+    for row in coefficients[-2::-1]:
+        result = MUL_TABLE[points, result]
+        result ^= row
+
+    return result
+
+
+def interpolate_at(xs: Sequence[int], ys: np.ndarray, target: int) -> np.ndarray:
+    """
+    Evaluate byte-wise polynomials through (xs, ys) at x = target.
+
+    ys has shape (len(xs), L). Returns an array of shape (L,).
+    """
+    weights = _weights(tuple(xs), target)
+    scaled = MUL_TABLE[weights[:, None], ys]
+    return np.bitwise_xor.reduce(scaled, axis=0)
+
+
+def interpolate_at_zero(xs: Sequence[int], ys: np.ndarray) -> np.ndarray:
+    """
+    Recover the constant terms of byte-wise polynomials.
+    """
+    return interpolate_at(xs, ys, 0)
+
+
+def split_bytes(
+    secret: bytes,
+    threshold: int,
+    xs: Sequence[int],
+    source,
+) -> np.ndarray:
+    """
+    Split a byte string into shares evaluated at xs.
+
+    source is a randomness source (see shamir.randomness); its
+    readinto() fills the (threshold - 1) non-constant coefficient rows
+    of every secret byte in place. Returns an array of shape
+    (len(xs), len(secret)).
+    """
+    length = len(secret)
+
+    coefficients = np.empty((threshold, length), dtype=np.uint8)
+    coefficients[0] = np.frombuffer(secret, dtype=np.uint8)
+    source.readinto(coefficients[1:].reshape(-1))
+
+    return evaluate(coefficients, xs)
+
+
+class NumpyGF256Backend:
+    """
+    GF(256) split and interpolation on NumPy arrays.
+    """
+
+    name = "numpy"
+
+    def split(self, secret: bytes, threshold: int, xs: Sequence[int], source) -> List[bytes]:
+        return [
+            row.tobytes() for row in split_bytes(secret, threshold, xs, source)
+        ]
+
+    def interpolate(self, xs: Sequence[int], payloads: Sequence, target: int = 0) -> bytes:
+        ys = np.stack([
+            np.frombuffer(payload, dtype=np.uint8) for payload in payloads
+        ])
+        return interpolate_at(xs, ys, target).tobytes()
+
+
+GF256_BACKEND = NumpyGF256Backend()
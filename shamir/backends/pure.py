@@ -0,0 +1,74 @@
+"""
+Pure-Python reference backends.
+
+These are always available and define the expected results for the
+accelerated backends. The GF(256) backend processes one byte per
+interpreter step and is intended as a reference and last-resort
+fallback.
+"""
+
+from typing import List, Sequence
+
+from .. import gf256
+
+
+class PurePrimeBackend:
+    """
+    Prime-field arithmetic on Python ints.
+    """
+
+    name = "pure"
+
+    def element(self, value: int) -> int:
+        return value
+
+    def invert(self, value: int, prime: int) -> int:
+        return pow(value, -1, prime)
+
+
+class PureGF256Backend:
+    """
+    Byte-at-a-time GF(256) split and interpolation.
+    """
+
+    name = "pure"
+
+    def split(self, secret: bytes, threshold: int, xs: Sequence[int], source) -> List[bytes]:
+        """
+        Evaluate random polynomials with constant terms secret at xs.
+
+        Coefficient rows are drawn from source in the same layout as
+        the other backends, so seeded splits agree across backends.
+        """
+        length = len(secret)
+        randomness = bytearray((threshold - 1) * length)
+        source.readinto(randomness)
+
+        rows = [bytes(secret)] + [
+            randomness[j * length : (j + 1) * length] for j in range(threshold - 1)
+        ]
+
+        shares = []
+        for x in xs:
+            result = bytearray(rows[-1])
+            for row in rows[-2::-1]:
+                for i, coefficient in enumerate(row):
+                    result[i] = gf256.mul(result[i], x) ^ coefficient
+            shares.append(bytes(result))
+        return shares
+
+    def interpolate(self, xs: Sequence[int], payloads: Sequence, target: int = 0) -> bytes:
+        """
+        Evaluate the polynomials through (xs, payloads) at target.
+        """
+        weights = gf256.lagrange_weights_at(tuple(xs), target)
+
+        result = bytearray(len(payloads[0]))
+        for weight, payload in zip(weights, payloads):
+            for i, value in enumerate(bytes(payload)):
+                result[i] ^= gf256.mul(weight, value)
+        return bytes(result)
+
+
+PRIME_BACKEND = PurePrimeBackend()
+GF256_BACKEND = PureGF256Backend()
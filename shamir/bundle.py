@@ -0,0 +1,312 @@
+"""
+Multi-share bundle container (format version 0x02).
+
+A bundle carries many share payloads in a single blob: independent
+shares of different secrets, consecutive chunks of one large share,
+or both. A table of contents with fixed-size entries gives O(1)
+access to any payload, and every payload carries its own CRC32 so
+entries are verified independently.
+
+A single large share may also be stored as a bundle of consecutive
+chunks (see encode_chunked_share). Chunk CRCs and the optional Merkle
+HMAC root are then verified concurrently, and corruption is reported
+per chunk instead of for the share as a whole.
+
+Single shares keep using the version 0x01 format in shamir.format,
+which is unaffected by this module.
+"""
+
+import struct
+import zlib
+import hmac
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .errors import ShareFormatError
+from .format import MAGIC, ShareHeader
+from .integrity import (
+    IntegrityError,
+    merkle_hmac_root,
+    verify_chunk_crc32s,
+    verify_crc32,
+    verify_hmac_sha256,
+    verify_merkle_hmac_root,
+)
+
+
+BUNDLE_VERSION = 0x02
+
+FLAG_HMAC = 0x01
+FLAG_MERKLE = 0x02
+
+_BUNDLE_HEADER_STRUCT = struct.Struct(">4sBBHI")
+# magic, version, flags, reserved, entry_count
+
+_ENTRY_STRUCT = struct.Struct(">BBBBIQII")
+# k, n, i, field_id, sequence, offset, length, crc32
+
+_CRC_STRUCT = struct.Struct(">I")
+
+_MAC_SIZE = hashlib.sha256().digest_size
+
+
+@dataclass(frozen=True)
+class BundleEntry:
+    """
+    Table-of-contents entry describing one payload in a bundle.
+
+    sequence identifies the payload within the bundle: a secret
+    identifier for independent shares, or a chunk number for
+    consecutive pieces of one share.
+    """
+
+    header: ShareHeader
+    sequence: int
+    offset: int
+    length: int
+    crc: int
+
+
+def encode_bundle(
+    entries: Iterable[Tuple[ShareHeader, int, bytes]],
+    mac_key: Optional[bytes] = None,
+    merkle: bool = False,
+) -> bytes:
+    """
+    Encode (header, sequence, payload) triples into a bundle.
+
+    Layout: bundle header, table of contents, CRC32 over both, payload
+    data, and an optional HMAC-SHA256 over everything preceding it.
+
+    With merkle enabled, the trailer is instead a Merkle HMAC root whose
+    leaves are the header/TOC region and each payload, so it can be
+    verified concurrently.
+    """
+    entries = list(entries)
+    if not entries:
+        raise ShareFormatError("Bundle must contain at least one entry")
+
+    data_start = (
+        _BUNDLE_HEADER_STRUCT.size
+        + len(entries) * _ENTRY_STRUCT.size
+        + _CRC_STRUCT.size
+    )
+
+    toc = bytearray()
+    offset = data_start
+    for header, sequence, payload in entries:
+        header.validate()
+        if not payload:
+            raise ShareFormatError("Empty payload")
+
+        toc += _ENTRY_STRUCT.pack(
+            header.threshold,
+            header.share_count,
+            header.share_index,
+            header.field_id,
+            sequence,
+            offset,
+            len(payload),
+            zlib.crc32(payload) & 0xFFFFFFFF,
+        )
+        offset += len(payload)
+
+    flags = 0
+    if mac_key is not None:
+        flags = FLAG_HMAC | (FLAG_MERKLE if merkle else 0)
+
+    head = (
+        _BUNDLE_HEADER_STRUCT.pack(MAGIC, BUNDLE_VERSION, flags, 0, len(entries))
+        + toc
+    )
+
+    encoded = bytearray(head)
+    encoded += _CRC_STRUCT.pack(zlib.crc32(head) & 0xFFFFFFFF)
+    for _, _, payload in entries:
+        encoded += payload
+
+    if flags & FLAG_MERKLE:
+        encoded += merkle_hmac_root(
+            [encoded[:data_start]] + [payload for _, _, payload in entries],
+            mac_key,
+        )
+    elif mac_key is not None:
+        encoded += hmac.new(mac_key, encoded, hashlib.sha256).digest()
+
+    return bytes(encoded)
+
+
+class BundleReader:
+    """
+    Random-access decoder for a bundle held in a buffer.
+
+    The buffer may be any buffer-protocol object, typically an mmap.
+    The bundle header and table of contents are validated on
+    construction, together with the bundle HMAC when a key is given.
+    Payloads are returned as memoryviews and verified against their
+    own CRC32 on access.
+
+    workers bounds the threads used for Merkle root and bulk CRC
+    verification; None uses one per CPU.
+    """
+
+    def __init__(
+        self,
+        data,
+        mac_key: Optional[bytes] = None,
+        workers: Optional[int] = None,
+    ):
+        view = memoryview(data)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        self._view = view
+
+        if len(view) < _BUNDLE_HEADER_STRUCT.size + _CRC_STRUCT.size:
+            raise ShareFormatError("Data too short")
+
+        magic, version, flags, _, count = _BUNDLE_HEADER_STRUCT.unpack_from(view)
+        if magic != MAGIC:
+            raise ShareFormatError("Invalid magic value")
+        if version != BUNDLE_VERSION:
+            raise ShareFormatError("Unsupported format version")
+        if not count:
+            raise ShareFormatError("Bundle must contain at least one entry")
+
+        toc_end = _BUNDLE_HEADER_STRUCT.size + count * _ENTRY_STRUCT.size
+        self._data_start = toc_end + _CRC_STRUCT.size
+
+        self._data_end = len(view)
+        if flags & FLAG_HMAC:
+            self._data_end -= _MAC_SIZE
+        if self._data_end < self._data_start:
+            raise ShareFormatError("Data too short")
+
+        expected_crc = _CRC_STRUCT.unpack_from(view, toc_end)[0]
+        verify_crc32(view[:toc_end], expected_crc)
+
+        self._count = count
+        self._workers = workers
+
+        if mac_key is not None:
+            if not flags & FLAG_HMAC:
+                raise IntegrityError("Bundle carries no HMAC")
+
+            expected_mac = bytes(view[self._data_end :])
+            if flags & FLAG_MERKLE:
+                leaves = [view[: self._data_start]] + [
+                    view[entry.offset : entry.offset + entry.length]
+                    for entry in map(self.entry, range(count))
+                ]
+                verify_merkle_hmac_root(leaves, mac_key, expected_mac, workers)
+            else:
+                verify_hmac_sha256(view[: self._data_end], mac_key, expected_mac)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def entry(self, index: int) -> BundleEntry:
+        """
+        Return the table-of-contents entry at position index.
+        """
+        if not 0 <= index < self._count:
+            raise IndexError("Bundle entry index out of range")
+
+        k, n, i, field_id, sequence, offset, length, crc = (
+            _ENTRY_STRUCT.unpack_from(
+                self._view,
+                _BUNDLE_HEADER_STRUCT.size + index * _ENTRY_STRUCT.size,
+            )
+        )
+
+        header = ShareHeader(
+            threshold=k,
+            share_count=n,
+            share_index=i,
+            field_id=field_id,
+        )
+        header.validate()
+
+        if offset < self._data_start or offset + length > self._data_end:
+            raise ShareFormatError("Entry outside bundle data")
+        if not length:
+            raise ShareFormatError("Empty payload")
+
+        return BundleEntry(header, sequence, offset, length, crc)
+
+    def payload(self, index: int) -> Tuple[BundleEntry, memoryview]:
+        """
+        Return the entry at index and its CRC-verified payload view.
+        """
+        entry = self.entry(index)
+        payload = self._view[entry.offset : entry.offset + entry.length]
+        verify_crc32(payload, entry.crc)
+        return entry, payload
+
+    def __iter__(self) -> Iterator[Tuple[BundleEntry, memoryview]]:
+        for index in range(self._count):
+            yield self.payload(index)
+
+    def verify(self) -> None:
+        """
+        Verify every payload CRC concurrently.
+
+        Raises ChunkIntegrityError listing every corrupted entry.
+        """
+        entries = [self.entry(index) for index in range(self._count)]
+        verify_chunk_crc32s(
+            [self._view[e.offset : e.offset + e.length] for e in entries],
+            [e.crc for e in entries],
+            self._workers,
+        )
+
+
+def encode_chunked_share(
+    header: ShareHeader,
+    payload: bytes,
+    chunk_size: int,
+    mac_key: Optional[bytes] = None,
+) -> bytes:
+    """
+    Encode one share as a bundle of consecutive payload chunks.
+
+    Each chunk gets its own CRC32; with a MAC key the bundle is
+    authenticated by a Merkle HMAC root.
+    """
+    if chunk_size <= 0:
+        raise ShareFormatError("Chunk size must be positive")
+
+    view = memoryview(payload).cast("B")
+    entries = [
+        (header, sequence, view[offset : offset + chunk_size])
+        for sequence, offset in enumerate(range(0, len(view), chunk_size))
+    ]
+    return encode_bundle(entries, mac_key=mac_key, merkle=True)
+
+
+def decode_chunked_share(
+    data,
+    mac_key: Optional[bytes] = None,
+    workers: Optional[int] = None,
+) -> Tuple[ShareHeader, memoryview]:
+    """
+    Decode a share written by encode_chunked_share.
+
+    All chunk CRCs (and the Merkle root, given a key) are verified
+    concurrently. Returns the header and the payload as a single
+    memoryview into data.
+    """
+    reader = BundleReader(data, mac_key=mac_key, workers=workers)
+    reader.verify()
+
+    first = reader.entry(0)
+    expected_offset = first.offset
+    for sequence in range(len(reader)):
+        entry = reader.entry(sequence)
+        if entry.header != first.header or entry.sequence != sequence:
+            raise ShareFormatError("Bundle is not a chunked share")
+        if entry.offset != expected_offset:
+            raise ShareFormatError("Chunks are not contiguous")
+        expected_offset += entry.length
+
+    return first.header, reader._view[first.offset : expected_offset]
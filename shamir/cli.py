@@ -0,0 +1,293 @@
+"""
+Command-line interface for Shamir Secret Sharing.
+
+This CLI is intentionally minimal and deterministic.
+It provides explicit split and combine operations without
+implicit assumptions or hidden state.
+"""
+
+import argparse
+import mmap
+import os
+import sys
+import tempfile
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+
+from .core import (
+    combine_chunks,
+    extend_chunks,
+    refresh_chunks,
+    split_chunks,
+)
+from .format import (
+    FIELD_GF256,
+    ShareHeader,
+    ShareReader,
+    ShareWriter,
+    grow_headers,
+)
+from .errors import ShamirError, ReconstructionError, RefreshError
+from .rotation import check_complete_split
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def open_input(path_str: str):
+    if path_str == "-":
+        return sys.stdin.buffer
+    return open(path_str, "rb")
+
+
+def cmd_split(args: argparse.Namespace) -> None:
+    headers = [
+        ShareHeader(
+            threshold=args.threshold,
+            share_count=args.count,
+            share_index=index,
+        )
+        for index in range(1, args.count + 1)
+    ]
+
+    with ExitStack() as stack:
+        source = open_input(args.input)
+        if source is not sys.stdin.buffer:
+            stack.enter_context(source)
+
+        chunks = split_chunks(
+            iter(partial(source.read, args.chunk_size * args.jobs), b""),
+            threshold=args.threshold,
+            shares=args.count,
+            jobs=args.jobs,
+        )
+        write_shares(args.output, headers, chunks, ())
+
+
+def map_file(path: Path):
+    # The mapping keeps its own descriptor; it is unmapped once the last
+    # view into it is released.
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def select_readers(paths) -> list:
+    readers = [ShareReader(map_file(Path(path_str))) for path_str in paths]
+
+    first = readers[0].header
+    if first.field_id != FIELD_GF256:
+        raise ReconstructionError("Only GF(256) shares can be combined here")
+
+    for reader in readers[1:]:
+        header = reader.header
+        if (header.threshold, header.field_id) != (first.threshold, first.field_id):
+            raise ReconstructionError("Shares belong to different splits")
+        if reader.payload_size != readers[0].payload_size:
+            raise ReconstructionError("Share payloads differ in length")
+
+    if len(readers) < first.threshold:
+        raise ReconstructionError("Not enough shares for reconstruction")
+
+    return readers[: first.threshold]
+
+
+def cmd_combine(args: argparse.Namespace) -> None:
+    readers = select_readers(args.inputs)
+    indices = [reader.header.share_index for reader in readers]
+    # With several jobs each worker processes one chunk-sized slice.
+    block_size = args.chunk_size * args.jobs
+
+    if args.output == "-":
+        # Output cannot be withdrawn once written to stdout, so integrity
+        # is established before streaming.
+        for reader in readers:
+            reader.verify(block_size)
+        streams = [
+            reader.chunks(block_size, verify=False) for reader in readers
+        ]
+        for chunk in combine_chunks(indices, streams, jobs=args.jobs):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return
+
+    # Integrity is checked while streaming; the output only replaces
+    # its destination once every share has verified.
+    out_path = Path(args.output)
+    streams = [reader.chunks(block_size) for reader in readers]
+
+    with tempfile.NamedTemporaryFile(
+        dir=out_path.parent, prefix=f".{out_path.name}.", delete=False
+    ) as tmp:
+        try:
+            for chunk in combine_chunks(indices, streams, jobs=args.jobs):
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+
+    os.replace(tmp.name, out_path)
+
+
+def write_shares(prefix: str, headers, chunks, inputs) -> None:
+    # Writes one share per header to <prefix>.<index> from a stream of
+    # per-step (index, chunk) lists. Input integrity is checked while
+    # streaming; partial outputs are removed if anything fails.
+    out_paths = [Path(f"{prefix}.{header.share_index}") for header in headers]
+
+    # The inputs are memory-mapped; truncating one would fault the read.
+    if set(map(Path.resolve, out_paths)) & set(
+        Path(path_str).resolve() for path_str in inputs
+    ):
+        raise ShamirError("Output shares must not overwrite their inputs")
+
+    created = []
+    with ExitStack() as stack:
+        try:
+            writers = []
+            for out_path, header in zip(out_paths, headers):
+                stream = stack.enter_context(open(out_path, "wb"))
+                created.append(out_path)
+                writers.append(ShareWriter(stream, header))
+
+            for shares in chunks:
+                for writer, (_, payload) in zip(writers, shares):
+                    writer.write(payload)
+
+            for writer in writers:
+                writer.close()
+        except BaseException:
+            stack.close()
+            # Only remove what this run wrote; files it never reached
+            # are left as they were.
+            for out_path in created:
+                out_path.unlink(missing_ok=True)
+            raise
+
+
+def cmd_refresh(args: argparse.Namespace) -> None:
+    readers = [ShareReader(map_file(Path(path_str))) for path_str in args.inputs]
+    headers = [reader.header for reader in readers]
+
+    first = check_complete_split(headers)
+    if first.field_id != FIELD_GF256:
+        raise RefreshError("Only GF(256) shares can be refreshed here")
+    if len(set(reader.payload_size for reader in readers)) != 1:
+        raise RefreshError("Share payloads differ in length")
+
+    indices = [header.share_index for header in headers]
+    streams = [reader.chunks(args.chunk_size) for reader in readers]
+    write_shares(
+        args.output,
+        headers,
+        refresh_chunks(indices, streams, first.threshold),
+        args.inputs,
+    )
+
+
+def cmd_extend(args: argparse.Namespace) -> None:
+    readers = [ShareReader(map_file(Path(path_str))) for path_str in args.inputs]
+    headers = grow_headers([reader.header for reader in readers], args.count)
+    first = headers[0]
+
+    if first.field_id != FIELD_GF256:
+        raise ReconstructionError("Only GF(256) shares can be extended here")
+    if len(readers) < first.threshold:
+        raise ReconstructionError("Not enough shares to extend")
+
+    readers = readers[: first.threshold]
+    if len(set(reader.payload_size for reader in readers)) != 1:
+        raise ReconstructionError("Share payloads differ in length")
+
+    indices = [reader.header.share_index for reader in readers]
+    streams = [reader.chunks(args.chunk_size) for reader in readers]
+    write_shares(
+        args.output,
+        headers,
+        extend_chunks(
+            indices,
+            streams,
+            first.threshold,
+            [header.share_index for header in headers],
+        ),
+        args.inputs,
+    )
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    # Imported here so split/combine do not pay for asyncio start-up.
+    from .daemon import serve
+
+    serve(args.socket)
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="shamir", description="Shamir Secret Sharing CLI"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    split_parser = subparsers.add_parser("split", help="Split a secret")
+    split_parser.add_argument("-i", "--input", default="-")
+    split_parser.add_argument("-o", "--output", required=True)
+    split_parser.add_argument("-k", "--threshold", type=int, required=True)
+    split_parser.add_argument("-n", "--count", type=int, required=True)
+    split_parser.add_argument(
+        "--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE
+    )
+    split_parser.add_argument("-j", "--jobs", type=positive_int, default=1)
+    split_parser.set_defaults(func=cmd_split)
+
+    combine_parser = subparsers.add_parser("combine", help="Reconstruct a secret")
+    combine_parser.add_argument("-i", "--inputs", nargs="+", required=True)
+    combine_parser.add_argument("-o", "--output", default="-")
+    combine_parser.add_argument(
+        "--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE
+    )
+    combine_parser.add_argument("-j", "--jobs", type=positive_int, default=1)
+    combine_parser.set_defaults(func=cmd_combine)
+
+    refresh_parser = subparsers.add_parser(
+        "refresh", help="Re-randomize every share of a split"
+    )
+    refresh_parser.add_argument("-i", "--inputs", nargs="+", required=True)
+    refresh_parser.add_argument("-o", "--output", required=True)
+    refresh_parser.add_argument(
+        "--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE
+    )
+    refresh_parser.set_defaults(func=cmd_refresh)
+
+    extend_parser = subparsers.add_parser(
+        "extend", help="Issue new shares from threshold existing shares"
+    )
+    extend_parser.add_argument("-i", "--inputs", nargs="+", required=True)
+    extend_parser.add_argument("-o", "--output", required=True)
+    extend_parser.add_argument("-c", "--count", type=positive_int, default=1)
+    extend_parser.add_argument(
+        "--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE
+    )
+    extend_parser.set_defaults(func=cmd_extend)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve split/combine/verify on a Unix socket"
+    )
+    serve_parser.add_argument("-s", "--socket", required=True)
+    serve_parser.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args()
+
+    try:
+        args.func(args)
+    except ShamirError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        sys.exit(1)
@@ -1,5 +1,12 @@
-import random
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import zip_longest
+from operator import add, mul
 
+from . import backends, fields, gf256, robust
+from .backends.stdlib import MUL_TRANSLATE
+from .errors import DuplicateShareError
+from .randomness import SystemRandomSource, field_elements, source_for
 from .exceptions import (
     InvalidThresholdError,
     InvalidShareCountError,
@@ -7,17 +14,37 @@ from .exceptions import (
     ReconstructionError,
 )
 
-PRIME = 208351617316091241234326746312124448251235562226470491514186331217050270460481
+PRIME = fields.PRIME257.prime
 
 
-def _eval_polynomial(coefficients, x, prime):
+@lru_cache(maxsize=64)
+def _prime_field(prime, field_id):
+    # An explicit field_id wins; otherwise use the registered field for
+    # prime so Mersenne primes get their reduction.
+    if field_id is None:
+        return fields.field_for_prime(prime)
+    return fields.prime_field(field_id)
+
+
+def _eval_polynomial(coefficients, x, field):
+    # Horner's rule: x is a small share index, so each step multiplies
+    # by a word-sized integer and a single reduction suffices.
     result = 0
-    for power, coefficient in enumerate(coefficients):
-        result = (result + coefficient * pow(x, power, prime)) % prime
-    return result
+    for coefficient in reversed(coefficients):
+        result = result * x + coefficient
+    return field.reduce(result)
+
+
+@lru_cache(maxsize=64)
+def _power_matrix(threshold, shares_count, prime):
+    # Row x - 1 holds (1, x, x^2, ..., x^(k-1)) mod prime.
+    return tuple(
+        tuple(pow(x, power, prime) for power in range(threshold))
+        for x in range(1, shares_count + 1)
+    )
 
 
-def split_secret(secret, threshold, shares_count, prime=PRIME):
+def _validate_split(secret, threshold, shares_count, prime):
     if threshold < 2:
         raise InvalidThresholdError(
             "Threshold must be at least 2"
@@ -33,38 +60,110 @@ def split_secret(secret, threshold, shares_count, prime=PRIME):
             "Secret must be within finite field range"
         )
 
-    coefficients = [secret] + [
-        random.randrange(0, prime) for _ in range(threshold - 1)
-    ]
+
+def split_secret(
+    secret, threshold, shares_count, prime=PRIME, rng=None, field_id=None
+):
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    _validate_split(secret, threshold, shares_count, prime)
+
+    source = rng or SystemRandomSource()
+    coefficients = list(map(
+        backends.prime_backend().element,
+        [secret] + field_elements(source, threshold - 1, prime),
+    ))
 
     shares = []
     for x in range(1, shares_count + 1):
-        y = _eval_polynomial(coefficients, x, prime)
+        y = int(_eval_polynomial(coefficients, x, field))
         shares.append((x, y))
 
     return shares
 
 
-def _lagrange_interpolate(x, x_values, y_values, prime):
-    total = 0
-    k = len(x_values)
+def split_many(
+    secrets, threshold, shares_count, prime=PRIME, rng=None, field_id=None
+):
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    secrets = list(secrets)
+    for secret in secrets:
+        _validate_split(secret, threshold, shares_count, prime)
+
+    matrix = _power_matrix(threshold, shares_count, prime)
+
+    # One bulk draw covers every coefficient of the batch.
+    source = rng or SystemRandomSource()
+    element = backends.prime_backend().element
+    secrets = list(map(element, secrets))
+    randomness = list(map(
+        element, field_elements(source, len(secrets) * (threshold - 1), prime)
+    ))
+    polynomials = [
+        [secret] + randomness[i * (threshold - 1) : (i + 1) * (threshold - 1)]
+        for i, secret in enumerate(secrets)
+    ]
+
+    # Column-oriented result: index x maps to the y values of every
+    # secret, in input order.
+    return {
+        x: [int(field.reduce(sum(map(mul, row, coefficients))))
+            for coefficients in polynomials]
+        for x, row in enumerate(matrix, start=1)
+    }
+
+
+def _batch_inverse(values, prime, backend):
+    # Montgomery's trick: invert every value with a single pow() call.
+    prefix = []
+    running = 1
+    for value in values:
+        prefix.append(running)
+        running = running * value % prime
+
+    if running == 0:
+        raise ValueError("Cannot invert zero")
 
-    for i in range(k):
-        xi, yi = x_values[i], y_values[i]
-        term = yi
+    inverse = backend.invert(running, prime)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = inverse * prefix[i] % prime
+        inverse = inverse * values[i] % prime
 
-        for j in range(k):
+    return result
+
+
+@lru_cache(maxsize=256)
+def _cached_weights(x_values, prime, target, backend):
+    numerators = []
+    denominators = []
+
+    for i, xi in enumerate(x_values):
+        numerator = 1
+        denominator = 1
+        for j, xj in enumerate(x_values):
             if i != j:
-                xj = x_values[j]
-                term *= (x - xj) * pow(xi - xj, -1, prime)
-                term %= prime
+                numerator = numerator * (target - xj) % prime
+                denominator = denominator * (xi - xj) % prime
+        numerators.append(numerator)
+        denominators.append(denominator)
+
+    numerators = list(map(backend.element, numerators))
+    inverses = _batch_inverse(list(map(backend.element, denominators)), prime, backend)
+    return tuple(n * d % prime for n, d in zip(numerators, inverses))
 
-        total += term
 
-    return total % prime
+def _lagrange_weights(x_values, prime, target=0):
+    # Basis weights at x = target, as elements of the active prime
+    # backend; they depend only on the coordinates and are cached.
+    return _cached_weights(x_values, prime, target, backends.prime_backend())
 
 
-def reconstruct_secret(shares, prime=PRIME):
+def reconstruct_secret(shares, prime=PRIME, field_id=None):
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+
     if len(shares) < 2:
         raise ReconstructionError(
             "At least two shares are required for reconstruction"
@@ -72,8 +171,860 @@ def reconstruct_secret(shares, prime=PRIME):
 
     try:
         x_values, y_values = zip(*shares)
-        return _lagrange_interpolate(0, x_values, y_values, prime)
+        weights = _lagrange_weights(x_values, prime)
+        return int(field.reduce(sum(map(mul, weights, y_values))))
     except Exception as exc:
         raise ReconstructionError(
             "Failed to reconstruct secret from provided shares"
         ) from exc
+
+
+def _validate_robust(x_values, threshold):
+    if threshold < 2:
+        raise InvalidThresholdError(
+            "Threshold must be at least 2"
+        )
+
+    if len(x_values) < threshold:
+        raise ReconstructionError(
+            "Not enough shares for reconstruction"
+        )
+
+    if len(set(x_values)) != len(x_values):
+        raise ReconstructionError(
+            "Duplicate share indices"
+        )
+
+
+def reconstruct_secret_robust(shares, threshold, prime=PRIME, field_id=None):
+    # Decodes the shares as a Reed-Solomon codeword. Returns the secret
+    # and the sorted indices of the shares found to be corrupted.
+    prime = _prime_field(prime, field_id).prime
+    x_values, y_values = zip(*shares) if shares else ((), ())
+    _validate_robust(x_values, threshold)
+
+    basis = x_values[:threshold]
+    try:
+        # Fast path: the extra shares all agree with the first k.
+        if all(
+            sum(map(mul, _lagrange_weights(basis, prime, x), y_values)) % prime
+            == y % prime
+            for x, y in zip(x_values[threshold:], y_values[threshold:])
+        ):
+            weights = _lagrange_weights(basis, prime)
+            return int(sum(map(mul, weights, y_values)) % prime), ()
+
+        coefficients, bad = robust.berlekamp_welch(
+            x_values,
+            [y % prime for y in y_values],
+            threshold,
+            robust.prime_ops(prime),
+        )
+    except Exception as exc:
+        raise ReconstructionError(
+            "Failed to reconstruct secret from provided shares"
+        ) from exc
+
+    return coefficients[0], tuple(sorted(x_values[i] for i in bad))
+
+
+def reconstruct_many(x_values, y_matrix, prime=PRIME, field_id=None):
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    x_values = tuple(x_values)
+    columns = list(y_matrix)
+
+    if len(x_values) < 2:
+        raise ReconstructionError(
+            "At least two shares are required for reconstruction"
+        )
+
+    if len(columns) != len(x_values):
+        raise ReconstructionError(
+            "Expected one y column per share index"
+        )
+
+    if len(set(len(column) for column in columns)) != 1:
+        raise ReconstructionError(
+            "All y columns must cover the same secrets"
+        )
+
+    try:
+        weights = _lagrange_weights(x_values, prime)
+    except Exception as exc:
+        raise ReconstructionError(
+            "Failed to reconstruct secrets from provided shares"
+        ) from exc
+
+    # Accumulate one weighted column at a time so each pass over the
+    # batch runs inside map() rather than a per-secret Python loop.
+    totals = list(map(weights[0].__mul__, columns[0]))
+    for weight, column in zip(weights[1:], columns[1:]):
+        totals = list(map(add, totals, map(weight.__mul__, column)))
+
+    return list(map(int, map(field.reduce, totals)))
+
+
+def _validate_refresh(x_values, threshold):
+    if threshold < 2:
+        raise InvalidThresholdError(
+            "Threshold must be at least 2"
+        )
+
+    if threshold > len(x_values):
+        raise InvalidShareCountError(
+            "Threshold cannot exceed number of shares"
+        )
+
+    if len(set(x_values)) != len(x_values):
+        raise ReconstructionError(
+            "Duplicate share indices"
+        )
+
+
+def refresh_shares(
+    shares, threshold, prime=PRIME, rng=None, field_id=None
+):
+    # Adds the evaluations of a random polynomial with zero constant
+    # term, so the shared secret is unchanged and never interpolated.
+    # Every share of the split must be refreshed in the same call.
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    shares = list(shares)
+    _validate_refresh(tuple(x for x, _ in shares), threshold)
+
+    source = rng or SystemRandomSource()
+    coefficients = [0] + list(map(
+        backends.prime_backend().element,
+        field_elements(source, threshold - 1, prime),
+    ))
+
+    return [
+        (x, int(field.reduce(y + _eval_polynomial(coefficients, x, field))))
+        for x, y in shares
+    ]
+
+
+def refresh_many(
+    x_values, y_matrix, threshold, prime=PRIME, rng=None, field_id=None
+):
+    # Column-oriented like reconstruct_many: y_matrix holds one column
+    # per share index, and each secret gets its own zero polynomial.
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    x_values = tuple(x_values)
+    columns = list(y_matrix)
+    _validate_refresh(x_values, threshold)
+
+    if len(columns) != len(x_values):
+        raise ReconstructionError(
+            "Expected one y column per share index"
+        )
+
+    count = len(columns[0]) if columns else 0
+    if any(len(column) != count for column in columns):
+        raise ReconstructionError(
+            "All y columns must cover the same secrets"
+        )
+
+    source = rng or SystemRandomSource()
+    randomness = list(map(
+        backends.prime_backend().element,
+        field_elements(source, count * (threshold - 1), prime),
+    ))
+    polynomials = [
+        randomness[i * (threshold - 1) : (i + 1) * (threshold - 1)]
+        for i in range(count)
+    ]
+
+    refreshed = []
+    for x, column in zip(x_values, columns):
+        powers = [pow(x, power, prime) for power in range(1, threshold)]
+        refreshed.append([
+            int(field.reduce(y + sum(map(mul, powers, coefficients))))
+            for y, coefficients in zip(column, polynomials)
+        ])
+    return refreshed
+
+
+def _validate_extension_count(x_values, threshold):
+    # Any other number of shares interpolates a different polynomial,
+    # so the new shares would not combine with the old ones.
+    if threshold < 2:
+        raise InvalidThresholdError(
+            "Threshold must be at least 2"
+        )
+
+    if len(x_values) != threshold:
+        raise InvalidShareCountError(
+            "Extension requires exactly threshold shares"
+        )
+
+
+def _validate_extension(x_values, threshold, new_indices, prime):
+    _validate_extension_count(x_values, threshold)
+
+    if len(set(x_values)) != len(x_values):
+        raise ReconstructionError(
+            "Duplicate share indices"
+        )
+
+    if any(not 0 < x < prime for x in new_indices):
+        raise ReconstructionError(
+            "New share index outside field range"
+        )
+
+    if len(set(new_indices)) != len(new_indices) or set(new_indices) & set(x_values):
+        raise ReconstructionError(
+            "New share indices must be distinct and unused"
+        )
+
+
+def extend_shares(shares, threshold, new_indices, prime=PRIME, field_id=None):
+    # Evaluates the sharing polynomial at each new index with cached
+    # Lagrange weights for that index; the secret at x = 0 is never
+    # formed. Exactly threshold shares must be given.
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    shares = list(shares)
+    new_indices = tuple(new_indices)
+
+    x_values = tuple(x for x, _ in shares)
+    y_values = [y for _, y in shares]
+    _validate_extension(x_values, threshold, new_indices, prime)
+
+    return [
+        (x, int(field.reduce(
+            sum(map(mul, _lagrange_weights(x_values, prime, x), y_values))
+        )))
+        for x in new_indices
+    ]
+
+
+def extend_many(
+    x_values, y_matrix, threshold, new_indices, prime=PRIME, field_id=None
+):
+    # Column-oriented like reconstruct_many, and returns new columns
+    # keyed by index like split_many. One set of weights per new index
+    # serves every secret of the batch.
+    field = _prime_field(prime, field_id)
+    prime = field.prime
+    x_values = tuple(x_values)
+    new_indices = tuple(new_indices)
+    columns = list(y_matrix)
+    _validate_extension(x_values, threshold, new_indices, prime)
+
+    if len(columns) != len(x_values):
+        raise ReconstructionError(
+            "Expected one y column per share index"
+        )
+
+    rows = list(zip(*columns))
+    if any(len(column) != len(rows) for column in columns):
+        raise ReconstructionError(
+            "All y columns must cover the same secrets"
+        )
+
+    extended = {}
+    for x in new_indices:
+        weights = _lagrange_weights(x_values, prime, x)
+        extended[x] = [
+            int(field.reduce(sum(map(mul, weights, row)))) for row in rows
+        ]
+    return extended
+
+
+def _validate_byte_split(threshold, shares):
+    if threshold < 2:
+        raise InvalidThresholdError(
+            "Threshold must be at least 2"
+        )
+
+    if threshold > shares:
+        raise InvalidShareCountError(
+            "Threshold cannot exceed number of shares"
+        )
+
+    if shares > 255:
+        raise InvalidShareCountError(
+            "GF(256) supports at most 255 shares"
+        )
+
+
+def _engine(jobs, seed=None):
+    # Seeded splits stay in-process so their output is reproducible.
+    if jobs is None or jobs <= 1 or seed is not None:
+        return nullcontext()
+
+    try:
+        from .parallel import pooled_engine
+    except ImportError:
+        # The process engine needs NumPy; run serially without it.
+        return nullcontext()
+    # Engines are cached per worker count, so only the first call pays
+    # process start-up.
+    return pooled_engine(jobs)
+
+
+# The engine returns views into its reusable shared buffers; results
+# leaving the core are materialized once so they outlive the next call.
+def _split_payloads(engine, secret, threshold, indices, source):
+    if engine is None:
+        return backends.gf256_backend().split(secret, threshold, indices, source)
+    return [bytes(row) for row in engine.split(secret, threshold, indices)]
+
+
+def _interpolate(engine, indices, payloads):
+    if engine is None:
+        return backends.gf256_backend().interpolate(indices, payloads)
+    return bytes(engine.interpolate(indices, payloads))
+
+
+def split(secret, threshold, shares, seed=None, jobs=None):
+    _validate_byte_split(threshold, shares)
+
+    if not secret:
+        raise InvalidSecretError(
+            "Secret must not be empty"
+        )
+
+    indices = range(1, shares + 1)
+    with _engine(jobs, seed) as engine:
+        payloads = _split_payloads(
+            engine, bytes(secret), threshold, indices, source_for(seed)
+        )
+
+    return list(zip(indices, payloads))
+
+
+def split_chunks(chunks, threshold, shares, seed=None, jobs=None):
+    # Each byte has its own polynomial, so splitting chunk by chunk is
+    # equivalent to splitting the concatenated secret.
+    _validate_byte_split(threshold, shares)
+
+    indices = range(1, shares + 1)
+    source = source_for(seed)
+
+    def generate():
+        empty = True
+        with _engine(jobs, seed) as engine:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                empty = False
+                payloads = _split_payloads(
+                    engine, bytes(chunk), threshold, indices, source
+                )
+                yield list(zip(indices, payloads))
+
+        if empty:
+            raise InvalidSecretError(
+                "Secret must not be empty"
+            )
+
+    return generate()
+
+
+def _validate_byte_indices(indices):
+    if any(not 1 <= index <= 255 for index in indices):
+        raise ReconstructionError(
+            "Share index outside GF(256) range"
+        )
+
+    if len(set(indices)) != len(indices):
+        raise ReconstructionError(
+            "Duplicate share indices"
+        )
+
+
+def combine(shares, threshold=None, jobs=None):
+    if hasattr(shares, "items"):
+        shares = shares.items()
+    shares = list(shares)
+
+    minimum = 2 if threshold is None else max(threshold, 2)
+    if len(shares) < minimum:
+        raise ReconstructionError(
+            "Not enough shares for reconstruction"
+        )
+
+    if threshold is not None:
+        shares = shares[:threshold]
+
+    indices = tuple(index for index, _ in shares)
+    _validate_byte_indices(indices)
+
+    if len(set(len(payload) for _, payload in shares)) != 1:
+        raise ReconstructionError(
+            "Share payloads differ in length"
+        )
+
+    try:
+        with _engine(jobs) as engine:
+            return _interpolate(
+                engine, indices, [payload for _, payload in shares]
+            )
+    except Exception as exc:
+        raise ReconstructionError(
+            "Failed to reconstruct secret from provided shares"
+        ) from exc
+
+
+def _xor_bytes(left, right):
+    length = len(left)
+    value = int.from_bytes(left, "big") ^ int.from_bytes(right, "big")
+    return value.to_bytes(length, "big")
+
+
+def _refresh_payloads(indices, payloads, threshold, source):
+    # Splitting a zero secret yields evaluations of zero-constant
+    # polynomials, which are added to every payload.
+    deltas = backends.gf256_backend().split(
+        bytes(len(payloads[0])), threshold, indices, source
+    )
+    return [
+        (index, _xor_bytes(payload, delta))
+        for index, payload, delta in zip(indices, payloads, deltas)
+    ]
+
+
+def _validate_byte_refresh(indices, threshold):
+    _validate_byte_split(threshold, len(indices))
+    _validate_byte_indices(indices)
+
+
+def refresh(shares, threshold, seed=None):
+    # Every share of the split must be refreshed in the same call;
+    # refreshed and stale shares do not combine.
+    if hasattr(shares, "items"):
+        shares = shares.items()
+    shares = list(shares)
+
+    indices = tuple(index for index, _ in shares)
+    _validate_byte_refresh(indices, threshold)
+
+    if len(set(len(payload) for _, payload in shares)) != 1:
+        raise ReconstructionError(
+            "Share payloads differ in length"
+        )
+
+    return _refresh_payloads(
+        indices, [payload for _, payload in shares], threshold, source_for(seed)
+    )
+
+
+def refresh_chunks(indices, chunk_streams, threshold, seed=None):
+    # Each byte has its own polynomial, so shares can be refreshed
+    # chunk by chunk; yields one list of (index, chunk) per step.
+    indices = tuple(indices)
+    chunk_streams = list(chunk_streams)
+
+    if len(chunk_streams) != len(indices):
+        raise ReconstructionError(
+            "Expected one chunk stream per share index"
+        )
+
+    _validate_byte_refresh(indices, threshold)
+    source = source_for(seed)
+
+    def generate():
+        for chunks in zip_longest(*chunk_streams):
+            if None in chunks or len(set(map(len, chunks))) != 1:
+                raise ReconstructionError(
+                    "Share payloads differ in length"
+                )
+
+            yield _refresh_payloads(indices, chunks, threshold, source)
+
+    return generate()
+
+
+def _validate_byte_extension(indices, threshold, new_indices):
+    _validate_extension_count(indices, threshold)
+
+    _validate_byte_indices(indices)
+    _validate_byte_indices(new_indices)
+
+    if set(indices) & set(new_indices):
+        raise ReconstructionError(
+            "New share indices must be distinct and unused"
+        )
+
+
+def extend(shares, threshold, new_indices):
+    # Interpolates the existing shares at each new index instead of at
+    # zero. As with extend_shares, exactly threshold shares are needed.
+    if hasattr(shares, "items"):
+        shares = shares.items()
+    shares = list(shares)
+    new_indices = tuple(new_indices)
+
+    indices = tuple(index for index, _ in shares)
+    _validate_byte_extension(indices, threshold, new_indices)
+
+    if len(set(len(payload) for _, payload in shares)) != 1:
+        raise ReconstructionError(
+            "Share payloads differ in length"
+        )
+
+    backend = backends.gf256_backend()
+    payloads = [payload for _, payload in shares]
+    return [
+        (index, backend.interpolate(indices, payloads, index))
+        for index in new_indices
+    ]
+
+
+def extend_chunks(indices, chunk_streams, threshold, new_indices):
+    # Streaming form of extend; yields one list of (index, chunk) for
+    # the new indices per step.
+    indices = tuple(indices)
+    new_indices = tuple(new_indices)
+    chunk_streams = list(chunk_streams)
+
+    if len(chunk_streams) != len(indices):
+        raise ReconstructionError(
+            "Expected one chunk stream per share index"
+        )
+
+    _validate_byte_extension(indices, threshold, new_indices)
+    backend = backends.gf256_backend()
+
+    def generate():
+        for chunks in zip_longest(*chunk_streams):
+            if None in chunks or len(set(map(len, chunks))) != 1:
+                raise ReconstructionError(
+                    "Share payloads differ in length"
+                )
+
+            yield [
+                (index, backend.interpolate(indices, chunks, index))
+                for index in new_indices
+            ]
+
+    return generate()
+
+
+# Maps every non-zero byte to 0xFF, turning a XOR difference into a
+# per-position mask.
+_NONZERO_MASK = bytes([0]) + bytes([0xFF]) * 255
+
+
+def _inconsistent_mask(indices, payloads, threshold, length):
+    # 0xFF at every byte position where the shares do not all lie on
+    # one polynomial of degree < threshold.
+    backend = backends.gf256_backend()
+    basis = indices[:threshold]
+    difference = 0
+    for index, payload in zip(indices[threshold:], payloads[threshold:]):
+        predicted = backend.interpolate(basis, payloads[:threshold], index)
+        difference |= int.from_bytes(predicted, "big") ^ int.from_bytes(payload, "big")
+
+    mask = difference.to_bytes(length, "big").translate(_NONZERO_MASK)
+    return int.from_bytes(mask, "big")
+
+
+def combine_robust(shares, threshold):
+    # Byte positions are independent codewords. Positions where every
+    # share is consistent are interpolated in bulk; Berlekamp-Welch runs
+    # only on the first remaining inconsistent position, and the shares
+    # it flags are excluded before re-checking the rest in bulk. Byte
+    # masks are held as big ints so selection runs at C speed.
+    if hasattr(shares, "items"):
+        shares = shares.items()
+    shares = list(shares)
+
+    indices = tuple(index for index, _ in shares)
+    _validate_robust(indices, threshold)
+    _validate_byte_indices(indices)
+
+    if len(set(len(payload) for _, payload in shares)) != 1:
+        raise ReconstructionError(
+            "Share payloads differ in length"
+        )
+
+    payloads = [bytes(payload) for _, payload in shares]
+    length = len(payloads[0])
+    backend = backends.gf256_backend()
+
+    secret = 0
+    pending = (1 << (8 * length)) - 1
+    keep = list(range(len(indices)))
+    corrupted = set()
+
+    try:
+        while True:
+            kept = tuple(indices[i] for i in keep)
+            rows = [payloads[i] for i in keep]
+
+            inconsistent = _inconsistent_mask(kept, rows, threshold, length)
+            resolved = pending & ~inconsistent
+            candidate = backend.interpolate(kept[:threshold], rows[:threshold])
+            secret |= int.from_bytes(candidate, "big") & resolved
+
+            pending &= inconsistent
+            if not pending:
+                break
+
+            position = pending.to_bytes(length, "big").index(0xFF)
+            _, bad = robust.berlekamp_welch(
+                indices,
+                [payload[position] for payload in payloads],
+                threshold,
+                robust.GF256_OPS,
+            )
+            keep = [i for i in range(len(indices)) if i not in bad]
+            corrupted.update(indices[i] for i in bad)
+    except Exception as exc:
+        raise ReconstructionError(
+            "Failed to reconstruct secret from provided shares"
+        ) from exc
+
+    return secret.to_bytes(length, "big"), tuple(sorted(corrupted))
+
+
+def combine_chunks(indices, chunk_streams, jobs=None):
+    # Walks one chunk iterable per share index in lockstep and yields
+    # the reconstructed secret chunk by chunk.
+    indices = tuple(indices)
+    chunk_streams = list(chunk_streams)
+
+    if len(indices) < 2:
+        raise ReconstructionError(
+            "Not enough shares for reconstruction"
+        )
+
+    if len(chunk_streams) != len(indices):
+        raise ReconstructionError(
+            "Expected one chunk stream per share index"
+        )
+
+    _validate_byte_indices(indices)
+
+    def generate():
+        with _engine(jobs) as engine:
+            for chunks in zip_longest(*chunk_streams):
+                if None in chunks or len(set(map(len, chunks))) != 1:
+                    raise ReconstructionError(
+                        "Share payloads differ in length"
+                    )
+
+                yield _interpolate(engine, indices, chunks)
+
+    return generate()
+
+
+class Reconstructor:
+    """
+    Incremental prime-field reconstruction.
+
+    Shares are folded into the Newton form of the interpolating
+    polynomial as they arrive. Each add_share costs O(k) field
+    multiplications and one inversion, and the value at zero is kept
+    current, so secret is available in O(1) once threshold shares have
+    been added.
+    """
+
+    def __init__(self, threshold, prime=PRIME, field_id=None):
+        if threshold < 2:
+            raise InvalidThresholdError(
+                "Threshold must be at least 2"
+            )
+
+        self.threshold = threshold
+        self._field = _prime_field(prime, field_id)
+        self._backend = backends.prime_backend()
+        self._x_values = []
+        self._coefficients = []
+        # Product of (0 - x_j) over the shares added so far: the next
+        # Newton basis polynomial evaluated at zero.
+        self._basis_at_zero = 1
+        self._secret = 0
+
+    def __len__(self):
+        return len(self._x_values)
+
+    @property
+    def indices(self):
+        return tuple(self._x_values)
+
+    @property
+    def ready(self):
+        return len(self._x_values) >= self.threshold
+
+    def add_share(self, x, y):
+        """
+        Fold one share into the interpolation state.
+
+        Raises DuplicateShareError for an index already added and
+        ReconstructionError once threshold shares are present.
+        """
+        prime = self._field.prime
+
+        if self.ready:
+            raise ReconstructionError(
+                "Threshold already reached"
+            )
+
+        if not 0 < x < prime:
+            raise ReconstructionError(
+                "Share index outside field range"
+            )
+
+        if x in self._x_values:
+            raise DuplicateShareError(
+                f"Duplicate share index {x}"
+            )
+
+        # Evaluates the current Newton form
+        # c0 + (x - x0)(c1 + (x - x1)(c2 + ...)) at x, and the basis
+        # polynomial (x - x0)(x - x1)... alongside it.
+        value = 0
+        for x_j, coefficient in zip(
+            reversed(self._x_values), reversed(self._coefficients)
+        ):
+            value = (value * (x - x_j) + coefficient) % prime
+
+        basis = 1
+        for x_j in self._x_values:
+            basis = basis * (x - x_j) % prime
+
+        element = self._backend.element
+        coefficient = (element(y) - value) * self._backend.invert(
+            element(basis), prime
+        ) % prime
+
+        self._secret = int(self._field.reduce(
+            self._secret + coefficient * self._basis_at_zero
+        ))
+        self._basis_at_zero = self._basis_at_zero * -x % prime
+        self._x_values.append(x)
+        self._coefficients.append(coefficient)
+
+    @property
+    def secret(self):
+        if not self.ready:
+            raise ReconstructionError(
+                "Not enough shares for reconstruction"
+            )
+        return self._secret
+
+
+def _as_chunks(payload):
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return (payload,)
+    return payload
+
+
+class ByteReconstructor:
+    """
+    Incremental GF(256) reconstruction of byte secrets.
+
+    The GF(256) counterpart of Reconstructor. A share payload may be
+    given whole or as an iterable of chunks, such as
+    ShareReader.chunks(), so large shares are folded in without
+    holding them in memory; state is one coefficient row per share
+    plus the running secret. A share that fails part-way, for example
+    on an integrity error from its chunk iterator, leaves the state
+    unchanged.
+    """
+
+    def __init__(self, threshold):
+        _validate_byte_split(threshold, threshold)
+
+        self.threshold = threshold
+        self._size = None
+        self._indices = []
+        self._coefficients = []
+        self._basis_at_zero = 1
+        self._secret = bytearray()
+
+    def __len__(self):
+        return len(self._indices)
+
+    @property
+    def indices(self):
+        return tuple(self._indices)
+
+    @property
+    def ready(self):
+        return len(self._indices) >= self.threshold
+
+    def _fold(self, index, chunk, offset, inverse):
+        # Same recurrence as Reconstructor.add_share over a run of
+        # bytes; subtraction is XOR and products use translate tables.
+        length = len(chunk)
+        end = offset + length
+
+        value = 0
+        for x_j, row in zip(reversed(self._indices), reversed(self._coefficients)):
+            scaled = value.to_bytes(length, "big").translate(MUL_TRANSLATE[index ^ x_j])
+            value = int.from_bytes(scaled, "big") ^ int.from_bytes(row[offset:end], "big")
+
+        difference = (int.from_bytes(chunk, "big") ^ value).to_bytes(length, "big")
+        coefficient = difference.translate(MUL_TRANSLATE[inverse])
+
+        secret = int.from_bytes(self._secret[offset:end], "big") ^ int.from_bytes(
+            coefficient.translate(MUL_TRANSLATE[self._basis_at_zero]), "big"
+        )
+        return coefficient, secret.to_bytes(length, "big")
+
+    def add_share(self, index, payload):
+        """
+        Fold one share, given whole or as chunks, into the state.
+
+        Raises DuplicateShareError for an index already added and
+        ReconstructionError once threshold shares are present or when
+        the payload length differs from earlier shares.
+        """
+        if self.ready:
+            raise ReconstructionError(
+                "Threshold already reached"
+            )
+
+        _validate_byte_indices((index,))
+        if index in self._indices:
+            raise DuplicateShareError(
+                f"Duplicate share index {index}"
+            )
+
+        basis = 1
+        for x_j in self._indices:
+            basis = gf256.mul(basis, index ^ x_j)
+        inverse = gf256.inv(basis)
+
+        # Built aside and committed at the end so a failing share
+        # leaves the reconstructor usable.
+        coefficients = bytearray()
+        secret = bytearray()
+        for chunk in _as_chunks(payload):
+            offset = len(coefficients)
+            if self._size is not None and offset + len(chunk) > self._size:
+                raise ReconstructionError(
+                    "Share payloads differ in length"
+                )
+
+            row, value = self._fold(index, chunk, offset, inverse)
+            coefficients += row
+            secret += value
+
+        if not coefficients or (
+            self._size is not None and len(coefficients) != self._size
+        ):
+            raise ReconstructionError(
+                "Share payloads differ in length"
+            )
+
+        self._size = len(coefficients)
+        self._secret = secret
+        self._basis_at_zero = gf256.mul(self._basis_at_zero, index)
+        self._indices.append(index)
+        self._coefficients.append(coefficients)
+
+    @property
+    def secret(self):
+        if not self.ready:
+            raise ReconstructionError(
+                "Not enough shares for reconstruction"
+            )
+        return bytes(self._secret)
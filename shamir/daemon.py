@@ -0,0 +1,391 @@
+"""
+Local split/combine/verify service over a Unix domain socket.
+
+A long-running process avoids paying interpreter start-up and import
+costs on every operation. Requests use a compact binary framing and
+may be pipelined on one connection; responses carry the request id.
+
+Combine requests that arrive together and use the same set of share
+indices are coalesced: their payloads are concatenated along the byte
+axis and interpolated in a single call, since the Lagrange weights
+depend only on the indices.
+
+Split, interpolation and share verification run on an executor through
+a shamir.aio.Offloader, so a large request does not stall other
+clients. Backpressure applies in both directions: each response is
+drained before the next is written, so a slow reader does not grow the
+write buffer, and at most max_in_flight requests per connection are
+outstanding, so the next frame is not read until one of them has been
+answered.
+
+Frame layout (big-endian), for both requests and responses:
+
+    length (4) | opcode or status (1) | request id (4) | body (length)
+
+Request bodies:
+
+    SPLIT    threshold (1) | shares (1) | secret
+    COMBINE  count (1) | indices (count) | payloads (count x L)
+    VERIFY   key length (2) | MAC key | serialized share
+
+Response bodies on success:
+
+    SPLIT    count (1) | count x (index (1) | payload (L))
+    COMBINE  secret
+    VERIFY   threshold (1) | share_count (1) | share_index (1) | field_id (1)
+
+On failure the status is STATUS_ERROR and the body is a UTF-8 message.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import stat
+import struct
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from . import backends, core
+from .aio import Offloader
+from .errors import ShamirError
+from .format import ShareHeader, decode_share
+
+
+OP_SPLIT = 0x01
+OP_COMBINE = 0x02
+OP_VERIFY = 0x03
+
+STATUS_OK = 0x00
+STATUS_ERROR = 0x01
+
+MAX_FRAME_SIZE = 64 << 20
+MAX_IN_FLIGHT = 16
+
+_FRAME_STRUCT = struct.Struct(">IBI")
+_VERIFY_STRUCT = struct.Struct(">BBBB")
+
+
+class DaemonError(ShamirError):
+    """Raised by the client when the daemon reports a failure."""
+
+
+def _frame(code: int, request_id: int, body: bytes) -> bytes:
+    return _FRAME_STRUCT.pack(len(body), code, request_id) + body
+
+
+class _CombineBatcher:
+    """
+    Groups combine requests by share indices within one loop iteration.
+    """
+
+    def __init__(self, offloader: Optional[Offloader] = None):
+        self._offloader = offloader or Offloader()
+        self._pending: Dict[Tuple[int, ...], List] = defaultdict(list)
+        self._scheduled = False
+        self._tasks = set()
+
+    def submit(self, indices: Tuple[int, ...], payloads: List[bytes]) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[indices].append((payloads, future))
+
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, defaultdict(list)
+        self._scheduled = False
+
+        for indices, requests in pending.items():
+            # The loop holds tasks weakly; keep them until they finish.
+            task = asyncio.ensure_future(self._resolve(indices, requests))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _interpolate(indices, requests) -> bytes:
+        joined = [
+            b"".join(payloads[row] for payloads, _ in requests)
+            for row in range(len(indices))
+        ]
+        return backends.gf256_backend().interpolate(indices, joined)
+
+    async def _resolve(self, indices, requests) -> None:
+        try:
+            secrets = await self._offloader.run(
+                self._interpolate, indices, requests
+            )
+        except Exception as exc:
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        offset = 0
+        for payloads, future in requests:
+            length = len(payloads[0])
+            if not future.done():
+                future.set_result(secrets[offset : offset + length])
+            offset += length
+
+
+class ShamirDaemon:
+    """
+    asyncio Unix socket server for split, combine and verify.
+
+    The socket is created with owner-only permissions. CPU-bound work
+    runs through offloader, by default a new Offloader on the loop's
+    default executor. Each connection may have at most max_in_flight
+    pipelined requests outstanding.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offloader: Optional[Offloader] = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive")
+
+        self.path = path
+        self.max_in_flight = max_in_flight
+        self._offloader = offloader or Offloader()
+        self._batcher = _CombineBatcher(self._offloader)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+
+        previous = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=self.path
+            )
+        finally:
+            os.umask(previous)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle_connection(self, reader, writer) -> None:
+        tasks = set()
+        # Serializes write + drain: concurrent drain() calls on one
+        # writer are not supported before Python 3.10.
+        lock = asyncio.Lock()
+        # A slot is taken before the next frame is read and returned
+        # once its response is written, which bounds the bodies and
+        # tasks a pipelining client can make the daemon hold.
+        slots = asyncio.Semaphore(self.max_in_flight)
+
+        def finished(task) -> None:
+            tasks.discard(task)
+            slots.release()
+
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    head = await reader.readexactly(_FRAME_STRUCT.size)
+                    length, opcode, request_id = _FRAME_STRUCT.unpack(head)
+                    if length > MAX_FRAME_SIZE:
+                        writer.write(
+                            _frame(STATUS_ERROR, request_id, b"Frame too large")
+                        )
+                        break
+                    body = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    break
+                except BaseException:
+                    slots.release()
+                    raise
+
+                task = asyncio.ensure_future(
+                    self._respond(writer, lock, opcode, request_id, body)
+                )
+                tasks.add(task)
+                task.add_done_callback(finished)
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+
+    async def _respond(
+        self, writer, lock, opcode: int, request_id: int, body: bytes
+    ) -> None:
+        try:
+            if opcode == OP_SPLIT:
+                result = await self._offloader.run(self._split, body)
+            elif opcode == OP_COMBINE:
+                result = await self._combine(body)
+            elif opcode == OP_VERIFY:
+                result = await self._offloader.run(self._verify, body)
+            else:
+                raise DaemonError("Unknown opcode")
+            frame = _frame(STATUS_OK, request_id, result)
+        except Exception as exc:
+            frame = _frame(STATUS_ERROR, request_id, str(exc).encode("utf-8"))
+
+        async with lock:
+            writer.write(frame)
+            await writer.drain()
+
+    def _split(self, body: bytes) -> bytes:
+        if len(body) < 2:
+            raise DaemonError("Malformed split request")
+
+        shares = core.split(body[2:], body[0], body[1])
+        out = bytearray([len(shares)])
+        for index, payload in shares:
+            out.append(index)
+            out += payload
+        return bytes(out)
+
+    async def _combine(self, body: bytes) -> bytes:
+        if not body:
+            raise DaemonError("Malformed combine request")
+
+        count = body[0]
+        indices = tuple(body[1 : 1 + count])
+        data = body[1 + count :]
+        if count < 2 or len(indices) != count or not data or len(data) % count:
+            raise DaemonError("Malformed combine request")
+
+        core._validate_byte_indices(indices)
+        width = len(data) // count
+        payloads = [data[i * width : (i + 1) * width] for i in range(count)]
+        return await self._batcher.submit(indices, payloads)
+
+    def _verify(self, body: bytes) -> bytes:
+        if len(body) < 2:
+            raise DaemonError("Malformed verify request")
+
+        key_length = int.from_bytes(body[:2], "big")
+        mac_key = body[2 : 2 + key_length] if key_length else None
+        header, _ = decode_share(body[2 + key_length :], mac_key=mac_key)
+        return _VERIFY_STRUCT.pack(
+            header.threshold,
+            header.share_count,
+            header.share_index,
+            header.field_id,
+        )
+
+
+def serve(path: str) -> None:
+    """
+    Run the daemon in the foreground until SIGINT or SIGTERM.
+    """
+    daemon = ShamirDaemon(path)
+
+    async def run() -> None:
+        task = asyncio.ensure_future(daemon.serve_forever())
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, task.cancel)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    try:
+        asyncio.run(run())
+    finally:
+        daemon.close()
+
+
+class DaemonClient:
+    """
+    Blocking client that keeps one connection to the daemon open.
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(path)
+        self._stream = self._socket.makefile("rb")
+        self._next_id = 0
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._stream.close()
+        self._socket.close()
+
+    def _call(self, opcode: int, body: bytes) -> bytes:
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        request_id = self._next_id
+        self._socket.sendall(_frame(opcode, request_id, body))
+
+        head = self._stream.read(_FRAME_STRUCT.size)
+        if len(head) != _FRAME_STRUCT.size:
+            raise DaemonError("Connection closed by daemon")
+
+        length, status, response_id = _FRAME_STRUCT.unpack(head)
+        payload = self._stream.read(length)
+        if len(payload) != length or response_id != request_id:
+            raise DaemonError("Malformed response from daemon")
+        if status != STATUS_OK:
+            raise DaemonError(payload.decode("utf-8", "replace"))
+        return payload
+
+    def split(self, secret: bytes, threshold: int, shares: int) -> List[Tuple[int, bytes]]:
+        """
+        Split a secret; returns (index, payload) pairs like core.split.
+        """
+        if not (0 <= threshold <= 255 and 0 <= shares <= 255):
+            raise DaemonError("Threshold and share count must fit in one byte")
+
+        body = self._call(OP_SPLIT, bytes([threshold, shares]) + secret)
+        count = body[0]
+        width = (len(body) - 1) // count
+        return [
+            (body[offset], body[offset + 1 : offset + width])
+            for offset in range(1, len(body), width)
+        ]
+
+    def combine(self, shares) -> bytes:
+        """
+        Reconstruct a secret from (index, payload) pairs or a mapping.
+        """
+        if hasattr(shares, "items"):
+            shares = shares.items()
+        shares = list(shares)
+
+        body = bytearray([len(shares)])
+        body += bytes(index for index, _ in shares)
+        for _, payload in shares:
+            body += payload
+        return self._call(OP_COMBINE, bytes(body))
+
+    def verify(self, data: bytes, mac_key: Optional[bytes] = None) -> ShareHeader:
+        """
+        Validate a serialized share and return its header.
+        """
+        key = mac_key or b""
+        body = self._call(
+            OP_VERIFY, len(key).to_bytes(2, "big") + key + bytes(data)
+        )
+        k, n, i, field_id = _VERIFY_STRUCT.unpack(body)
+        return ShareHeader(
+            threshold=k,
+            share_count=n,
+            share_index=i,
+            field_id=field_id,
+        )
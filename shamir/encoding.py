@@ -1,22 +1,214 @@
+"""
+Compact transport encoding for (x, y) shares.
+
+Shares are encoded as fixed-width big-endian binary records behind a
+small header:
+
+    version (1) | kind (1) | width (2) | count (4) | count x record
+
+    record = x (4) | y (width)
+
+kind is KIND_INT for prime-field shares (y is an integer, stored
+big-endian in width bytes) or KIND_BYTES for GF(256) shares (y is a
+byte string of exactly width bytes). A single share is a batch of one.
+
+Batches are packed into one preallocated buffer and unpacked with
+struct.iter_unpack, avoiding per-share big-int to decimal conversion.
+Output may optionally be armored as base85 or base32 text.
+
+The legacy text form, base64("x:y") with y in decimal, is still
+accepted by the decoders.
+"""
+
 import base64
+import binascii
+import struct
+from typing import Iterable, List, Optional, Tuple, Union
+
+from . import fields
+from .exceptions import EncodingError
+
+
+ENCODING_VERSION = 0x02
+
+KIND_INT = 0x01
+KIND_BYTES = 0x02
+
+# Prime-field shares are padded to the size of the default field so
+# every encoded share has the same length.
+DEFAULT_INT_WIDTH = (fields.DEFAULT_PRIME.bit_length() + 7) // 8
+
+_BATCH_STRUCT = struct.Struct(">BBHI")
+
+_ARMOR = {
+    "base85": (base64.b85encode, base64.b85decode),
+    "base32": (base64.b32encode, base64.b32decode),
+}
+
+
+def _armor_codec(armor: Optional[str]):
+    try:
+        return _ARMOR[armor]
+    except KeyError:
+        raise EncodingError(f"Unsupported armor: {armor!r}") from None
+
+
+def _batch_layout(shares: List[Tuple[int, object]], width: Optional[int]):
+    if not shares:
+        raise EncodingError("No shares to encode")
+
+    try:
+        integer = isinstance(shares[0][1], int)
+        if integer:
+            needed = max(y.bit_length() for _, y in shares)
+        else:
+            lengths = set(len(y) for _, y in shares)
+    except (AttributeError, TypeError, ValueError) as exc:
+        # Mixed integer and byte payloads, or entries that are not
+        # (index, payload) pairs.
+        raise EncodingError("Share cannot be encoded") from exc
+
+    if integer:
+        minimum = (needed + 7) // 8
+        if width is None:
+            width = max(DEFAULT_INT_WIDTH, minimum)
+        elif width < minimum:
+            raise EncodingError("Share value does not fit the requested width")
+    else:
+        if len(lengths) != 1:
+            raise EncodingError("Share payloads differ in length")
+        (length,) = lengths
+        if width is not None and width != length:
+            raise EncodingError("Share payload does not match the requested width")
+        width = length
+
+    if not 1 <= width <= 0xFFFF:
+        raise EncodingError("Share width out of range")
+
+    return (KIND_INT if integer else KIND_BYTES), width
+
+
+def encode_shares(
+    shares: Iterable,
+    width: Optional[int] = None,
+    armor: Optional[str] = None,
+) -> bytes:
+    """
+    Encode a batch of shares into a single buffer.
+
+    All shares must be of one kind: integer y values (padded to width,
+    by default the size of the default prime) or equal-length byte
+    strings. armor may be "base85" or "base32".
+    """
+    shares = list(shares)
+    kind, width = _batch_layout(shares, width)
+
+    record = struct.Struct(f">I{width}s")
+    buffer = bytearray(_BATCH_STRUCT.size + record.size * len(shares))
+    _BATCH_STRUCT.pack_into(buffer, 0, ENCODING_VERSION, kind, width, len(shares))
+
+    offset = _BATCH_STRUCT.size
+    try:
+        for x, y in shares:
+            if kind == KIND_INT:
+                y = y.to_bytes(width, "big")
+            record.pack_into(buffer, offset, x, y)
+            offset += record.size
+    except (struct.error, AttributeError, TypeError, OverflowError) as exc:
+        raise EncodingError("Share cannot be encoded") from exc
+
+    encoded = bytes(buffer)
+    if armor is not None:
+        encoded = _armor_codec(armor)[0](encoded)
+    return encoded
+
+
+def encode_share(share, width: Optional[int] = None, armor: Optional[str] = None) -> bytes:
+    """
+    Encode a single share.
+    """
+    return encode_shares([share], width, armor)
+
+
+def _decode_legacy(encoded) -> Tuple[int, int]:
+    try:
+        if isinstance(encoded, str):
+            encoded = encoded.encode("ascii")
+        payload = base64.urlsafe_b64decode(bytes(encoded))
+        x_str, y_str = payload.decode("ascii").split(":")
+        return int(x_str), int(y_str)
+    except (ValueError, binascii.Error) as exc:
+        raise EncodingError("Malformed encoded share") from exc
+
+
+def _decode_batch(data) -> List[Tuple[int, object]]:
+    view = memoryview(data)
+    if len(view) < _BATCH_STRUCT.size:
+        raise EncodingError("Encoded share is truncated")
+
+    version, kind, width, count = _BATCH_STRUCT.unpack_from(view)
+    if version != ENCODING_VERSION:
+        raise EncodingError("Unsupported encoding version")
+    if kind not in (KIND_INT, KIND_BYTES) or width == 0:
+        raise EncodingError("Malformed encoded share")
+
+    record = struct.Struct(f">I{width}s")
+    body = view[_BATCH_STRUCT.size :]
+    if len(body) != record.size * count:
+        raise EncodingError("Encoded share length mismatch")
+
+    if kind == KIND_INT:
+        return [(x, int.from_bytes(y, "big")) for x, y in record.iter_unpack(body)]
+    return list(record.iter_unpack(body))
+
+
+def _dearmor(encoded, armor: Optional[str]):
+    if armor is None:
+        return encoded
+    try:
+        return _armor_codec(armor)[1](encoded)
+    except (ValueError, binascii.Error) as exc:
+        raise EncodingError("Malformed armored share") from exc
+
 
+def _is_binary(encoded) -> bool:
+    return (
+        isinstance(encoded, (bytes, bytearray, memoryview))
+        and len(encoded) > 0
+        and encoded[0] == ENCODING_VERSION
+    )
 
-def encode_share(share):
-    x, y = share
-    payload = f"{x}:{y}".encode("utf-8")
-    return base64.urlsafe_b64encode(payload).decode("ascii")
 
+def decode_shares(
+    encoded: Union[bytes, Iterable],
+    armor: Optional[str] = None,
+) -> List[Tuple[int, object]]:
+    """
+    Decode a batch produced by encode_shares().
 
-def decode_share(encoded_share):
-    payload = base64.urlsafe_b64decode(encoded_share.encode("ascii"))
-    x_str, y_str = payload.decode("utf-8").split(":")
-    return int(x_str), int(y_str)
+    An iterable of individually encoded shares, binary or legacy text,
+    is also accepted. Raises EncodingError on malformed input.
+    """
+    if isinstance(encoded, (str, bytes, bytearray, memoryview)):
+        data = _dearmor(encoded, armor)
+        if not _is_binary(data):
+            raise EncodingError("Malformed encoded share batch")
+        return _decode_batch(data)
 
+    return [decode_share(item, armor) for item in encoded]
 
-def encode_shares(shares):
-    return [encode_share(share) for share in shares]
 
+def decode_share(encoded, armor: Optional[str] = None) -> Tuple[int, object]:
+    """
+    Decode a single share, in binary or legacy text form.
 
-def decode_shares(encoded_shares):
-    return [decode_share(share) for share in encoded_shares]
+    Raises EncodingError on malformed input.
+    """
+    encoded = _dearmor(encoded, armor)
+    if _is_binary(encoded):
+        shares = _decode_batch(encoded)
+        if len(shares) != 1:
+            raise EncodingError("Expected exactly one encoded share")
+        return shares[0]
 
+    return _decode_legacy(encoded)
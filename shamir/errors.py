@@ -20,14 +20,67 @@ class ShareFormatError(ShamirError):
     """
 
 
+class UnsupportedFieldError(ShamirError):
+    """
+    Raised when a field identifier is unknown or not usable for the
+    requested operation.
+    """
+
+
+class BackendError(ShamirError):
+    """
+    Raised when a requested arithmetic backend is unknown or not
+    installed.
+    """
+
+
 class IntegrityError(ShamirError):
     """
     Raised when integrity verification fails (CRC or MAC).
     """
 
 
+class ChunkIntegrityError(IntegrityError):
+    """
+    Raised when chunked integrity verification fails.
+
+    The indices of the corrupted chunks are available as `chunks`.
+    """
+
+    def __init__(self, message, chunks=()):
+        super().__init__(message)
+        self.chunks = tuple(chunks)
+
+
+class DuplicateShareError(ShamirError):
+    """
+    Raised when a share index appears more than once in a collection.
+    """
+
+
+class RefreshError(ShamirError):
+    """
+    Raised when shares cannot be refreshed, for example because the
+    split is incomplete or mixes shares of different splits.
+    """
+
+
+class VerificationError(ShamirError):
+    """
+    Raised when shares cannot be checked against commitments, for
+    example because the share and commitment schemes differ.
+    """
+
+
 class ReconstructionError(ShamirError):
     """
     Raised when secret reconstruction fails due to insufficient
     or inconsistent shares.
     """
+
+
+class DecodingError(ReconstructionError):
+    """
+    Raised when error-correcting decoding fails because the shares
+    contain more errors than can be corrected.
+    """
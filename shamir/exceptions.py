@@ -1,6 +1,4 @@
-class ShamirError(Exception):
-    """Base exception for Shamir Secret Sharing errors."""
-    pass
+from .errors import ShamirError, ReconstructionError
 
 
 class InvalidThresholdError(ShamirError):
@@ -18,11 +16,6 @@ class InvalidSecretError(ShamirError):
     pass
 
 
-class ReconstructionError(ShamirError):
-    """Raised when secret reconstruction fails."""
-    pass
-
-
 class EncodingError(ShamirError):
     """Raised when share encoding or decoding fails."""
     pass
@@ -0,0 +1,191 @@
+"""
+Registry of finite fields available for secret sharing.
+
+Every field has a one-byte field_id, the value carried in the share
+header. GF(256) backs the byte-oriented split/combine; the prime
+fields back split_secret/reconstruct_secret.
+
+Mersenne primes p = 2^e - 1 allow reduction by folding: since
+2^e = 1 (mod p), v = (v & p) + (v >> e) (mod p). In CPython a single
+% on a small integer is already one C call, so folding only wins once
+operands span many digits; below FOLD_MIN_BITS the Mersenne fields use
+%. Their main benefit for short secrets is operand size: GF(2^127 - 1)
+multiplies half-width integers compared with the default 257-bit
+prime, but it holds only values below 2^127 - 1, i.e. any 126-bit
+value. A uniformly random 16-byte key does not fit and belongs in the
+default field or GF(2^521 - 1).
+"""
+
+from typing import Dict, Union
+
+from .errors import UnsupportedFieldError
+
+
+FIELD_GF256 = 0x01
+FIELD_PRIME257 = 0x02
+FIELD_M61 = 0x03
+FIELD_M127 = 0x04
+FIELD_M521 = 0x05
+FIELD_MODP2048 = 0x06
+
+# Below this exponent a single % is faster than folding in CPython.
+FOLD_MIN_BITS = 256
+
+DEFAULT_PRIME = 208351617316091241234326746312124448251235562226470491514186331217050270460481
+
+# RFC 3526 group 14: the 2048-bit MODP safe prime p = 2q + 1. Shares
+# verified with shamir.vss live in GF(q), the order of the subgroup
+# generated by 2.
+MODP2048_PRIME = int(
+    "FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74"
+    "020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437"
+    "4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED"
+    "EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05"
+    "98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB"
+    "9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B"
+    "E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718"
+    "3995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF",
+    16,
+)
+MODP2048_ORDER = (MODP2048_PRIME - 1) // 2
+
+
+class BinaryField:
+    """
+    GF(2^8); arithmetic lives in shamir.gf256.
+    """
+
+    __slots__ = ("field_id", "name")
+
+    def __init__(self, field_id: int, name: str):
+        self.field_id = field_id
+        self.name = name
+
+    element_size = 1
+
+
+class PrimeField:
+    """
+    GF(p) for a prime p with generic % reduction.
+    """
+
+    __slots__ = ("field_id", "name", "prime", "element_size")
+
+    def __init__(self, field_id: int, name: str, prime: int):
+        self.field_id = field_id
+        self.name = name
+        self.prime = prime
+        self.element_size = (prime.bit_length() + 7) // 8
+
+    def reduce(self, value: int) -> int:
+        return value % self.prime
+
+    def to_bytes(self, value: int) -> bytes:
+        """
+        Encode an element as element_size big-endian bytes.
+        """
+        return value.to_bytes(self.element_size, "big")
+
+    def from_bytes(self, data) -> int:
+        """
+        Decode an element; raises ValueError if it is out of range.
+        """
+        value = int.from_bytes(data, "big")
+        if value >= self.prime:
+            raise ValueError("Value outside field range")
+        return value
+
+
+class MersenneField(PrimeField):
+    """
+    GF(2^e - 1) with shift-and-add reduction for large e.
+    """
+
+    __slots__ = ("exponent",)
+
+    def __init__(self, field_id: int, name: str, exponent: int):
+        super().__init__(field_id, name, (1 << exponent) - 1)
+        self.exponent = exponent
+
+    def reduce(self, value: int) -> int:
+        if value < 0 or self.exponent < FOLD_MIN_BITS:
+            return value % self.prime
+
+        prime = self.prime
+        exponent = self.exponent
+        while value >> exponent:
+            value = (value & prime) + (value >> exponent)
+        return 0 if value == prime else value
+
+
+Field = Union[BinaryField, PrimeField]
+
+_FIELDS: Dict[int, Field] = {}
+
+
+def register_field(field: Field) -> None:
+    """
+    Register a field under its field_id.
+
+    Raises UnsupportedFieldError if the identifier is taken.
+    """
+    if not 0 < field.field_id <= 0xFF:
+        raise UnsupportedFieldError("Field identifier must fit in one byte")
+    if field.field_id in _FIELDS:
+        raise UnsupportedFieldError(
+            f"Field identifier 0x{field.field_id:02x} already registered"
+        )
+    _FIELDS[field.field_id] = field
+
+
+def get_field(field_id: int) -> Field:
+    """
+    Return the field registered under field_id.
+
+    Raises UnsupportedFieldError for unknown identifiers.
+    """
+    try:
+        return _FIELDS[field_id]
+    except KeyError:
+        raise UnsupportedFieldError(
+            f"Unsupported field identifier 0x{field_id:02x}"
+        ) from None
+
+
+def is_registered(field_id: int) -> bool:
+    return field_id in _FIELDS
+
+
+def prime_field(field_id: int) -> PrimeField:
+    """
+    Return the prime field registered under field_id.
+
+    Raises UnsupportedFieldError if it is unknown or not a prime field.
+    """
+    field = get_field(field_id)
+    if not isinstance(field, PrimeField):
+        raise UnsupportedFieldError(f"{field.name} is not a prime field")
+    return field
+
+
+def field_for_prime(prime: int) -> PrimeField:
+    """
+    Return the registered field for prime, or an unregistered
+    PrimeField wrapping it.
+    """
+    for field in _FIELDS.values():
+        if isinstance(field, PrimeField) and field.prime == prime:
+            return field
+    return PrimeField(0, f"GF({prime})", prime)
+
+
+GF256 = BinaryField(FIELD_GF256, "GF(256)")
+PRIME257 = PrimeField(FIELD_PRIME257, "GF(p257)", DEFAULT_PRIME)
+M61 = MersenneField(FIELD_M61, "GF(2^61-1)", 61)
+M127 = MersenneField(FIELD_M127, "GF(2^127-1)", 127)
+M521 = MersenneField(FIELD_M521, "GF(2^521-1)", 521)
+MODP2048 = PrimeField(FIELD_MODP2048, "GF(q), RFC 3526 group 14", MODP2048_ORDER)
+
+for _field in (GF256, PRIME257, M61, M127, M521, MODP2048):
+    register_field(_field)
+del _field
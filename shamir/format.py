@@ -11,18 +11,19 @@ import struct
 import zlib
 import hmac
 import hashlib
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+from . import fields
+from .errors import ShareFormatError
+from .integrity import IntegrityError, verify_crc32, verify_hmac_sha256
+from .share import Share
 
 
 MAGIC = b"SHAM"
 VERSION = 0x01
 
-FIELD_GF256 = 0x01
-
-
-class ShareFormatError(Exception):
-    """Raised when a serialized share is invalid or malformed."""
+FIELD_GF256 = fields.FIELD_GF256
 
 
 @dataclass(frozen=True)
@@ -37,17 +38,65 @@ class ShareHeader:
             raise ShareFormatError("Invalid threshold/share_count combination")
         if not (1 <= self.share_index <= self.share_count):
             raise ShareFormatError("Invalid share index")
-        if self.field_id != FIELD_GF256:
+        if not fields.is_registered(self.field_id):
             raise ShareFormatError("Unsupported field identifier")
 
 
+def grow_headers(headers: Sequence[ShareHeader], count: int) -> List[ShareHeader]:
+    """
+    Return headers for count shares issued after an existing split.
+
+    share_count is the number of shares issued when a share was
+    written, and indices run from 1 to share_count. New shares take the
+    indices after the largest share_count among headers and carry the
+    grown total; existing headers stay valid as they are, so shares
+    written before and after growth combine. Raises ShareFormatError
+    when headers disagree on threshold or field, or when the total
+    would exceed 255 shares.
+    """
+    if not headers:
+        raise ShareFormatError("No shares to extend")
+    if count < 1:
+        raise ShareFormatError("At least one new share is required")
+
+    first = headers[0]
+    if any(
+        (header.threshold, header.field_id) != (first.threshold, first.field_id)
+        for header in headers
+    ):
+        raise ShareFormatError("Shares belong to different splits")
+
+    issued = max(header.share_count for header in headers)
+    total = issued + count
+    if total > 255:
+        raise ShareFormatError("A split supports at most 255 shares")
+
+    return [
+        replace(first, share_count=total, share_index=index)
+        for index in range(issued + 1, total + 1)
+    ]
+
+
 _HEADER_STRUCT = struct.Struct(">4sBBBBB")
 # magic, version, k, n, i, field_id
 
+_CRC_STRUCT = struct.Struct(">I")
+
+
+def _pack_header(header: ShareHeader) -> bytes:
+    return _HEADER_STRUCT.pack(
+        MAGIC,
+        VERSION,
+        header.threshold,
+        header.share_count,
+        header.share_index,
+        header.field_id,
+    )
+
 
 def encode_share(
     header: ShareHeader,
-    payload: bytes,
+    payload,
     mac_key: Optional[bytes] = None,
 ) -> bytes:
     """
@@ -55,24 +104,22 @@ def encode_share(
 
     Integrity is always protected by CRC32.
     If mac_key is provided, an HMAC-SHA256 is appended.
+
+    payload may be bytes or a Share whose index matches the header.
     """
     header.validate()
 
+    if isinstance(payload, Share):
+        if payload.index != header.share_index:
+            raise ShareFormatError("Share index does not match header")
+        payload = payload.payload
+
     if not payload:
         raise ShareFormatError("Empty payload")
 
-    header_bytes = _HEADER_STRUCT.pack(
-        MAGIC,
-        VERSION,
-        header.threshold,
-        header.share_count,
-        header.share_index,
-        header.field_id,
-    )
-
-    body = header_bytes + payload
+    body = _pack_header(header) + payload
     crc = zlib.crc32(body) & 0xFFFFFFFF
-    encoded = body + struct.pack(">I", crc)
+    encoded = body + _CRC_STRUCT.pack(crc)
 
     if mac_key is not None:
         mac = hmac.new(mac_key, encoded, hashlib.sha256).digest()
@@ -81,21 +128,72 @@ def encode_share(
     return encoded
 
 
-def decode_share(
-    data: bytes,
-    mac_key: Optional[bytes] = None,
-) -> tuple[ShareHeader, bytes]:
+class ShareWriter:
     """
-    Decode and validate a serialized share.
+    Incremental encoder for a single share.
 
-    Verifies magic, version, structural constraints,
-    CRC32 integrity, and optional HMAC.
+    Writes the header immediately and payload chunks as they arrive,
+    keeping CRC32 and optional HMAC state running. The bytes written to
+    the stream are identical to encode_share() over the concatenated
+    payload, without holding that payload in memory.
     """
-    if len(data) < _HEADER_STRUCT.size + 4:
-        raise ShareFormatError("Data too short")
 
-    header_part = data[: _HEADER_STRUCT.size]
-    magic, version, k, n, i, field_id = _HEADER_STRUCT.unpack(header_part)
+    def __init__(
+        self,
+        stream: BinaryIO,
+        header: ShareHeader,
+        mac_key: Optional[bytes] = None,
+    ):
+        header.validate()
+
+        self._stream = stream
+        self._crc = 0
+        self._mac = (
+            hmac.new(mac_key, digestmod=hashlib.sha256)
+            if mac_key is not None
+            else None
+        )
+        self._payload_size = 0
+        self._closed = False
+
+        self._emit(_pack_header(header))
+
+    def _emit(self, data: bytes) -> None:
+        self._crc = zlib.crc32(data, self._crc)
+        if self._mac is not None:
+            self._mac.update(data)
+        self._stream.write(data)
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk of payload.
+        """
+        if self._closed:
+            raise ShareFormatError("Share writer already closed")
+
+        self._payload_size += len(chunk)
+        self._emit(chunk)
+
+    def close(self) -> None:
+        """
+        Write the integrity trailer.
+
+        Does not close the underlying stream.
+        """
+        if self._closed:
+            return
+        if not self._payload_size:
+            raise ShareFormatError("Empty payload")
+
+        self._emit(_CRC_STRUCT.pack(self._crc & 0xFFFFFFFF))
+        if self._mac is not None:
+            self._stream.write(self._mac.digest())
+
+        self._closed = True
+
+
+def _unpack_header(data) -> ShareHeader:
+    magic, version, k, n, i, field_id = _HEADER_STRUCT.unpack_from(data)
 
     if magic != MAGIC:
         raise ShareFormatError("Invalid magic value")
@@ -109,27 +207,169 @@ def decode_share(
         field_id=field_id,
     )
     header.validate()
+    return header
 
-    mac_len = hashlib.sha256().digest_size if mac_key else 0
-    payload_end = len(data) - 4 - mac_len
 
-    payload = data[_HEADER_STRUCT.size : payload_end]
-    if not payload:
+def _locate_payload(view: memoryview, mac_key: Optional[bytes]):
+    """
+    Validate the header and return (header, payload_end, mac_len).
+    """
+    if len(view) < _HEADER_STRUCT.size + _CRC_STRUCT.size:
+        raise ShareFormatError("Data too short")
+
+    header = _unpack_header(view)
+
+    mac_len = hashlib.sha256().digest_size if mac_key else 0
+    payload_end = len(view) - _CRC_STRUCT.size - mac_len
+    if payload_end <= _HEADER_STRUCT.size:
         raise ShareFormatError("Empty payload")
 
-    expected_crc = struct.unpack(">I", data[payload_end : payload_end + 4])[0]
-    actual_crc = zlib.crc32(data[:payload_end]) & 0xFFFFFFFF
-    if actual_crc != expected_crc:
-        raise ShareFormatError("CRC mismatch")
+    return header, payload_end, mac_len
+
+
+def _as_byte_view(data) -> memoryview:
+    view = memoryview(data)
+    return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+
+
+def decode_share(
+    data,
+    mac_key: Optional[bytes] = None,
+) -> Tuple[ShareHeader, memoryview]:
+    """
+    Decode and validate a serialized share.
+
+    Verifies magic, version, structural constraints,
+    CRC32 integrity, and optional HMAC. Integrity failures
+    raise IntegrityError.
+
+    data may be any buffer-protocol object (bytes, bytearray,
+    memoryview, mmap). The payload is returned as a memoryview into
+    data, not a copy; integrity checks also run over views.
+    """
+    view = _as_byte_view(data)
+    header, payload_end, mac_len = _locate_payload(view, mac_key)
+
+    expected_crc = _CRC_STRUCT.unpack_from(view, payload_end)[0]
+    verify_crc32(view[:payload_end], expected_crc)
 
     if mac_key is not None:
-        expected_mac = data[-mac_len:]
-        actual_mac = hmac.new(
+        mac_start = payload_end + _CRC_STRUCT.size
+        verify_hmac_sha256(
+            view[:mac_start],
             mac_key,
-            data[:-mac_len],
-            hashlib.sha256,
-        ).digest()
-        if not hmac.compare_digest(actual_mac, expected_mac):
-            raise ShareFormatError("MAC verification failed")
+            bytes(view[mac_start:]),
+        )
+
+    return header, view[_HEADER_STRUCT.size : payload_end]
+
+
+def load_share(
+    data,
+    mac_key: Optional[bytes] = None,
+    session_id: Optional[str] = None,
+) -> Tuple[ShareHeader, Share]:
+    """
+    Decode a share into its header and a Share.
+
+    The Share payload is a memoryview into data, as with decode_share.
+    """
+    header, payload = decode_share(data, mac_key)
+    return header, Share(header.share_index, payload, session_id)
+
+
+def decode_share_into(
+    data,
+    out,
+    mac_key: Optional[bytes] = None,
+) -> Tuple[ShareHeader, int]:
+    """
+    Decode a share and copy its payload into a caller-provided buffer.
+
+    out must be a writable buffer at least as large as the payload.
+    Returns the header and the number of payload bytes written.
+    """
+    header, payload = decode_share(data, mac_key)
+
+    target = _as_byte_view(out)
+    if target.readonly:
+        raise ShareFormatError("Output buffer is read-only")
+    if len(target) < len(payload):
+        raise ShareFormatError("Output buffer too small")
+
+    target[: len(payload)] = payload
+    return header, len(payload)
+
+
+class ShareReader:
+    """
+    Incremental decoder over a buffer holding a single share.
+
+    The buffer may be any object supporting the buffer protocol,
+    typically an mmap of a share file. The header is validated on
+    construction; the payload is exposed as a sequence of memoryview
+    chunks while CRC32 and optional HMAC state are updated, so a share
+    of any size is verified without copying it into memory.
+    """
+
+    def __init__(self, data, mac_key: Optional[bytes] = None):
+        self._view = _as_byte_view(data)
+        self.header, self._payload_end, _ = _locate_payload(
+            self._view, mac_key
+        )
+        self._mac_key = mac_key
+
+    @property
+    def payload_size(self) -> int:
+        return self._payload_end - _HEADER_STRUCT.size
+
+    def chunks(self, chunk_size: int, verify: bool = True) -> Iterator[memoryview]:
+        """
+        Yield the payload as memoryview chunks of at most chunk_size bytes.
+
+        With verify enabled, integrity is checked after the last chunk
+        has been consumed; a CRC32 or HMAC mismatch raises IntegrityError,
+        so callers must not treat output as final before the iterator is
+        exhausted.
+        """
+        view = self._view
+        end = self._payload_end
+        header_part = view[: _HEADER_STRUCT.size]
+
+        crc = 0
+        mac = None
+        if verify:
+            crc = zlib.crc32(header_part)
+            if self._mac_key is not None:
+                mac = hmac.new(self._mac_key, header_part, hashlib.sha256)
+
+        for offset in range(_HEADER_STRUCT.size, end, chunk_size):
+            chunk = view[offset : min(offset + chunk_size, end)]
+            if verify:
+                crc = zlib.crc32(chunk, crc)
+                if mac is not None:
+                    mac.update(chunk)
+            yield chunk
+
+        if verify:
+            self._check_trailer(crc & 0xFFFFFFFF, mac)
+
+    def verify(self, chunk_size: int = 1 << 20) -> None:
+        """
+        Verify CRC32 and optional HMAC without producing output.
+        """
+        for _ in self.chunks(chunk_size):
+            pass
+
+    def _check_trailer(self, actual_crc: int, mac) -> None:
+        trailer = self._view[self._payload_end :]
+
+        expected_crc = _CRC_STRUCT.unpack_from(trailer)[0]
+        if actual_crc != expected_crc:
+            raise IntegrityError("CRC32 mismatch")
 
-    return header, payload
+        if mac is not None:
+            mac.update(trailer[: _CRC_STRUCT.size])
+            expected_mac = bytes(trailer[_CRC_STRUCT.size :])
+            if not hmac.compare_digest(mac.digest(), expected_mac):
+                raise IntegrityError("HMAC verification failed")
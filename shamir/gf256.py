@@ -0,0 +1,117 @@
+"""
+Scalar arithmetic over GF(256).
+
+The field is defined by the irreducible polynomial
+x^8 + x^4 + x^3 + x + 1 (0x11B) with generator 0x03, matching the Go
+reference implementation in gf256/field.go.
+
+Operations use log/exp tables. Bulk operations over whole payloads
+are provided by the GF(256) backends in shamir.backends.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+POLYNOMIAL = 0x11B
+GENERATOR = 0x03
+
+
+def _mul_no_table(a: int, b: int) -> int:
+    """
+    Multiply two field elements without tables.
+
+    Used only to build the log/exp tables.
+    """
+    product = 0
+    for _ in range(8):
+        if b & 1:
+            product ^= a
+        high = a & 0x80
+        a = (a << 1) & 0xFF
+        if high:
+            a ^= POLYNOMIAL & 0xFF
+        b >>= 1
+    return product
+
+
+def _build_tables() -> Tuple[bytes, bytes]:
+    exp = bytearray(512)
+    log = bytearray(256)
+
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x = _mul_no_table(x, GENERATOR)
+
+    # Duplicate the exp table to avoid a modulus on summed logarithms.
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+
+    return bytes(exp), bytes(log)
+
+
+EXP, LOG = _build_tables()
+
+
+def mul(a: int, b: int) -> int:
+    """Return a * b in GF(256)."""
+    if a == 0 or b == 0:
+        return 0
+    return EXP[LOG[a] + LOG[b]]
+
+
+def inv(a: int) -> int:
+    """
+    Return the multiplicative inverse of a in GF(256).
+
+    Raises ZeroDivisionError for a == 0.
+    """
+    if a == 0:
+        raise ZeroDivisionError("Zero has no inverse in GF(256)")
+    return EXP[255 - LOG[a]]
+
+
+def div(a: int, b: int) -> int:
+    """
+    Return a / b in GF(256).
+
+    Raises ZeroDivisionError for b == 0.
+    """
+    if b == 0:
+        raise ZeroDivisionError("Division by zero in GF(256)")
+    if a == 0:
+        return 0
+    return EXP[LOG[a] + 255 - LOG[b]]
+
+
+@lru_cache(maxsize=256)
+def lagrange_weights_at(xs: Tuple[int, ...], target: int) -> Tuple[int, ...]:
+    """
+    Return Lagrange basis weights at x = target for the given points.
+
+    The weights depend only on the coordinates and are cached.
+    Raises ValueError for zero or duplicate coordinates.
+    """
+    if len(set(xs)) != len(xs) or 0 in xs:
+        raise ValueError("Share indices must be distinct and non-zero")
+
+    weights = []
+    for i, xi in enumerate(xs):
+        numerator = 1
+        denominator = 1
+        for j, xj in enumerate(xs):
+            if i != j:
+                numerator = mul(numerator, target ^ xj)
+                denominator = mul(denominator, xi ^ xj)
+        weights.append(div(numerator, denominator))
+
+    return tuple(weights)
+
+
+def lagrange_weights(xs: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Return Lagrange basis weights at x = 0 for the given points.
+    """
+    return lagrange_weights_at(xs, 0)
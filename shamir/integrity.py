@@ -6,14 +6,14 @@ share format layer. It intentionally does not perform encryption
 and does not depend on the cryptographic core.
 """
 
+import os
 import zlib
 import hmac
 import hashlib
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
 
-
-class IntegrityError(Exception):
-    """Raised when integrity verification fails."""
+from .errors import ChunkIntegrityError, IntegrityError
 
 
 def crc32(data: bytes) -> int:
@@ -55,3 +55,105 @@ def verify_hmac_sha256(data: bytes, key: bytes, expected: bytes) -> None:
     actual = hmac_sha256(data, key)
     if not hmac.compare_digest(actual, expected):
         raise IntegrityError("HMAC verification failed")
+
+
+def chunk_views(data, chunk_size: int) -> List[memoryview]:
+    """
+    Split a buffer into memoryview chunks of at most chunk_size bytes.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    view = memoryview(data).cast("B")
+    return [
+        view[offset : offset + chunk_size]
+        for offset in range(0, len(view), chunk_size)
+    ]
+
+
+def _parallel_map(function: Callable, items: Sequence, workers: Optional[int]):
+    # zlib and hashlib release the GIL on large buffers, so plain
+    # threads are enough to spread checksumming across cores.
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(function, items))
+
+
+def chunk_crc32s(chunks: Sequence, workers: Optional[int] = None) -> List[int]:
+    """
+    Compute the CRC32 of every chunk, concurrently.
+    """
+    return _parallel_map(crc32, chunks, workers)
+
+
+def verify_chunk_crc32s(
+    chunks: Sequence,
+    expected: Sequence[int],
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Verify per-chunk CRC32 values, concurrently.
+
+    Raises ChunkIntegrityError listing every corrupted chunk.
+    """
+    if len(chunks) != len(expected):
+        raise IntegrityError("Chunk count mismatch")
+
+    actual = chunk_crc32s(chunks, workers)
+    bad = [i for i, (a, e) in enumerate(zip(actual, expected)) if a != e]
+    if bad:
+        raise ChunkIntegrityError("CRC32 mismatch in chunks", bad)
+
+
+def merkle_hmac_root(
+    chunks: Sequence,
+    key: bytes,
+    workers: Optional[int] = None,
+) -> bytes:
+    """
+    Compute an HMAC-SHA256 Merkle root over a sequence of chunks.
+
+    Leaves are HMAC(key, 0x00 || chunk) and computed concurrently;
+    inner nodes are HMAC(key, 0x01 || left || right). An unpaired
+    node is promoted to the next level unchanged.
+    """
+    if not chunks:
+        raise ValueError("At least one chunk is required")
+
+    def leaf(chunk) -> bytes:
+        mac = hmac.new(key, b"\x00", hashlib.sha256)
+        mac.update(chunk)
+        return mac.digest()
+
+    level = _parallel_map(leaf, chunks, workers)
+    while len(level) > 1:
+        paired = [
+            hmac.new(key, b"\x01" + level[i] + level[i + 1], hashlib.sha256).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+
+    return level[0]
+
+
+def verify_merkle_hmac_root(
+    chunks: Sequence,
+    key: bytes,
+    expected: bytes,
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Verify an HMAC-SHA256 Merkle root.
+
+    Raises IntegrityError on mismatch.
+    """
+    actual = merkle_hmac_root(chunks, key, workers)
+    if not hmac.compare_digest(actual, expected):
+        raise IntegrityError("HMAC verification failed")
@@ -0,0 +1,246 @@
+"""
+Process-pool execution of GF(256) split and combine.
+
+Byte-wise Shamir treats every secret position independently, so a
+payload can be partitioned into slices processed by separate worker
+processes. Inputs and outputs live in shared memory blocks that the
+workers attach to by name; only slice bounds cross the process
+boundary, never payload data. Results are returned as views into the
+shared output block, or written into a caller-provided SharedMemory,
+so the parent does not copy them again.
+
+pooled_engine() keeps one engine per worker count alive between calls,
+so the core pays process start-up once rather than on every call.
+
+This module requires NumPy; without it the core runs serially.
+"""
+
+import atexit
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import gf256
+from .backends.numpy_backend import interpolate_at_zero, split_bytes
+from .randomness import SystemRandomSource
+
+
+# Below this many bytes per worker, process dispatch costs more than
+# the arithmetic it saves.
+MIN_SLICE_SIZE = 1 << 16
+
+
+def _attach(name: str, shape: Tuple[int, ...]):
+    block = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+    return block, array
+
+
+def _split_slice(
+    source: str,
+    target: str,
+    length: int,
+    threshold: int,
+    xs: Tuple[int, ...],
+    start: int,
+    stop: int,
+) -> None:
+    source_block, secret = _attach(source, (length,))
+    target_block, out = _attach(target, (len(xs), length))
+    try:
+        out[:, start:stop] = split_bytes(
+            secret[start:stop].tobytes(), threshold, xs, SystemRandomSource()
+        )
+    finally:
+        del secret, out
+        source_block.close()
+        target_block.close()
+
+
+def _interpolate_slice(
+    source: str,
+    target: str,
+    length: int,
+    xs: Tuple[int, ...],
+    start: int,
+    stop: int,
+) -> None:
+    source_block, ys = _attach(source, (len(xs), length))
+    target_block, out = _attach(target, (length,))
+    try:
+        out[start:stop] = interpolate_at_zero(xs, ys[:, start:stop])
+    finally:
+        del ys, out
+        source_block.close()
+        target_block.close()
+
+
+class ProcessEngine:
+    """
+    Reusable process pool with shared memory buffers for GF(256) work.
+
+    Buffers grow to the largest payload seen and are reused across
+    calls, so streaming callers pay for allocation once. Views returned
+    from the engine's own buffers stay valid until the next call or
+    close(). An engine is not thread-safe. Use as a context manager or
+    call close() to release the pool and buffers.
+    """
+
+    def __init__(self, jobs: Optional[int] = None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+        self._blocks = {}
+
+    def __enter__(self) -> "ProcessEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown()
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    @staticmethod
+    def _external(out, shape: Tuple[int, ...]):
+        size = int(np.prod(shape))
+        if out.size < size:
+            raise ValueError("Output block too small")
+        return out.name, np.ndarray(shape, dtype=np.uint8, buffer=out.buf)
+
+    def _buffer(self, role: str, shape: Tuple[int, ...]):
+        size = int(np.prod(shape))
+        block = self._blocks.get(role)
+        if block is None or block.size < size:
+            if block is not None:
+                block.close()
+                block.unlink()
+            block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self._blocks[role] = block
+        return block.name, np.ndarray(shape, dtype=np.uint8, buffer=block.buf)
+
+    def _slices(self, length: int) -> List[Tuple[int, int]]:
+        count = max(1, min(self.jobs, length // MIN_SLICE_SIZE))
+        step = -(-length // count)
+        return [(start, min(start + step, length)) for start in range(0, length, step)]
+
+    def split(
+        self,
+        secret: bytes,
+        threshold: int,
+        xs: Sequence[int],
+        out: Optional[shared_memory.SharedMemory] = None,
+    ) -> List[memoryview]:
+        """
+        Parallel GF(256) split using the system CSPRNG.
+
+        Workers write the share rows straight into out, a SharedMemory
+        of at least len(xs) * len(secret) bytes, or into the engine's
+        own output block. Returns one memoryview row per entry of xs.
+        """
+        xs = tuple(xs)
+        length = len(secret)
+        shape = (len(xs), length)
+
+        source, secret_array = self._buffer("source", (length,))
+        if out is None:
+            target, rows = self._buffer("target", shape)
+        else:
+            target, rows = self._external(out, shape)
+        secret_array[:] = np.frombuffer(secret, dtype=np.uint8)
+
+        futures = [
+            self._pool.submit(
+                _split_slice, source, target, length, threshold, xs, start, stop
+            )
+            for start, stop in self._slices(length)
+        ]
+        for future in futures:
+            future.result()
+
+        return [row.data for row in rows]
+
+    def interpolate(
+        self,
+        xs: Sequence[int],
+        payloads: Sequence,
+        out: Optional[shared_memory.SharedMemory] = None,
+    ) -> memoryview:
+        """
+        Parallel GF(256) interpolation at x = 0.
+
+        payloads holds one equally sized buffer per entry of xs. The
+        secret is written into out, if given, or the engine's output
+        block; a memoryview of it is returned.
+        """
+        xs = tuple(xs)
+        length = len(payloads[0])
+
+        # Validate in the parent so errors surface before dispatch.
+        gf256.lagrange_weights(xs)
+
+        source, ys = self._buffer("source", (len(xs), length))
+        if out is None:
+            target, secret = self._buffer("target", (length,))
+        else:
+            target, secret = self._external(out, (length,))
+        for row, payload in zip(ys, payloads):
+            row[:] = np.frombuffer(payload, dtype=np.uint8)
+
+        futures = [
+            self._pool.submit(
+                _interpolate_slice, source, target, length, xs, start, stop
+            )
+            for start, stop in self._slices(length)
+        ]
+        for future in futures:
+            future.result()
+
+        return secret.data
+
+
+_idle: Dict[int, ProcessEngine] = {}
+_idle_lock = threading.Lock()
+
+
+@contextmanager
+def pooled_engine(jobs: int) -> Iterator[ProcessEngine]:
+    """
+    Borrow a cached engine with jobs workers.
+
+    One idle engine per worker count is kept between calls. A caller
+    that finds it in use, from another thread or an interleaved
+    stream, gets a fresh engine, which is closed on return if another
+    one has been cached in the meantime.
+    """
+    with _idle_lock:
+        engine = _idle.pop(jobs, None)
+    if engine is None:
+        engine = ProcessEngine(jobs)
+
+    try:
+        yield engine
+    finally:
+        with _idle_lock:
+            if jobs not in _idle:
+                _idle[jobs] = engine
+                engine = None
+        if engine is not None:
+            engine.close()
+
+
+@atexit.register
+def _close_idle() -> None:
+    with _idle_lock:
+        engines = list(_idle.values())
+        _idle.clear()
+    for engine in engines:
+        engine.close()
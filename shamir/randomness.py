@@ -0,0 +1,134 @@
+"""
+Randomness sources for polynomial coefficients.
+
+Coefficients are drawn in bulk into preallocated buffers rather than
+one call per element. Two sources are provided:
+
+- SystemRandomSource, backed by the operating system CSPRNG, used by
+  default for all splits;
+- HmacDrbg, a deterministic HMAC-SHA256 DRBG (NIST SP 800-90A) for
+  reproducible test vectors. It must never be used with a
+  predictable seed outside of testing.
+"""
+
+import hmac
+import os
+import struct
+from itertools import repeat
+from operator import itemgetter
+from typing import List, Union
+
+
+# Extra bytes drawn per prime-field element so that reduction modulo
+# the prime has a statistical bias below 2^-64.
+_REDUCTION_MARGIN = 8
+
+_MAX_REQUEST = 1 << 16
+
+
+class SystemRandomSource:
+    """
+    Cryptographically secure source backed by os.urandom.
+    """
+
+    def read(self, count: int) -> bytes:
+        """Return count random bytes."""
+        return os.urandom(count)
+
+    def readinto(self, buffer) -> None:
+        """Fill a writable buffer with random bytes."""
+        view = memoryview(buffer).cast("B")
+        for offset in range(0, len(view), _MAX_REQUEST):
+            end = min(offset + _MAX_REQUEST, len(view))
+            view[offset:end] = os.urandom(end - offset)
+
+
+class HmacDrbg:
+    """
+    Deterministic HMAC-SHA256 DRBG as specified in NIST SP 800-90A.
+
+    Identical seeds yield identical byte streams. Requests larger than
+    the per-call limit of the specification are served as a sequence
+    of generate calls.
+    """
+
+    def __init__(self, seed: Union[bytes, str, int], personalization: bytes = b""):
+        self._key = b"\x00" * 32
+        self._value = b"\x01" * 32
+        self._update(_seed_bytes(seed) + personalization)
+        self.reseed_counter = 1
+
+    def _update(self, provided: bytes = b"") -> None:
+        self._key = hmac.digest(self._key, self._value + b"\x00" + provided, "sha256")
+        self._value = hmac.digest(self._key, self._value, "sha256")
+        if provided:
+            self._key = hmac.digest(
+                self._key, self._value + b"\x01" + provided, "sha256"
+            )
+            self._value = hmac.digest(self._key, self._value, "sha256")
+
+    def reseed(self, entropy: bytes) -> None:
+        """Mix additional input into the generator state."""
+        self._update(entropy)
+        self.reseed_counter = 1
+
+    def _generate(self, count: int) -> bytes:
+        key = self._key
+        value = self._value
+        blocks = []
+        for _ in range(-(-count // 32)):
+            value = hmac.digest(key, value, "sha256")
+            blocks.append(value)
+
+        self._value = value
+        self._update()
+        self.reseed_counter += 1
+        return b"".join(blocks)[:count]
+
+    def read(self, count: int) -> bytes:
+        """Return the next count bytes of the stream."""
+        return b"".join(
+            self._generate(min(_MAX_REQUEST, count - offset))
+            for offset in range(0, count, _MAX_REQUEST)
+        )
+
+    def readinto(self, buffer) -> None:
+        """Fill a writable buffer with the next bytes of the stream."""
+        view = memoryview(buffer).cast("B")
+        for offset in range(0, len(view), _MAX_REQUEST):
+            end = min(offset + _MAX_REQUEST, len(view))
+            view[offset:end] = self._generate(end - offset)
+
+
+def _seed_bytes(seed: Union[bytes, str, int]) -> bytes:
+    if isinstance(seed, bytes):
+        return seed
+    if isinstance(seed, str):
+        return seed.encode("utf-8")
+    if isinstance(seed, int) and seed >= 0:
+        return seed.to_bytes(max(1, (seed.bit_length() + 7) // 8), "big")
+    raise TypeError("Seed must be bytes, str or a non-negative int")
+
+
+def source_for(seed=None):
+    """
+    Return the default source, or a DRBG when a seed is given.
+    """
+    if seed is None:
+        return SystemRandomSource()
+    return HmacDrbg(seed)
+
+
+def field_elements(source, count: int, prime: int) -> List[int]:
+    """
+    Draw count uniformly distributed elements of GF(prime).
+
+    All randomness is read in a single request; conversion to integers
+    runs through C-level iterators rather than a Python loop.
+    """
+    width = (prime.bit_length() + 7) // 8 + _REDUCTION_MARGIN
+    buffer = bytearray(count * width)
+    source.readinto(buffer)
+
+    chunks = map(itemgetter(0), struct.iter_unpack(f"{width}s", buffer))
+    return list(map(prime.__rmod__, map(int.from_bytes, chunks, repeat("big"))))
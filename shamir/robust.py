@@ -0,0 +1,164 @@
+"""
+Error-correcting reconstruction (Berlekamp-Welch).
+
+Shares of a degree k - 1 polynomial form a Reed-Solomon codeword, so
+from m > k shares up to floor((m - k) / 2) corrupted shares can be
+located and ignored in polynomial time rather than by trying every
+k-subset.
+
+Berlekamp-Welch finds an error locator E (monic, degree e) and
+Q = P * E (degree < k + e) from the linear system
+
+    Q(x_i) = y_i * E(x_i)    for every share i,
+
+then recovers P = Q / E. Shares where P disagrees with y are the
+corrupted ones.
+
+The decoder is written against a minimal FieldOps description so the
+same code serves the prime field and GF(256).
+"""
+
+from typing import Callable, List, NamedTuple, Sequence, Tuple
+
+from . import gf256
+from .errors import DecodingError
+
+
+class FieldOps(NamedTuple):
+    add: Callable[[int, int], int]
+    sub: Callable[[int, int], int]
+    mul: Callable[[int, int], int]
+    inv: Callable[[int], int]
+
+
+def prime_ops(prime: int) -> FieldOps:
+    """
+    Return FieldOps for integers modulo prime.
+    """
+    return FieldOps(
+        add=lambda a, b: (a + b) % prime,
+        sub=lambda a, b: (a - b) % prime,
+        mul=lambda a, b: a * b % prime,
+        inv=lambda a: pow(a, -1, prime),
+    )
+
+
+GF256_OPS = FieldOps(
+    add=int.__xor__,
+    sub=int.__xor__,
+    mul=gf256.mul,
+    inv=gf256.inv,
+)
+
+
+def _solve(rows: List[List[int]], unknowns: int, field: FieldOps) -> List[int]:
+    # Gauss-Jordan elimination on an augmented matrix. Free variables
+    # are set to zero; any solution yields the same P = Q / E.
+    pivot_row = 0
+    pivots = []
+
+    for column in range(unknowns):
+        for r in range(pivot_row, len(rows)):
+            if rows[r][column]:
+                break
+        else:
+            continue
+
+        rows[pivot_row], rows[r] = rows[r], rows[pivot_row]
+        pivot = rows[pivot_row]
+        scale = field.inv(pivot[column])
+        pivot[:] = [field.mul(value, scale) for value in pivot]
+
+        for r, row in enumerate(rows):
+            factor = row[column]
+            if r != pivot_row and factor:
+                row[:] = [
+                    field.sub(value, field.mul(factor, p))
+                    for value, p in zip(row, pivot)
+                ]
+
+        pivots.append(column)
+        pivot_row += 1
+
+    for row in rows[pivot_row:]:
+        if row[unknowns]:
+            raise DecodingError("Too many corrupted shares")
+
+    solution = [0] * unknowns
+    for r, column in enumerate(pivots):
+        solution[column] = rows[r][unknowns]
+    return solution
+
+
+def _divide(numerator: List[int], monic: List[int], field: FieldOps):
+    # Long division by a monic polynomial; coefficients lowest first.
+    remainder = list(numerator)
+    degree = len(monic) - 1
+    quotient = [0] * max(len(numerator) - degree, 0)
+
+    for i in range(len(quotient) - 1, -1, -1):
+        factor = remainder[i + degree]
+        quotient[i] = factor
+        if factor:
+            for j, coefficient in enumerate(monic):
+                remainder[i + j] = field.sub(
+                    remainder[i + j], field.mul(factor, coefficient)
+                )
+
+    return quotient, remainder[:degree]
+
+
+def _evaluate(coefficients: Sequence[int], x: int, field: FieldOps) -> int:
+    result = 0
+    for coefficient in reversed(coefficients):
+        result = field.add(field.mul(result, x), coefficient)
+    return result
+
+
+def berlekamp_welch(
+    xs: Sequence[int],
+    ys: Sequence[int],
+    threshold: int,
+    field: FieldOps,
+) -> Tuple[List[int], Tuple[int, ...]]:
+    """
+    Decode one codeword.
+
+    Returns the coefficients of P (lowest first, length threshold) and
+    the positions in xs whose y values disagree with P. Raises
+    DecodingError if more than floor((m - k) / 2) values are wrong.
+    """
+    m = len(xs)
+    errors = (m - threshold) // 2
+    if errors < 0:
+        raise DecodingError("Not enough shares")
+
+    unknowns = threshold + 2 * errors
+    rows = []
+    for x, y in zip(xs, ys):
+        powers = [1]
+        for _ in range(threshold + errors):
+            powers.append(field.mul(powers[-1], x))
+
+        row = powers[: threshold + errors]
+        row += [field.sub(0, field.mul(y, powers[j])) for j in range(errors)]
+        row.append(field.mul(y, powers[errors]))
+        rows.append(row)
+
+    solution = _solve(rows, unknowns, field)
+    q = solution[: threshold + errors]
+    e = solution[threshold + errors :] + [1]
+
+    p, remainder = _divide(q, e, field)
+    if any(remainder):
+        raise DecodingError("Too many corrupted shares")
+
+    bad = tuple(
+        position
+        for position, (x, y) in enumerate(zip(xs, ys))
+        if _evaluate(p, x, field) != y
+    )
+    if len(bad) > errors:
+        raise DecodingError("Too many corrupted shares")
+
+    return p, bad
@@ -0,0 +1,221 @@
+"""
+Proactive refresh and extension of serialized shares.
+
+Refreshing replaces every share of a split with a fresh share of the
+same secret by adding the evaluations of a random polynomial whose
+constant term is zero (shamir.core.refresh / refresh_shares). The
+secret is never reconstructed. All shares of a split must be refreshed
+together: refreshed and stale shares do not combine, so the functions
+here insist on a complete split.
+
+Extension issues shares at new indices from any threshold existing
+shares (shamir.core.extend / extend_shares) without touching the
+others; the new headers carry the grown share count.
+
+Shares are read and written in the format of shamir.format with their
+headers preserved, so refreshed blobs are drop-in replacements.
+"""
+
+from collections import defaultdict
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from . import core, fields
+from .errors import RefreshError, ShareFormatError
+from .format import (
+    FIELD_GF256,
+    ShareHeader,
+    decode_share,
+    encode_share,
+    grow_headers,
+)
+from .randomness import source_for
+
+
+def check_complete_split(headers: Sequence[ShareHeader]) -> ShareHeader:
+    """
+    Check that headers describe every share of one split.
+
+    A split that has been extended mixes share counts; it is complete
+    when every index up to the largest share count is present.
+    Returns the first header. Raises RefreshError otherwise.
+    """
+    if not headers:
+        raise RefreshError("No shares to refresh")
+
+    first = headers[0]
+    for header in headers[1:]:
+        if (header.threshold, header.field_id) != (
+            first.threshold,
+            first.field_id,
+        ):
+            raise RefreshError("Shares belong to different splits")
+
+    indices = set(header.share_index for header in headers)
+    if len(indices) != len(headers):
+        raise RefreshError("Duplicate share indices")
+    if len(headers) != max(header.share_count for header in headers):
+        raise RefreshError("Every share of the split must be refreshed together")
+
+    return first
+
+
+def _decode_split(blobs, mac_key):
+    decoded = [decode_share(blob, mac_key) for blob in blobs]
+    headers = [header for header, _ in decoded]
+    return check_complete_split(headers), headers, [p for _, p in decoded]
+
+
+def _prime_values(field, payloads) -> List[int]:
+    try:
+        return [field.from_bytes(payload) for payload in payloads]
+    except ValueError as exc:
+        raise ShareFormatError("Share value outside field range") from exc
+
+
+def _encode_split(headers, payloads, mac_key) -> List[bytes]:
+    return [
+        encode_share(header, payload, mac_key)
+        for header, payload in zip(headers, payloads)
+    ]
+
+
+def _refresh_split(first, headers, payloads, mac_key, seed=None) -> List[bytes]:
+    # Refreshes one already decoded split, so batch callers decode and
+    # authenticate each blob only once.
+    indices = [header.share_index for header in headers]
+
+    if first.field_id == FIELD_GF256:
+        refreshed = core.refresh(
+            list(zip(indices, payloads)), first.threshold, seed=seed
+        )
+        return _encode_split(headers, [p for _, p in refreshed], mac_key)
+
+    field = fields.prime_field(first.field_id)
+    refreshed = core.refresh_shares(
+        list(zip(indices, _prime_values(field, payloads))),
+        first.threshold,
+        rng=source_for(seed),
+        field_id=first.field_id,
+    )
+    return _encode_split(
+        headers, [field.to_bytes(y) for _, y in refreshed], mac_key
+    )
+
+
+def refresh_encoded(
+    blobs: Sequence,
+    mac_key: Optional[bytes] = None,
+    seed=None,
+) -> List[bytes]:
+    """
+    Refresh every serialized share of one split.
+
+    Returns new blobs in input order, authenticated with mac_key when
+    given. seed makes the refresh reproducible and is for tests only.
+    """
+    first, headers, payloads = _decode_split(blobs, mac_key)
+    return _refresh_split(first, headers, payloads, mac_key, seed)
+
+
+def extend_encoded(
+    blobs: Sequence,
+    count: int,
+    mac_key: Optional[bytes] = None,
+) -> List[bytes]:
+    """
+    Issue count new serialized shares from existing ones.
+
+    blobs must hold at least threshold shares of one split; the first
+    threshold are used. Shares from every earlier extension should be
+    included so that the new indices follow the largest issued one
+    (see shamir.format.grow_headers).
+    """
+    decoded = [decode_share(blob, mac_key) for blob in blobs]
+    headers = grow_headers([header for header, _ in decoded], count)
+    first = headers[0]
+
+    if len(decoded) < first.threshold:
+        raise ShareFormatError("Not enough shares to extend")
+
+    decoded = decoded[: first.threshold]
+    indices = [header.share_index for header, _ in decoded]
+    new_indices = [header.share_index for header in headers]
+
+    if first.field_id == FIELD_GF256:
+        extended = core.extend(
+            [(index, payload) for index, (_, payload) in zip(indices, decoded)],
+            first.threshold,
+            new_indices,
+        )
+        return _encode_split(headers, [p for _, p in extended], mac_key)
+
+    field = fields.prime_field(first.field_id)
+    values = _prime_values(field, [payload for _, payload in decoded])
+    extended = core.extend_shares(
+        list(zip(indices, values)),
+        first.threshold,
+        new_indices,
+        field_id=first.field_id,
+    )
+    return _encode_split(
+        headers, [field.to_bytes(y) for _, y in extended], mac_key
+    )
+
+
+def _refresh_batch(batch, mac_key) -> List[List[bytes]]:
+    results = [None] * len(batch)
+    groups = defaultdict(list)
+
+    for position, blobs in enumerate(batch):
+        first, headers, payloads = _decode_split(blobs, mac_key)
+        if first.field_id == FIELD_GF256:
+            results[position] = _refresh_split(first, headers, payloads, mac_key)
+            continue
+
+        indices = tuple(header.share_index for header in headers)
+        key = (first.field_id, first.threshold, indices)
+        groups[key].append((position, headers, payloads))
+
+    # Prime-field splits over the same indices share one batched call
+    # and one bulk randomness draw.
+    for (field_id, threshold, indices), members in groups.items():
+        field = fields.prime_field(field_id)
+        rows = [_prime_values(field, payloads) for _, _, payloads in members]
+        columns = [list(column) for column in zip(*rows)]
+        refreshed = core.refresh_many(
+            indices, columns, threshold, field_id=field_id
+        )
+
+        for member, (position, headers, _) in enumerate(members):
+            results[position] = _encode_split(
+                headers,
+                [field.to_bytes(column[member]) for column in refreshed],
+                mac_key,
+            )
+
+    return results
+
+
+def refresh_batches(
+    splits: Iterable[Sequence],
+    mac_key: Optional[bytes] = None,
+    batch_size: int = 1024,
+) -> Iterator[List[bytes]]:
+    """
+    Lazily refresh many splits.
+
+    splits yields one sequence of serialized shares per split; the
+    refreshed sequences are yielded in the same order. Input is
+    consumed batch_size splits at a time, so arbitrarily many splits
+    can be rotated in one pass.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    iterator = iter(splits)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield from _refresh_batch(batch, mac_key)
@@ -0,0 +1,223 @@
+"""
+Compact in-memory share types.
+
+Share is a small value object for a single share. ShareSet keeps the
+shares of one sharing column-wise: indices in an unsigned integer
+array and fixed-width payloads back to back in one bytearray, so each
+share costs its payload and a four-byte index instead of a tuple and a
+separate payload object.
+
+Both unpack as (index, payload) pairs, so they can be passed wherever
+the core accepts pairs.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .errors import DuplicateShareError
+
+
+class Share:
+    """
+    A single share: index (x coordinate), payload and session id.
+
+    payload is a bytes-like object for GF(256) shares and an int for
+    prime-field shares. id is an alias of index for the operational
+    layer. The payload is deliberately left out of repr().
+    """
+
+    __slots__ = ("index", "payload", "session_id")
+
+    def __init__(self, index: int, payload, session_id: Optional[str] = None):
+        self.index = index
+        self.payload = payload
+        self.session_id = session_id
+
+    @property
+    def id(self) -> int:
+        return self.index
+
+    def __iter__(self) -> Iterator:
+        yield self.index
+        yield self.payload
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Share):
+            return NotImplemented
+        return (
+            self.index == other.index
+            and self.payload == other.payload
+            and self.session_id == other.session_id
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Share(index={self.index}, session_id={self.session_id!r})"
+
+
+class ShareSet:
+    """
+    Column-wise collection of shares of a single secret.
+
+    Payloads are fixed-width: payload_size bytes each, or, with
+    integer=True, ints stored big-endian in payload_size bytes.
+    Membership and duplicate checks binary-search the indices, so
+    memory does not depend on how large or sparse they are. Shares
+    added in increasing index order, as split produces them, need no
+    lookup structure at all; otherwise a sorted copy of the indices
+    and their rows is kept, at eight more bytes per share.
+
+    Iteration yields Share objects materialized on demand.
+    """
+
+    __slots__ = (
+        "session_id",
+        "payload_size",
+        "integer",
+        "_indices",
+        "_payloads",
+        "_sorted",
+        "_rows",
+    )
+
+    def __init__(
+        self,
+        payload_size: int,
+        session_id: Optional[str] = None,
+        integer: bool = False,
+    ):
+        if payload_size < 1:
+            raise ValueError("payload_size must be positive")
+
+        self.session_id = session_id
+        self.payload_size = payload_size
+        self.integer = integer
+        self._indices = array("I")
+        self._payloads = bytearray()
+        # None while _indices is increasing and can be searched itself;
+        # after the first out-of-order index, the indices in sorted
+        # order and the row of each.
+        self._sorted = None
+        self._rows = None
+
+    @classmethod
+    def from_shares(
+        cls,
+        shares: Iterable,
+        session_id: Optional[str] = None,
+        payload_size: Optional[int] = None,
+    ) -> "ShareSet":
+        """
+        Build a set from (index, payload) pairs or Share objects.
+
+        The payload kind and, unless given, the width are inferred
+        from the shares. Raises DuplicateShareError on repeated
+        indices.
+        """
+        if hasattr(shares, "items"):
+            shares = shares.items()
+        shares = list(shares)
+        if not shares:
+            raise ValueError("At least one share is required")
+
+        integer = isinstance(shares[0][1], int)
+        if payload_size is None:
+            if integer:
+                payload_size = max(
+                    (payload.bit_length() + 7) // 8 for _, payload in shares
+                ) or 1
+            else:
+                payload_size = len(shares[0][1])
+
+        share_set = cls(payload_size, session_id, integer)
+        for index, payload in shares:
+            share_set.add(index, payload)
+        return share_set
+
+    def add(self, index: int, payload) -> None:
+        """
+        Append a share.
+
+        Raises DuplicateShareError if index is already present and
+        ValueError for an out-of-range index or mis-sized payload.
+        """
+        if not 1 <= index <= 0xFFFFFFFF:
+            raise ValueError("Share index out of range")
+
+        keys = self._indices if self._sorted is None else self._sorted
+        position = bisect_left(keys, index)
+        if position < len(keys) and keys[position] == index:
+            raise DuplicateShareError(f"Duplicate share index {index}")
+
+        if self.integer:
+            try:
+                data = payload.to_bytes(self.payload_size, "big")
+            except (AttributeError, OverflowError) as exc:
+                raise ValueError("Payload does not fit payload_size") from exc
+        else:
+            data = payload
+            if len(data) != self.payload_size:
+                raise ValueError("Payload does not match payload_size")
+
+        self._payloads += data
+        row = len(self._indices)
+        self._indices.append(index)
+        if self._sorted is None:
+            if position == row:
+                return
+            self._sorted = array("I", self._indices[:row])
+            self._rows = array("I", range(row))
+        self._sorted.insert(position, index)
+        self._rows.insert(position, row)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def _row(self, index: int) -> int:
+        # Row of index, or -1 if absent.
+        keys = self._indices if self._sorted is None else self._sorted
+        position = bisect_left(keys, index)
+        if position == len(keys) or keys[position] != index:
+            return -1
+        return position if self._rows is None else self._rows[position]
+
+    def __contains__(self, index) -> bool:
+        return isinstance(index, int) and self._row(index) >= 0
+
+    def _payload_at(self, row: int):
+        start = row * self.payload_size
+        data = bytes(self._payloads[start : start + self.payload_size])
+        return int.from_bytes(data, "big") if self.integer else data
+
+    def get(self, index: int) -> Optional[Share]:
+        """
+        Return the share with the given index, or None.
+        """
+        row = self._row(index) if isinstance(index, int) else -1
+        if row < 0:
+            return None
+        return Share(index, self._payload_at(row), self.session_id)
+
+    def __iter__(self) -> Iterator[Share]:
+        for row, index in enumerate(self._indices):
+            yield Share(index, self._payload_at(row), self.session_id)
+
+    @property
+    def indices(self) -> Tuple[int, ...]:
+        return tuple(self._indices)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total payload size in bytes.
+        """
+        return len(self._payloads)
+
+    def pairs(self) -> Iterator[Tuple[int, object]]:
+        """
+        Yield (index, payload) tuples in insertion order.
+        """
+        for row, index in enumerate(self._indices):
+            yield index, self._payload_at(row)
@@ -0,0 +1,486 @@
+"""
+Verifiable secret sharing (Feldman and Pedersen).
+
+Shares live in GF(q), where q is the order of the subgroup generated
+by g = 2 modulo the RFC 3526 2048-bit safe prime p = 2q + 1
+(shamir.fields.MODP2048). At split time the dealer publishes one
+commitment per polynomial coefficient:
+
+- Feldman: C_j = g^a_j. Binding and cheap, but C_0 = g^secret, so
+  the secret is hidden only as well as discrete logarithms are hard.
+- Pedersen: C_j = g^a_j * h^b_j for a second random polynomial b; the
+  commitments reveal nothing about the secret, and every share carries
+  its blinding value b(x).
+
+A share (x, y[, t]) is valid when g^y [* h^t] equals the product of
+C_j^(x^j). verify_shares checks m shares at once with random 128-bit
+weights r_i:
+
+    g^(sum r_i y_i) [* h^(sum r_i t_i)] == prod_j C_j^(sum_i r_i x_i^j)
+
+which is one fixed-base exponentiation per generator, served from
+precomputed window tables, and one multi-exponentiation over the k
+commitments with a shared chain of squarings, instead of m separate
+checks. Every commitment is first checked to lie in the order-q
+subgroup (a Legendre symbol, on decoding and before verification);
+given that, a set containing an invalid share passes with probability
+at most 2^-128. A failing batch is bisected to name the bad shares.
+
+Commitments are public. They are serialized next to the shares with
+encode_commitments; Feldman shares themselves use the regular share
+format with field_id FIELD_MODP2048.
+"""
+
+import hashlib
+import struct
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from . import backends, fields
+from .errors import ShareFormatError, VerificationError
+from .exceptions import (
+    InvalidSecretError,
+    InvalidShareCountError,
+    InvalidThresholdError,
+)
+from .format import decode_share
+from .integrity import verify_crc32
+from .randomness import SystemRandomSource, field_elements
+
+
+P = fields.MODP2048_PRIME
+Q = fields.MODP2048_ORDER
+G = 2
+
+FELDMAN = 0x01
+PEDERSEN = 0x02
+
+MAGIC = b"SHVC"
+VERSION = 0x01
+
+_HEADER_STRUCT = struct.Struct(">4sBBBB")
+# magic, version, scheme, field_id, threshold
+
+_CRC_STRUCT = struct.Struct(">I")
+
+_ELEMENT_SIZE = (P.bit_length() + 7) // 8
+
+# Batch weights of this many bits bound the chance that a set with an
+# invalid share passes to 2^-128.
+_BATCH_BITS = 128
+
+# 4-bit windows: 16 entries per table row, 2 MiB per fixed base.
+_WINDOW = 4
+
+
+@dataclass(frozen=True)
+class Commitments:
+    scheme: int
+    values: Tuple[int, ...]
+
+    @property
+    def threshold(self) -> int:
+        return len(self.values)
+
+
+class _FixedBase:
+    """
+    Window table for exponentiations of a single base modulo P.
+
+    Row i holds base^(d * 2^(w * i)) for every digit d, so raising the
+    base to an exponent below 2^bits takes one multiplication per
+    window and no squarings.
+    """
+
+    def __init__(self, base: int, bits: int, window: int = _WINDOW):
+        element = backends.prime_backend().element
+        self._window = window
+        self._mask = (1 << window) - 1
+
+        rows = []
+        current = element(base)
+        for _ in range((bits + window - 1) // window):
+            row = [element(1)]
+            for _ in range(self._mask):
+                row.append(row[-1] * current % P)
+            rows.append(row)
+            current = row[-1] * current % P
+        self._rows = rows
+
+    def pow(self, exponent: int):
+        result = 1
+        for row in self._rows:
+            if not exponent:
+                break
+            digit = exponent & self._mask
+            if digit:
+                result = result * row[digit] % P
+            exponent >>= self._window
+        return result
+
+
+def _derive_h() -> int:
+    # A hash squared into the order-q subgroup: nobody knows log_g(h),
+    # which is what makes Pedersen commitments binding.
+    counter = 0
+    while True:
+        digest = b"".join(
+            hashlib.sha256(b"shamir.vss.h/%d/%d" % (counter, block)).digest()
+            for block in range(9)
+        )
+        h = pow(int.from_bytes(digest, "big") % P, 2, P)
+        if h > 1:
+            return h
+        counter += 1
+
+
+H = _derive_h()
+
+
+@lru_cache(maxsize=None)
+def _generator_table(base: int) -> _FixedBase:
+    # Built on first use; exponents are reduced mod Q before lookup.
+    return _FixedBase(base, Q.bit_length())
+
+
+def _multi_exp(bases: Sequence[int], exponents: Sequence[int]):
+    # Straus interleaving: one shared chain of squarings for all bases
+    # and one table lookup per base per window.
+    element = backends.prime_backend().element
+    mask = (1 << _WINDOW) - 1
+
+    tables = []
+    for base in bases:
+        row = [element(1), element(base)]
+        for _ in range(mask - 1):
+            row.append(row[-1] * row[1] % P)
+        tables.append(row)
+
+    top = max(exponent.bit_length() for exponent in exponents)
+    result = 1
+    for shift in reversed(range(0, top, _WINDOW)):
+        for _ in range(_WINDOW):
+            result = result * result % P
+        for table, exponent in zip(tables, exponents):
+            digit = (exponent >> shift) & mask
+            if digit:
+                result = result * table[digit] % P
+    return result
+
+
+def _validate_split(secret, threshold, shares_count):
+    if threshold < 2:
+        raise InvalidThresholdError(
+            "Threshold must be at least 2"
+        )
+
+    if threshold > shares_count:
+        raise InvalidShareCountError(
+            "Threshold cannot exceed number of shares"
+        )
+
+    if shares_count > 255:
+        raise InvalidShareCountError(
+            "Verifiable splits support at most 255 shares"
+        )
+
+    if not 0 <= secret < Q:
+        raise InvalidSecretError(
+            "Secret must be within the group order"
+        )
+
+
+def _evaluate(coefficients, x):
+    result = 0
+    for coefficient in reversed(coefficients):
+        result = (result * x + coefficient) % Q
+    return result
+
+
+def feldman_split(secret, threshold, shares_count, rng=None):
+    """
+    Split secret in GF(q) and commit to the sharing polynomial.
+
+    Returns (shares, commitments) with shares as (x, y) pairs for
+    x = 1..shares_count.
+    """
+    _validate_split(secret, threshold, shares_count)
+
+    source = rng or SystemRandomSource()
+    coefficients = [secret] + field_elements(source, threshold - 1, Q)
+
+    g = _generator_table(G)
+    commitments = Commitments(
+        FELDMAN, tuple(int(g.pow(a)) for a in coefficients)
+    )
+    shares = [
+        (x, _evaluate(coefficients, x)) for x in range(1, shares_count + 1)
+    ]
+    return shares, commitments
+
+
+def pedersen_split(secret, threshold, shares_count, rng=None):
+    """
+    Split secret in GF(q) with hiding Pedersen commitments.
+
+    Returns (shares, commitments) with shares as (x, y, t) triples,
+    t being the blinding value that verification requires.
+    """
+    _validate_split(secret, threshold, shares_count)
+
+    source = rng or SystemRandomSource()
+    coefficients = [secret] + field_elements(source, threshold - 1, Q)
+    blinding = field_elements(source, threshold, Q)
+
+    g = _generator_table(G)
+    h = _generator_table(H)
+    commitments = Commitments(
+        PEDERSEN,
+        tuple(
+            int(g.pow(a) * h.pow(b) % P)
+            for a, b in zip(coefficients, blinding)
+        ),
+    )
+    shares = [
+        (x, _evaluate(coefficients, x), _evaluate(blinding, x))
+        for x in range(1, shares_count + 1)
+    ]
+    return shares, commitments
+
+
+def _jacobi(a: int, n: int) -> int:
+    # Binary Jacobi symbol (a / n) for odd n > 0; far cheaper than the
+    # full exponentiation a^((n - 1) / 2) mod n.
+    a %= n
+    result = 1
+    while a:
+        trailing = (a & -a).bit_length() - 1
+        a >>= trailing
+        if trailing & 1 and n & 7 in (3, 5):
+            result = -result
+        if a & n & 3 == 3:
+            result = -result
+        a, n = n % a, a
+    return result if n == 1 else 0
+
+
+def _in_subgroup(value: int) -> bool:
+    # For the safe prime P the order-q subgroup is exactly the set of
+    # quadratic residues, so membership is a Legendre symbol of 1.
+    return 0 < value < P and _jacobi(value, P) == 1
+
+
+@lru_cache(maxsize=256)
+def _check_commitments(commitments: Commitments) -> None:
+    # A commitment outside the subgroup has a component of order 2 that
+    # random batch weights cancel half the time, so the batch check is
+    # only sound once every commitment is known to lie in it.
+    if commitments.scheme not in (FELDMAN, PEDERSEN):
+        raise VerificationError("Unknown commitment scheme")
+    if not all(map(_in_subgroup, commitments.values)):
+        raise VerificationError("Commitment outside the prime-order subgroup")
+
+
+def _check_shapes(shares, commitments):
+    width = 3 if commitments.scheme == PEDERSEN else 2
+    for share in shares:
+        if len(share) != width:
+            raise VerificationError(
+                "Pedersen shares are (index, value, blinding) triples, "
+                "Feldman shares (index, value) pairs"
+            )
+
+
+def _in_range(share) -> bool:
+    x, *values = share
+    return 0 < x < Q and all(0 <= value < Q for value in values)
+
+
+def _committed_value(commitments, x):
+    # prod C_j^(x^j) by Horner's rule; x is a small share index, so
+    # every step is a short exponentiation.
+    result = 1
+    for commitment in reversed(commitments.values):
+        result = pow(result, x, P) * commitment % P
+    return result
+
+
+def _generator_side(commitments, value, blinding):
+    result = _generator_table(G).pow(value % Q)
+    if commitments.scheme == PEDERSEN:
+        result = result * _generator_table(H).pow(blinding % Q) % P
+    return result
+
+
+def verify_share(share, commitments: Commitments) -> bool:
+    """
+    Check a single share against the dealer's commitments.
+
+    Raises VerificationError if a commitment is not in the order-q
+    subgroup.
+    """
+    _check_commitments(commitments)
+    _check_shapes([share], commitments)
+    if not _in_range(share):
+        return False
+
+    x, value, *blinding = share
+    return _generator_side(
+        commitments, value, blinding[0] if blinding else 0
+    ) == _committed_value(commitments, x)
+
+
+def _batch_holds(shares, weights, commitments) -> bool:
+    value = 0
+    blinding = 0
+    # Left unreduced, these exponents stay around 128 + 8k bits for
+    # share indices below 256, which keeps the squaring chain short.
+    exponents = [0] * commitments.threshold
+
+    for (x, y, *t), weight in zip(shares, weights):
+        value += weight * y
+        if t:
+            blinding += weight * t[0]
+        power = weight
+        for j in range(commitments.threshold):
+            exponents[j] += power
+            power *= x
+
+    return _generator_side(commitments, value, blinding) == _multi_exp(
+        commitments.values, exponents
+    )
+
+
+def _locate_invalid(positions, shares, weights, commitments) -> List[int]:
+    if _batch_holds(
+        [shares[i] for i in positions],
+        [weights[i] for i in positions],
+        commitments,
+    ):
+        return []
+    if len(positions) == 1:
+        return list(positions)
+
+    middle = len(positions) // 2
+    return _locate_invalid(
+        positions[:middle], shares, weights, commitments
+    ) + _locate_invalid(positions[middle:], shares, weights, commitments)
+
+
+def verify_shares(shares: Sequence, commitments: Commitments, rng=None) -> List[int]:
+    """
+    Check many shares against commitments in one batch.
+
+    Returns the indices of the shares that fail, in input order; an
+    empty list means every share is valid. Raises VerificationError
+    if a commitment is not in the order-q subgroup.
+    """
+    shares = list(shares)
+    _check_commitments(commitments)
+    _check_shapes(shares, commitments)
+
+    invalid = [share[0] for share in shares if not _in_range(share)]
+    candidates = [share for share in shares if _in_range(share)]
+    if not candidates:
+        return invalid
+
+    source = rng or SystemRandomSource()
+    weights = field_elements(source, len(candidates), 1 << _BATCH_BITS)
+
+    failed = set(
+        candidates[position][0]
+        for position in _locate_invalid(
+            list(range(len(candidates))), candidates, weights, commitments
+        )
+    )
+    failed.update(invalid)
+    return [share[0] for share in shares if share[0] in failed]
+
+
+def encode_commitments(commitments: Commitments) -> bytes:
+    """
+    Serialize commitments as a self-describing blob with a CRC32.
+    """
+    if commitments.scheme not in (FELDMAN, PEDERSEN):
+        raise ShareFormatError("Unknown commitment scheme")
+    if not 2 <= commitments.threshold <= 255:
+        raise ShareFormatError("Invalid commitment count")
+
+    body = _HEADER_STRUCT.pack(
+        MAGIC,
+        VERSION,
+        commitments.scheme,
+        fields.FIELD_MODP2048,
+        commitments.threshold,
+    ) + b"".join(
+        value.to_bytes(_ELEMENT_SIZE, "big") for value in commitments.values
+    )
+    return body + _CRC_STRUCT.pack(zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def decode_commitments(data) -> Commitments:
+    """
+    Parse and validate serialized commitments.
+
+    Structural problems raise ShareFormatError and a CRC mismatch
+    raises IntegrityError.
+    """
+    data = bytes(data)
+    if len(data) < _HEADER_STRUCT.size + _CRC_STRUCT.size:
+        raise ShareFormatError("Commitment data too short")
+
+    magic, version, scheme, field_id, threshold = _HEADER_STRUCT.unpack_from(data)
+    if magic != MAGIC:
+        raise ShareFormatError("Invalid magic")
+    if version != VERSION:
+        raise ShareFormatError(f"Unsupported version: {version}")
+    if scheme not in (FELDMAN, PEDERSEN):
+        raise ShareFormatError("Unknown commitment scheme")
+    if field_id != fields.FIELD_MODP2048:
+        raise ShareFormatError("Unsupported field identifier")
+    if threshold < 2:
+        raise ShareFormatError("Invalid commitment count")
+
+    end = _HEADER_STRUCT.size + threshold * _ELEMENT_SIZE
+    if len(data) != end + _CRC_STRUCT.size:
+        raise ShareFormatError("Commitment data has the wrong length")
+    verify_crc32(data[:end], _CRC_STRUCT.unpack_from(data, end)[0])
+
+    values = tuple(
+        int.from_bytes(data[offset : offset + _ELEMENT_SIZE], "big")
+        for offset in range(_HEADER_STRUCT.size, end, _ELEMENT_SIZE)
+    )
+    if not all(map(_in_subgroup, values)):
+        raise ShareFormatError("Commitment outside the prime-order subgroup")
+
+    return Commitments(scheme, values)
+
+
+def verify_encoded(blobs: Sequence, commitments, mac_key=None) -> List[int]:
+    """
+    Check serialized Feldman shares against commitments.
+
+    commitments may be a Commitments or its serialized form. Returns
+    the indices of the shares that fail, as verify_shares does.
+    """
+    if not isinstance(commitments, Commitments):
+        commitments = decode_commitments(commitments)
+    if commitments.scheme != FELDMAN:
+        raise VerificationError(
+            "Serialized shares carry no blinding values; "
+            "only Feldman commitments apply"
+        )
+
+    shares = []
+    for blob in blobs:
+        header, payload = decode_share(blob, mac_key)
+        if (header.field_id, header.threshold) != (
+            fields.FIELD_MODP2048,
+            commitments.threshold,
+        ):
+            raise VerificationError("Share does not belong to the committed split")
+        shares.append((header.share_index, int.from_bytes(payload, "big")))
+
+    return verify_shares(shares, commitments)
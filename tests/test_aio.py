@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from operations import metrics
+from operations.async_lifecycle import async_reconstruct as lifecycle_reconstruct
+from operations.async_lifecycle import async_split as lifecycle_split
+from operations.context import OperationContext
+from shamir.aio import (
+    Offloader,
+    async_combine,
+    async_reconstruct_many,
+    async_reconstruct_secret,
+    async_split,
+    async_split_secret,
+)
+from shamir.core import split_many
+
+
+def test_async_byte_roundtrip():
+    async def scenario():
+        shares = await async_split(b"async-secret", 2, 3)
+        return await async_combine(shares[1:])
+
+    assert asyncio.run(scenario()) == b"async-secret"
+
+
+def test_async_prime_roundtrip_and_batch():
+    async def scenario():
+        shares = await async_split_secret(4242, 3, 5)
+        single = await async_reconstruct_secret(shares[:3])
+
+        columns = split_many(range(100), 2, 3)
+        many = await async_reconstruct_many((1, 3), [columns[1], columns[3]], batch_size=7)
+        return single, many
+
+    single, many = asyncio.run(scenario())
+    assert single == 4242
+    assert many == list(range(100))
+
+
+def test_offloader_bounds_concurrency():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    async def scenario():
+        offloader = Offloader(max_pending=2)
+        await asyncio.gather(*(offloader.run(work) for _ in range(10)))
+
+    asyncio.run(scenario())
+    assert peak <= 2
+
+
+def test_offloader_timeout_keeps_loop_responsive():
+    async def scenario():
+        offloader = Offloader(timeout=0.05)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.ensure_future(ticker())
+        with pytest.raises(asyncio.TimeoutError):
+            await offloader.run(time.sleep, 0.3)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) > 3
+
+
+def test_async_lifecycle_reports_timeout():
+    context = OperationContext(
+        session_id="s", threshold=1, total_shares=1, algorithm_version="v1"
+    )
+
+    class Share:
+        id = 1
+        session_id = "s"
+
+    async def scenario():
+        return await lifecycle_reconstruct(
+            [Share()], context, lambda shares: time.sleep(0.3), timeout=0.05
+        )
+
+    class Sink(metrics.MetricsSink):
+        def __init__(self):
+            self.results = []
+
+        def record(self, result, context):
+            self.results.append(result)
+
+    sink = Sink()
+    metrics.register_sink(sink)
+    try:
+        result, secret = asyncio.run(scenario())
+    finally:
+        metrics.unregister_sink(sink)
+
+    # asyncio.run waits for the abandoned stage; its late result must
+    # not be reported next to the timeout.
+    assert secret is None
+    assert result.error_code == "OPERATION_TIMEOUT"
+    assert result.duration is not None
+    assert [(r.stage.value, r.success) for r in sink.results] == [
+        ("verify", True),
+        ("reconstruct", False),
+    ]
+    assert sink.results[-1] is result
+
+
+def test_async_lifecycle_split_timeout_is_reported_once():
+    context = OperationContext(
+        session_id="s", threshold=2, total_shares=3, algorithm_version="v1"
+    )
+
+    def slow_splitter(secret, threshold, total):
+        time.sleep(0.2)
+        return [secret] * total
+
+    class Sink(metrics.MetricsSink):
+        def __init__(self):
+            self.results = []
+
+        def record(self, result, context):
+            self.results.append(result)
+
+    async def scenario():
+        return await lifecycle_split(
+            b"secret", context, slow_splitter, timeout=0.02
+        )
+
+    sink = Sink()
+    metrics.register_sink(sink)
+    try:
+        result, shares = asyncio.run(scenario())
+    finally:
+        metrics.unregister_sink(sink)
+
+    assert shares is None
+    assert [r.error_code for r in sink.results] == ["OPERATION_TIMEOUT"]
+    assert sink.results[0].payload_bytes == len(b"secret")
+
+
+def test_async_reconstruct_many_times_out():
+    columns = split_many(range(10), 2, 3)
+
+    async def scenario():
+        offloader = Offloader()
+        return await async_reconstruct_many(
+            (1, 2), [columns[1], columns[2]], batch_size=1,
+            offloader=offloader, timeout=0,
+        )
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from shamir import backends
+from shamir.backends import pure
+from shamir.core import (
+    combine,
+    reconstruct_many,
+    reconstruct_secret,
+    split,
+    split_many,
+    split_secret,
+)
+from shamir.errors import BackendError
+from shamir.randomness import HmacDrbg
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+AVAILABLE = backends.available()
+
+
+@pytest.fixture
+def restore_backends():
+    yield
+    backends.use()
+
+
+@pytest.mark.parametrize("name", AVAILABLE["gf256"])
+def test_gf256_backends_match_reference(name):
+    backend = backends._load("gf256", name)
+    secret = os.urandom(257)
+    xs = (1, 2, 3, 7, 255)
+
+    expected = pure.GF256_BACKEND.split(secret, 3, xs, HmacDrbg(b"vector"))
+    assert backend.split(secret, 3, xs, HmacDrbg(b"vector")) == expected
+
+    for target in (0, 9):
+        assert backend.interpolate(xs[:3], expected[:3], target) == (
+            pure.GF256_BACKEND.interpolate(xs[:3], expected[:3], target)
+        )
+    assert backend.interpolate(xs[2:], expected[2:]) == secret
+
+
+@pytest.mark.parametrize("name", AVAILABLE["prime"])
+def test_prime_backends_match_reference(name, restore_backends):
+    backends.use(["pure"])
+    reference = split_secret(31337, 4, 7, rng=HmacDrbg(b"prime"))
+    columns = split_many(range(50), 3, 5, rng=HmacDrbg(b"many"))
+
+    backends.use([name])
+    assert split_secret(31337, 4, 7, rng=HmacDrbg(b"prime")) == reference
+    assert split_many(range(50), 3, 5, rng=HmacDrbg(b"many")) == columns
+
+    result = reconstruct_secret(reference[2:6])
+    assert result == 31337 and type(result) is int
+    assert reconstruct_many((2, 4, 5), [columns[2], columns[4], columns[5]]) == list(
+        range(50)
+    )
+
+
+def test_core_roundtrip_on_pure_backends(restore_backends):
+    backends.use(["pure"])
+    assert backends.gf256_backend().name == "pure"
+    assert backends.prime_backend().name == "pure"
+
+    shares = split(b"fallback", 3, 5)
+    assert combine(shares[1:4]) == b"fallback"
+    assert reconstruct_secret(split_secret(77, 2, 3)[1:]) == 77
+
+
+def test_unknown_backend_is_rejected(restore_backends):
+    with pytest.raises(BackendError):
+        backends.use(["no-such-backend"])
+
+
+def test_environment_override():
+    command = (
+        "from shamir import backends;"
+        "print(backends.prime_backend().name, backends.gf256_backend().name)"
+    )
+    env = dict(os.environ, SHAMIR_BACKEND="pure")
+    result = subprocess.run(
+        [sys.executable, "-c", command],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.split() == ["pure", "pure"]
+
+    env["SHAMIR_BACKEND"] = "no-such-backend"
+    result = subprocess.run(
+        [sys.executable, "-c", command],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "BackendError" in result.stderr
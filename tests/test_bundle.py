@@ -0,0 +1,119 @@
+import pytest
+
+from shamir.bundle import (
+    encode_bundle,
+    encode_chunked_share,
+    decode_chunked_share,
+    BundleReader,
+)
+from shamir.errors import ChunkIntegrityError
+from shamir.format import encode_share, decode_share, ShareHeader, ShareFormatError
+from shamir.integrity import IntegrityError
+
+
+def make_entries(count=50):
+    return [
+        (
+            ShareHeader(threshold=2, share_count=3, share_index=1),
+            sequence,
+            f"payload-{sequence}".encode(),
+        )
+        for sequence in range(count)
+    ]
+
+
+def test_bundle_roundtrip():
+    entries = make_entries()
+    reader = BundleReader(encode_bundle(entries))
+
+    assert len(reader) == len(entries)
+    for (header, sequence, payload), (entry, view) in zip(entries, reader):
+        assert entry.header == header
+        assert entry.sequence == sequence
+        assert view == payload
+
+
+def test_bundle_random_access():
+    entries = make_entries()
+    reader = BundleReader(memoryview(encode_bundle(entries)))
+
+    entry, payload = reader.payload(37)
+    assert entry.sequence == 37
+    assert payload == b"payload-37"
+
+    with pytest.raises(IndexError):
+        reader.entry(len(entries))
+
+
+def test_bundle_localizes_payload_corruption():
+    encoded = bytearray(encode_bundle(make_entries()))
+    entry = BundleReader(encoded).entry(10)
+    encoded[entry.offset] ^= 0xFF
+
+    reader = BundleReader(encoded)
+    reader.payload(9)
+    reader.payload(11)
+    with pytest.raises(IntegrityError):
+        reader.payload(10)
+
+
+def test_bundle_toc_corruption_detected():
+    encoded = bytearray(encode_bundle(make_entries()))
+    encoded[20] ^= 0x01
+
+    with pytest.raises(IntegrityError):
+        BundleReader(encoded)
+
+
+def test_bundle_mac():
+    encoded = encode_bundle(make_entries(), mac_key=b"key-a")
+
+    BundleReader(encoded, mac_key=b"key-a")
+    with pytest.raises(IntegrityError):
+        BundleReader(encoded, mac_key=b"key-b")
+    with pytest.raises(IntegrityError):
+        BundleReader(encode_bundle(make_entries()), mac_key=b"key-a")
+
+
+def test_v1_share_is_not_a_bundle():
+    header = ShareHeader(threshold=2, share_count=3, share_index=1)
+    encoded = encode_share(header, b"payload")
+
+    assert decode_share(encoded)[1] == b"payload"
+    with pytest.raises(ShareFormatError):
+        BundleReader(encoded)
+
+
+def test_chunked_share_roundtrip_with_merkle_root():
+    header = ShareHeader(threshold=2, share_count=3, share_index=2)
+    payload = bytes(range(256)) * 100
+
+    encoded = encode_chunked_share(header, payload, chunk_size=1000, mac_key=b"k")
+    decoded_header, decoded = decode_chunked_share(encoded, mac_key=b"k", workers=4)
+
+    assert decoded_header == header
+    assert decoded == payload
+
+
+def test_chunked_share_reports_corrupted_chunks():
+    header = ShareHeader(threshold=2, share_count=3, share_index=2)
+    encoded = bytearray(encode_chunked_share(header, b"x" * 10000, chunk_size=1000))
+
+    reader = BundleReader(encoded)
+    for index in (3, 7):
+        encoded[reader.entry(index).offset + 5] ^= 0x01
+
+    with pytest.raises(ChunkIntegrityError) as excinfo:
+        decode_chunked_share(encoded, workers=4)
+    assert excinfo.value.chunks == (3, 7)
+
+
+def test_chunked_share_merkle_root_detects_tampering():
+    header = ShareHeader(threshold=2, share_count=3, share_index=2)
+    encoded = bytearray(
+        encode_chunked_share(header, b"x" * 10000, chunk_size=1000, mac_key=b"k")
+    )
+    encoded[-40] ^= 0x01
+
+    with pytest.raises(IntegrityError):
+        decode_chunked_share(encoded, mac_key=b"k")
@@ -1,6 +1,5 @@
 import subprocess
 import sys
-import json
 import tempfile
 from pathlib import Path
 
@@ -23,7 +22,7 @@ def test_cli_split_and_combine_roundtrip():
         tmp = Path(tmp)
 
         secret_file = tmp / "secret.bin"
-        shares_file = tmp / "shares.json"
+        prefix = tmp / "share"
         output_file = tmp / "recovered.bin"
 
         secret_file.write_bytes(secret)
@@ -32,48 +31,181 @@ def test_cli_split_and_combine_roundtrip():
             [
                 "split",
                 "--threshold", str(threshold),
-                "--shares", str(shares),
+                "--count", str(shares),
                 "--input", str(secret_file),
-                "--output", str(shares_file),
+                "--output", str(prefix),
             ]
         )
 
-        assert split.returncode == 0
-        assert shares_file.exists()
+        assert split.returncode == 0, split.stderr
+        assert all(Path(f"{prefix}.{i}").exists() for i in range(1, shares + 1))
 
         combine = run_cli(
             [
                 "combine",
-                "--threshold", str(threshold),
-                "--input", str(shares_file),
+                "--inputs", f"{prefix}.1", f"{prefix}.3",
                 "--output", str(output_file),
             ]
         )
 
-        assert combine.returncode == 0
+        assert combine.returncode == 0, combine.stderr
         assert output_file.read_bytes() == secret
 
 
-def test_cli_split_rejects_invalid_threshold():
-    result = run_cli(
-        [
-            "split",
-            "--threshold", "5",
-            "--shares", "3",
-        ],
+def test_cli_streaming_split_from_stdin():
+    secret = bytes(range(256)) * 64
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / "share"
+        output_file = Path(tmp) / "recovered.bin"
+
+        split = run_cli(
+            ["split", "-k", "2", "-n", "3", "-o", str(prefix),
+             "--chunk-size", "1000"],
+            input_data=secret,
+        )
+        assert split.returncode == 0, split.stderr
+
+        combine = run_cli(
+            ["combine", "-i", f"{prefix}.1", f"{prefix}.3",
+             "-o", str(output_file)]
+        )
+        assert combine.returncode == 0, combine.stderr
+        assert output_file.read_bytes() == secret
+
+
+def test_cli_rejects_non_positive_chunk_size():
+    split = run_cli(
+        ["split", "-k", "2", "-n", "3", "--chunk-size", "0"],
         input_data=b"secret",
     )
+    assert split.returncode != 0
+    assert b"--chunk-size" in split.stderr
+
+
+def test_cli_split_failure_keeps_files_it_did_not_write():
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / "share"
+        Path(f"{prefix}.2").mkdir()
+        Path(f"{prefix}.3").write_bytes(b"unrelated")
+
+        split = run_cli(
+            ["split", "-k", "2", "-n", "3", "-o", str(prefix)],
+            input_data=b"secret",
+        )
+        assert split.returncode != 0
+        assert not Path(f"{prefix}.1").exists()
+        assert Path(f"{prefix}.2").is_dir()
+        assert Path(f"{prefix}.3").read_bytes() == b"unrelated"
+
+
+def test_cli_combine_streams_to_stdout_and_rejects_corruption():
+    secret = b"streamed-secret" * 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / "share"
+        output_file = Path(tmp) / "recovered.bin"
+
+        split = run_cli(
+            ["split", "-k", "3", "-n", "5", "-o", str(prefix)],
+            input_data=secret,
+        )
+        assert split.returncode == 0, split.stderr
+
+        inputs = [f"{prefix}.{i}" for i in (2, 4, 5)]
+        combine = run_cli(["combine", "--chunk-size", "777", "-i"] + inputs)
+        assert combine.returncode == 0, combine.stderr
+        assert combine.stdout == secret
+
+        corrupted = bytearray(Path(inputs[1]).read_bytes())
+        corrupted[-10] ^= 0xFF
+        Path(inputs[1]).write_bytes(bytes(corrupted))
+
+        combine = run_cli(
+            ["combine", "-i"] + inputs + ["-o", str(output_file)]
+        )
+        assert combine.returncode != 0
+        assert not output_file.exists()
+        assert list(Path(tmp).glob(".recovered*")) == []
+
+
+def test_cli_refresh_rotates_all_shares():
+    secret = b"rotated-secret" * 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / "share"
+        rotated = Path(tmp) / "rotated"
+
+        split = run_cli(
+            ["split", "-k", "2", "-n", "3", "-o", str(prefix)],
+            input_data=secret,
+        )
+        assert split.returncode == 0, split.stderr
+
+        inputs = [f"{prefix}.{i}" for i in (1, 2, 3)]
+        partial = run_cli(
+            ["refresh", "-i"] + inputs[:2] + ["-o", str(rotated)]
+        )
+        assert partial.returncode != 0
+        assert list(Path(tmp).glob("rotated*")) == []
+
+        refresh = run_cli(
+            ["refresh", "--chunk-size", "333", "-i"] + inputs
+            + ["-o", str(rotated)]
+        )
+        assert refresh.returncode == 0, refresh.stderr
+        assert Path(f"{rotated}.1").read_bytes() != Path(inputs[0]).read_bytes()
+
+        combine = run_cli(
+            ["combine", "-i", f"{rotated}.1", f"{rotated}.3"]
+        )
+        assert combine.returncode == 0, combine.stderr
+        assert combine.stdout == secret
+
+
+def test_cli_extend_issues_compatible_shares():
+    secret = b"extended-secret" * 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prefix = Path(tmp) / "share"
+
+        split = run_cli(
+            ["split", "-k", "2", "-n", "3", "-o", str(prefix)],
+            input_data=secret,
+        )
+        assert split.returncode == 0, split.stderr
+
+        extend = run_cli(
+            ["extend", "-c", "2", "--chunk-size", "500", "-i",
+             f"{prefix}.1", f"{prefix}.2", "-o", str(prefix)]
+        )
+        assert extend.returncode == 0, extend.stderr
+
+        combine = run_cli(
+            ["combine", "-i", f"{prefix}.3", f"{prefix}.5"]
+        )
+        assert combine.returncode == 0, combine.stderr
+        assert combine.stdout == secret
+
+
+def test_cli_split_rejects_invalid_threshold():
+    with tempfile.TemporaryDirectory() as tmp:
+        result = run_cli(
+            [
+                "split",
+                "--threshold", "5",
+                "--count", "3",
+                "--output", str(Path(tmp) / "share"),
+            ],
+            input_data=b"secret",
+        )
 
     assert result.returncode != 0
+    assert b"error" in result.stderr
 
 
 def test_cli_combine_rejects_missing_input():
-    result = run_cli(
-        [
-            "combine",
-            "--threshold", "2",
-        ]
-    )
+    result = run_cli(["combine"])
 
     assert result.returncode != 0
 
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import shutil
+import socket
+import stat
+import struct
+import tempfile
+import threading
+
+import pytest
+
+from shamir import backends
+from shamir.core import split
+from shamir.daemon import DaemonClient, DaemonError, ShamirDaemon, _CombineBatcher
+from shamir.format import ShareHeader, encode_share
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, so avoid deep tmp_path dirs.
+    directory = tempfile.mkdtemp(prefix="shamird-")
+    path = os.path.join(directory, "s")
+
+    loop = asyncio.new_event_loop()
+    daemon = ShamirDaemon(path)
+    loop.run_until_complete(daemon.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield path
+
+    async def shutdown():
+        daemon.close()
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    shutil.rmtree(directory)
+
+
+def test_socket_is_owner_only(socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) & 0o077 == 0
+
+
+def test_split_and_combine_reuse_connection(socket_path):
+    with DaemonClient(socket_path) as client:
+        for secret in (b"first", b"second secret", b"\x00" * 40):
+            shares = client.split(secret, 3, 5)
+            assert [index for index, _ in shares] == [1, 2, 3, 4, 5]
+            assert client.combine(shares[2:]) == secret
+
+
+def test_combine_matches_local_split(socket_path):
+    shares = split(b"from the library", 2, 4)
+
+    with DaemonClient(socket_path) as client:
+        assert client.combine(dict(shares[1:3])) == b"from the library"
+
+
+def test_verify_returns_header(socket_path):
+    header = ShareHeader(threshold=2, share_count=3, share_index=2)
+    blob = encode_share(header, b"payload", mac_key=b"key")
+
+    with DaemonClient(socket_path) as client:
+        assert client.verify(blob, mac_key=b"key") == header
+
+        with pytest.raises(DaemonError):
+            client.verify(blob, mac_key=b"wrong")
+
+
+def test_errors_keep_connection_usable(socket_path):
+    with DaemonClient(socket_path) as client:
+        with pytest.raises(DaemonError):
+            client.combine([(1, b"ab"), (1, b"cd")])
+
+        with pytest.raises(DaemonError):
+            client.split(b"secret", 4, 3)
+
+        assert client.combine(client.split(b"still ok", 2, 2)) == b"still ok"
+
+
+def test_slow_reader_is_drained(socket_path):
+    # Many pipelined splits whose responses exceed the socket buffers;
+    # the daemon must wait for the reader rather than buffer them all.
+    secret = b"\x01" * (256 << 10)
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(socket_path)
+        body = bytes([2, 3]) + secret
+        for request_id in range(8):
+            sock.sendall(struct.pack(">IBI", len(body), 1, request_id) + body)
+
+        seen = set()
+        buffer = b""
+        while len(seen) < 8:
+            buffer += sock.recv(1 << 16)
+            while len(buffer) >= 9:
+                length, status, request_id = struct.unpack(">IBI", buffer[:9])
+                if len(buffer) < 9 + length:
+                    break
+                assert status == 0
+                seen.add(request_id)
+                buffer = buffer[9 + length :]
+
+    assert seen == set(range(8))
+
+
+def test_pipelined_requests_are_capped_per_connection():
+    directory = tempfile.mkdtemp(prefix="shamird-")
+    path = os.path.join(directory, "s")
+    started = []
+    release = threading.Event()
+
+    def blocking_split(body):
+        started.append(body)
+        release.wait(5)
+        return b""
+
+    async def scenario():
+        daemon = ShamirDaemon(path, max_in_flight=2)
+        daemon._split = blocking_split
+        await daemon.start()
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            for request_id in range(6):
+                writer.write(struct.pack(">IBI", 2, 1, request_id) + b"\x02\x03")
+            await writer.drain()
+
+            await asyncio.sleep(0.2)
+            in_flight = len(started)
+            release.set()
+
+            for _ in range(6):
+                head = await reader.readexactly(9)
+                length, _, _ = struct.unpack(">IBI", head)
+                await reader.readexactly(length)
+            writer.close()
+            return in_flight
+        finally:
+            release.set()
+            daemon.close()
+
+    try:
+        assert asyncio.run(scenario()) == 2
+        assert len(started) == 6
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_batcher_coalesces_same_indices(monkeypatch):
+    calls = []
+    backend = backends.gf256_backend()
+    original = backend.interpolate
+
+    def counting(xs, payloads, target=0):
+        calls.append(tuple(xs))
+        return original(xs, payloads, target)
+
+    monkeypatch.setattr(backend, "interpolate", counting)
+
+    secrets = [b"alpha", b"beta!", b"gamma-ray"]
+    requests = []
+    for secret in secrets:
+        shares = dict(split(secret, 2, 3))
+        requests.append([shares[1], shares[3]])
+
+    async def scenario():
+        batcher = _CombineBatcher()
+        futures = [batcher.submit((1, 3), rows) for rows in requests]
+        return await asyncio.gather(*futures)
+
+    assert asyncio.run(scenario()) == secrets
+    assert calls == [(1, 3)]
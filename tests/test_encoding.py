@@ -1,7 +1,11 @@
+import base64
+
 import pytest
 
-from shamir.encoding import encode_share, decode_share
+from shamir.core import split_secret
+from shamir.encoding import decode_share, decode_shares, encode_share, encode_shares
 from shamir.errors import ShamirError
+from shamir.exceptions import EncodingError
 
 
 def test_encode_and_decode_roundtrip():
@@ -40,3 +44,47 @@ def test_encoding_is_deterministic():
     encoded_b = encode_share(share)
 
     assert encoded_a == encoded_b
+
+
+def test_prime_shares_use_fixed_width():
+    shares = split_secret(123456789, 3, 5)
+
+    encoded = [encode_share(share) for share in shares]
+    assert len(set(map(len, encoded))) == 1
+    assert [decode_share(item) for item in encoded] == shares
+
+
+def test_batch_roundtrip_and_armor():
+    shares = split_secret(2**200 + 1, 2, 50)
+
+    batch = encode_shares(shares)
+    assert decode_shares(batch) == shares
+
+    for armor in ("base85", "base32"):
+        armored = encode_shares(shares, armor=armor)
+        assert decode_shares(armored, armor=armor) == shares
+
+
+def test_legacy_text_form_still_decodes():
+    legacy = base64.urlsafe_b64encode(b"4:98765432109876543210").decode("ascii")
+
+    assert decode_share(legacy) == (4, 98765432109876543210)
+    assert decode_shares([legacy]) == [(4, 98765432109876543210)]
+
+
+def test_decode_rejects_truncated_batch():
+    batch = encode_shares(split_secret(7, 2, 3))
+
+    with pytest.raises(EncodingError):
+        decode_shares(batch[:-1])
+
+    with pytest.raises(EncodingError):
+        encode_shares([(1, b"ab"), (2, b"abc")])
+
+
+def test_encode_rejects_mixed_payload_kinds():
+    with pytest.raises(EncodingError):
+        encode_shares([(1, 5), (2, b"ab")])
+
+    with pytest.raises(EncodingError):
+        encode_shares([(1, b"ab"), (2, 5)])
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from shamir import fields
+from shamir.core import (
+    reconstruct_many,
+    reconstruct_secret,
+    split_many,
+    split_secret,
+)
+from shamir.errors import ShareFormatError, UnsupportedFieldError
+from shamir.exceptions import InvalidSecretError
+from shamir.format import ShareHeader, decode_share, encode_share
+
+
+PRIME_FIELD_IDS = (
+    fields.FIELD_PRIME257,
+    fields.FIELD_M61,
+    fields.FIELD_M127,
+    fields.FIELD_M521,
+    fields.FIELD_MODP2048,
+)
+
+
+@pytest.mark.parametrize("field", [fields.M61, fields.M127, fields.M521])
+def test_mersenne_reduction_matches_modulo(field):
+    rng = random.Random(field.exponent)
+    for _ in range(200):
+        value = rng.getrandbits(2 * field.exponent + 16)
+        assert field.reduce(value) == value % field.prime
+
+    assert field.reduce(field.prime) == 0
+    assert field.reduce(-1) == field.prime - 1
+
+
+@pytest.mark.parametrize("field_id", PRIME_FIELD_IDS)
+def test_split_and_reconstruct_by_field_id(field_id):
+    field = fields.prime_field(field_id)
+    secret = field.prime - 12345
+
+    shares = split_secret(secret, 3, 5, field_id=field_id)
+    assert all(0 <= y < field.prime for _, y in shares)
+    assert reconstruct_secret(shares[1:4], field_id=field_id) == secret
+
+    columns = split_many([1, 2, secret], 2, 3, field_id=field_id)
+    assert reconstruct_many((1, 3), [columns[1], columns[3]], field_id=field_id) == [
+        1,
+        2,
+        secret,
+    ]
+
+
+def test_prime_argument_selects_registered_field():
+    shares = split_secret(99, 2, 3, prime=fields.M127.prime)
+    assert reconstruct_secret(shares[:2], field_id=fields.FIELD_M127) == 99
+
+
+def test_m127_holds_126_bit_values_but_not_16_byte_keys():
+    secret = (1 << 126) - 1
+    shares = split_secret(secret, 2, 3, field_id=fields.FIELD_M127)
+    assert reconstruct_secret(shares[:2], field_id=fields.FIELD_M127) == secret
+
+    with pytest.raises(InvalidSecretError):
+        split_secret((1 << 128) - 1, 2, 3, field_id=fields.FIELD_M127)
+
+
+def test_unknown_and_non_prime_fields_are_rejected():
+    with pytest.raises(UnsupportedFieldError):
+        split_secret(1, 2, 3, field_id=0x7F)
+
+    with pytest.raises(UnsupportedFieldError):
+        fields.prime_field(fields.FIELD_GF256)
+
+    with pytest.raises(UnsupportedFieldError):
+        fields.register_field(fields.PrimeField(fields.FIELD_M61, "dup", 7))
+
+
+def test_header_accepts_registered_field_ids():
+    for field_id in (fields.FIELD_GF256,) + PRIME_FIELD_IDS:
+        header = ShareHeader(2, 3, 1, field_id=field_id)
+        payload = fields.M127.to_bytes(5)
+        assert decode_share(encode_share(header, payload))[0] == header
+
+    with pytest.raises(ShareFormatError):
+        ShareHeader(2, 3, 1, field_id=0x7F).validate()
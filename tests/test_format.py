@@ -1,10 +1,16 @@
+import io
+
 import pytest
 
 from shamir.format import (
     encode_share,
     decode_share,
+    decode_share_into,
     ShareHeader,
     ShareFormatError,
+    ShareReader,
+    ShareWriter,
+    grow_headers,
 )
 from shamir.integrity import IntegrityError
 
@@ -28,6 +34,32 @@ def test_encode_decode_roundtrip():
     assert decoded_payload == payload
 
 
+def test_decode_returns_view_into_buffer():
+    header = make_header()
+    buffer = bytearray(encode_share(header, b"zero-copy-payload"))
+
+    _, payload = decode_share(memoryview(buffer))
+    assert isinstance(payload, memoryview)
+    assert payload == b"zero-copy-payload"
+
+    buffer[9] = ord("Z")
+    assert payload[0] == ord("Z")
+
+
+def test_decode_share_into_copies_payload():
+    header = make_header()
+    encoded = encode_share(header, b"payload-into", mac_key=b"k")
+    out = bytearray(32)
+
+    decoded_header, size = decode_share_into(encoded, out, mac_key=b"k")
+
+    assert decoded_header == header
+    assert bytes(out[:size]) == b"payload-into"
+
+    with pytest.raises(ShareFormatError):
+        decode_share_into(encoded, bytearray(4), mac_key=b"k")
+
+
 def test_invalid_magic():
     header = make_header()
     payload = b"payload"
@@ -103,3 +135,67 @@ def test_mac_mismatch_detected():
 
     with pytest.raises(IntegrityError):
         decode_share(encoded, mac_key=b"key-b")
+
+
+@pytest.mark.parametrize("mac_key", [None, b"mac-key"])
+def test_share_writer_matches_encode_share(mac_key):
+    header = make_header()
+    chunks = [b"chunk-one", b"", b"chunk-two", b"x" * 5000]
+
+    stream = io.BytesIO()
+    writer = ShareWriter(stream, header, mac_key=mac_key)
+    for chunk in chunks:
+        writer.write(chunk)
+    writer.close()
+
+    assert stream.getvalue() == encode_share(header, b"".join(chunks), mac_key)
+
+
+def test_share_writer_rejects_empty_payload():
+    writer = ShareWriter(io.BytesIO(), make_header())
+
+    with pytest.raises(ShareFormatError):
+        writer.close()
+
+
+@pytest.mark.parametrize("mac_key", [None, b"mac-key"])
+def test_share_reader_streams_payload(mac_key):
+    header = make_header()
+    payload = bytes(range(256)) * 40
+    encoded = encode_share(header, payload, mac_key=mac_key)
+
+    reader = ShareReader(memoryview(encoded), mac_key=mac_key)
+    chunks = [bytes(chunk) for chunk in reader.chunks(1000)]
+
+    assert reader.header == header
+    assert reader.payload_size == len(payload)
+    assert max(map(len, chunks)) == 1000
+    assert b"".join(chunks) == payload
+
+
+def test_share_reader_detects_corruption_at_end_of_stream():
+    encoded = bytearray(encode_share(make_header(), b"payload" * 100))
+    encoded[100] ^= 0x01
+
+    reader = ShareReader(encoded)
+    with pytest.raises(IntegrityError):
+        reader.verify(chunk_size=64)
+
+
+def test_grow_headers_issues_next_indices():
+    headers = [make_header(k=2, n=3, i=i) for i in (1, 3)]
+    grown = grow_headers(headers, 2)
+
+    assert [(h.share_index, h.share_count) for h in grown] == [(4, 5), (5, 5)]
+    for header in grown:
+        header.validate()
+
+    assert grow_headers(headers + grown[1:], 1)[0].share_index == 6
+
+
+def test_grow_headers_rejects_mixed_or_oversized_splits():
+    with pytest.raises(ShareFormatError):
+        grow_headers([make_header(k=2), make_header(k=3)], 1)
+
+    with pytest.raises(ShareFormatError):
+        grow_headers([make_header(k=2, n=250, i=1)], 6)
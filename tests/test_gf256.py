@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from shamir import gf256
+from shamir.core import split, combine
+
+np = pytest.importorskip("numpy")
+from shamir.backends import numpy_backend  # noqa: E402
+
+
+def test_tables_match_reference_multiplication():
+    for a in range(256):
+        for b in (0, 1, 2, 3, 0x53, 0xCA, 0xFF):
+            assert gf256.mul(a, b) == gf256._mul_no_table(a, b)
+            assert numpy_backend.MUL_TABLE[a, b] == gf256._mul_no_table(a, b)
+
+
+def test_known_aes_product():
+    assert gf256.mul(0x53, 0xCA) == 0x01
+    assert gf256.inv(0x53) == 0xCA
+
+
+def test_inverse_and_division():
+    for a in range(1, 256):
+        assert gf256.mul(a, gf256.inv(a)) == 1
+        assert gf256.div(a, a) == 1
+
+    with pytest.raises(ZeroDivisionError):
+        gf256.inv(0)
+
+
+def test_evaluate_matches_scalar_horner():
+    coefficients = np.frombuffer(os.urandom(3 * 16), dtype=np.uint8).reshape(3, 16)
+    xs = [1, 2, 200]
+
+    result = numpy_backend.evaluate(coefficients, xs)
+
+    for row, x in zip(result, xs):
+        for column in range(16):
+            expected = 0
+            for c in coefficients[::-1, column]:
+                expected = gf256.mul(expected, x) ^ int(c)
+            assert row[column] == expected
+
+
+def test_large_secret_any_subset_reconstructs():
+    secret = os.urandom(1 << 20)
+    shares = split(secret=secret, threshold=3, shares=5)
+
+    assert combine(shares[2:]) == secret
+    assert combine(dict([shares[0], shares[3], shares[4]])) == secret
+
+
+def test_lagrange_weights_reject_duplicates():
+    with pytest.raises(ValueError):
+        gf256.lagrange_weights((1, 1))
@@ -5,8 +5,14 @@ from shamir.integrity import (
     verify_crc32,
     hmac_sha256,
     verify_hmac_sha256,
+    chunk_views,
+    verify_chunk_crc32s,
+    chunk_crc32s,
+    merkle_hmac_root,
+    verify_merkle_hmac_root,
     IntegrityError,
 )
+from shamir.errors import ChunkIntegrityError
 
 
 def test_crc32_deterministic():
@@ -64,3 +70,31 @@ def test_hmac_sha256_accepts_valid_data():
     mac = hmac_sha256(data, key)
 
     verify_hmac_sha256(data, key, mac)
+
+
+def test_chunk_crc32s_match_serial_computation():
+    data = bytes(range(256)) * 64
+    chunks = chunk_views(data, 1000)
+
+    assert chunk_crc32s(chunks, workers=4) == [crc32(c) for c in chunks]
+
+
+def test_verify_chunk_crc32s_localizes_corruption():
+    data = bytearray(b"a" * 4096)
+    expected = chunk_crc32s(chunk_views(data, 1024))
+    data[2048] ^= 0x01
+
+    with pytest.raises(ChunkIntegrityError) as excinfo:
+        verify_chunk_crc32s(chunk_views(data, 1024), expected, workers=4)
+    assert excinfo.value.chunks == (2,)
+
+
+def test_merkle_hmac_root_is_order_sensitive():
+    key = b"secret-key"
+    chunks = [b"one", b"two", b"three"]
+    root = merkle_hmac_root(chunks, key)
+
+    assert merkle_hmac_root(chunks, key, workers=1) == root
+    verify_merkle_hmac_root(chunks, key, root)
+    with pytest.raises(IntegrityError):
+        verify_merkle_hmac_root(chunks[::-1], key, root)
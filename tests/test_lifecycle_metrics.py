@@ -0,0 +1,102 @@
+import io
+import json
+from collections import namedtuple
+
+import pytest
+
+from operations import lifecycle
+from operations.context import OperationContext
+from operations.metrics import (
+    JsonLinesSink,
+    MetricsSink,
+    PrometheusTextSink,
+    enabled,
+    register_sink,
+    unregister_sink,
+)
+
+
+Share = namedtuple("Share", "id session_id payload")
+
+
+def make_context(**overrides):
+    values = dict(
+        session_id="session-1",
+        threshold=2,
+        total_shares=3,
+        algorithm_version="v1",
+    )
+    values.update(overrides)
+    return OperationContext(**values)
+
+
+def splitter(secret, threshold, total):
+    return [Share(i, "session-1", secret) for i in range(1, total + 1)]
+
+
+def test_stage_results_carry_timing_and_sizes():
+    context = make_context()
+
+    result, shares = lifecycle.split(b"0123456789", context, splitter)
+    assert result.success
+    assert result.duration >= 0
+    assert result.share_count == 3
+    assert result.payload_bytes == 10
+
+    # Share sizes are only summed while a sink is listening.
+    assert not enabled()
+    result, secret = lifecycle.reconstruct(shares, context, lambda s: s[0].payload)
+    assert secret == b"0123456789"
+    assert result.share_count == 3
+    assert result.payload_bytes == 0
+
+    sink = PrometheusTextSink()
+    register_sink(sink)
+    try:
+        assert enabled()
+        result, _ = lifecycle.reconstruct(shares, context, lambda s: s[0].payload)
+    finally:
+        unregister_sink(sink)
+    assert result.payload_bytes == 30
+
+
+def test_sinks_receive_every_stage():
+    context = make_context()
+    stream = io.StringIO()
+    json_sink = JsonLinesSink(stream)
+    prometheus_sink = PrometheusTextSink()
+
+    register_sink(json_sink)
+    register_sink(prometheus_sink)
+    try:
+        lifecycle.initialize(context)
+        _, shares = lifecycle.split(b"secret", context, splitter)
+        lifecycle.reconstruct(shares[:1], context, lambda s: b"")
+    finally:
+        unregister_sink(json_sink)
+        unregister_sink(prometheus_sink)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["stage"] for r in records] == ["initialize", "split", "verify"]
+    assert records[2]["error_code"] == "INSUFFICIENT_SHARES"
+
+    text = prometheus_sink.render()
+    assert 'shamir_stage_duration_seconds_count{stage="split",outcome="success"} 1' in text
+    assert 'shamir_stage_shares_total{stage="split",outcome="success"} 3' in text
+    assert 'outcome="failure"' in text
+
+
+def test_unregistered_sink_receives_nothing():
+    stream = io.StringIO()
+    sink = JsonLinesSink(stream)
+    register_sink(sink)
+    unregister_sink(sink)
+
+    lifecycle.initialize(make_context())
+
+    assert stream.getvalue() == ""
+
+
+def test_sinks_must_implement_record():
+    with pytest.raises(TypeError):
+        MetricsSink()
@@ -0,0 +1,85 @@
+import os
+from multiprocessing import shared_memory
+
+import pytest
+
+pytest.importorskip("numpy")
+from shamir.core import split, combine, split_chunks, combine_chunks  # noqa: E402
+from shamir.parallel import (  # noqa: E402
+    MIN_SLICE_SIZE,
+    ProcessEngine,
+    pooled_engine,
+)
+
+
+def test_parallel_split_and_combine_roundtrip():
+    secret = os.urandom(4 * MIN_SLICE_SIZE + 123)
+
+    shares = split(secret=secret, threshold=3, shares=5, jobs=2)
+
+    assert combine(shares[1:4], jobs=2) == secret
+    assert combine(shares[:3]) == secret
+
+
+def test_parallel_combine_matches_serial():
+    secret = os.urandom(3 * MIN_SLICE_SIZE)
+    shares = split(secret=secret, threshold=2, shares=3, seed=7)
+
+    assert combine(shares[1:], jobs=3) == combine(shares[1:])
+
+
+def test_seeded_split_ignores_jobs():
+    secret = os.urandom(2 * MIN_SLICE_SIZE)
+
+    serial = split(secret=secret, threshold=2, shares=3, seed=11)
+    parallel = split(secret=secret, threshold=2, shares=3, seed=11, jobs=2)
+
+    assert serial == parallel
+
+
+def test_engine_reuses_buffers_across_chunks():
+    sizes = [3 * MIN_SLICE_SIZE, 10, 5 * MIN_SLICE_SIZE]
+    chunks = [os.urandom(size) for size in sizes]
+
+    payloads = {}
+    for shares in split_chunks(chunks, threshold=2, shares=3, jobs=2):
+        for index, payload in shares:
+            payloads.setdefault(index, []).append(payload)
+
+    recovered = combine_chunks((1, 3), [payloads[1], payloads[3]], jobs=2)
+    assert list(recovered) == chunks
+
+
+def test_engine_close_releases_shared_memory():
+    engine = ProcessEngine(jobs=2)
+    engine.split(os.urandom(MIN_SLICE_SIZE * 2), 2, (1, 2, 3))
+    names = [block.name for block in engine._blocks.values()]
+    engine.close()
+
+    for name in names:
+        assert not os.path.exists(f"/dev/shm/{name}")
+
+
+def test_engine_fills_caller_shared_memory():
+    secret = os.urandom(2 * MIN_SLICE_SIZE)
+    block = shared_memory.SharedMemory(create=True, size=3 * len(secret))
+    try:
+        with ProcessEngine(jobs=2) as engine:
+            rows = engine.split(secret, 2, (1, 2, 3), out=block)
+            assert bytes(block.buf[: len(secret)]) == bytes(rows[0])
+            recovered = engine.interpolate((1, 3), [rows[0], rows[2]])
+            assert bytes(recovered) == secret
+            del rows, recovered
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_pooled_engine_is_reused_between_calls():
+    with pooled_engine(2) as first:
+        # An interleaved caller must not share the busy engine.
+        with pooled_engine(2) as second:
+            assert second is not first
+
+    with pooled_engine(2) as again:
+        assert again in (first, second)
@@ -0,0 +1,56 @@
+import pytest
+
+from shamir.randomness import (
+    HmacDrbg,
+    SystemRandomSource,
+    field_elements,
+    source_for,
+)
+
+
+def test_hmac_drbg_nist_known_answer():
+    # NIST CAVP HMAC_DRBG SHA-256, no prediction resistance, COUNT = 0.
+    entropy = bytes.fromhex(
+        "ca851911349384bffe89de1cbdc46e6831e44d34a4fb935ee285dd14b71a7488"
+    )
+    nonce = bytes.fromhex("659ba96c601dc69fc902940805ec0ca8")
+    expected = bytes.fromhex(
+        "e528e9abf2dece54d47c7e75e5fe302149f817ea9fb4bee6f4199697d04d5b89"
+        "d54fbb978a15b5c443c9ec21036d2460b6f73ebad0dc2aba6e624abf07745bc1"
+        "07694bb7547bb0995f70de25d6b29e2d3011bb19d27676c07162c8b5ccde0668"
+        "961df86803482cb37ed6d5c0bb8d50cf1f50d476aa0458bdaba806f48be9dcb8"
+    )
+
+    drbg = HmacDrbg(entropy + nonce)
+    drbg.read(128)
+
+    assert drbg.read(128) == expected
+
+
+def test_hmac_drbg_is_deterministic_and_seed_sensitive():
+    assert HmacDrbg(42).read(100000) == HmacDrbg(42).read(100000)
+    assert HmacDrbg(42).read(32) != HmacDrbg(43).read(32)
+
+
+def test_readinto_fills_buffer():
+    buffer = bytearray(70000)
+    SystemRandomSource().readinto(buffer)
+    assert buffer.count(0) < len(buffer) // 100
+
+    seeded = bytearray(70000)
+    HmacDrbg(b"seed").readinto(seeded)
+    assert bytes(seeded) == HmacDrbg(b"seed").read(70000)
+
+
+def test_field_elements_are_reduced():
+    prime = 2**61 - 1
+    elements = field_elements(source_for(7), 1000, prime)
+
+    assert len(elements) == 1000
+    assert all(0 <= e < prime for e in elements)
+    assert elements == field_elements(source_for(7), 1000, prime)
+
+
+def test_seed_type_is_validated():
+    with pytest.raises(TypeError):
+        HmacDrbg(1.5)
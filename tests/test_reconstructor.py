@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from shamir import fields
+from shamir.core import (
+    ByteReconstructor,
+    Reconstructor,
+    split,
+    split_secret,
+)
+from shamir.errors import DuplicateShareError, ReconstructionError
+from shamir.format import ShareHeader, ShareReader, encode_share
+from shamir.integrity import IntegrityError
+
+
+def test_secret_available_once_threshold_is_met():
+    shares = split_secret(987654321, 4, 7)
+    reconstructor = Reconstructor(4)
+
+    for x, y in shares[3:]:
+        assert not reconstructor.ready
+        with pytest.raises(ReconstructionError):
+            reconstructor.secret
+        reconstructor.add_share(x, y)
+
+    assert reconstructor.ready
+    assert reconstructor.indices == (4, 5, 6, 7)
+    assert reconstructor.secret == 987654321
+
+
+@pytest.mark.parametrize("field_id", [fields.FIELD_M61, fields.FIELD_M521])
+def test_reconstructor_registered_fields(field_id):
+    shares = split_secret(2**60 - 3, 3, 5, field_id=field_id)
+    reconstructor = Reconstructor(3, field_id=field_id)
+    for x, y in (shares[4], shares[0], shares[2]):
+        reconstructor.add_share(x, y)
+
+    assert reconstructor.secret == 2**60 - 3
+
+
+def test_reconstructor_rejects_duplicates_and_extra_shares():
+    shares = split_secret(7, 2, 3)
+    reconstructor = Reconstructor(2)
+    reconstructor.add_share(*shares[0])
+
+    with pytest.raises(DuplicateShareError):
+        reconstructor.add_share(*shares[0])
+    with pytest.raises(ReconstructionError):
+        reconstructor.add_share(0, 1)
+
+    reconstructor.add_share(*shares[1])
+    with pytest.raises(ReconstructionError):
+        reconstructor.add_share(*shares[2])
+    assert reconstructor.secret == 7
+
+
+def test_byte_reconstructor_whole_payloads():
+    secret = os.urandom(1000)
+    shares = split(secret, 3, 6)
+    reconstructor = ByteReconstructor(3)
+
+    for index, payload in (shares[5], shares[0], shares[3]):
+        reconstructor.add_share(index, payload)
+
+    assert reconstructor.secret == secret
+
+
+def test_byte_reconstructor_streams_chunks():
+    secret = os.urandom(5000)
+    reconstructor = ByteReconstructor(2)
+
+    for index, payload in split(secret, 2, 3)[1:]:
+        blob = encode_share(ShareHeader(2, 3, index), payload)
+        reconstructor.add_share(index, ShareReader(blob).chunks(777))
+
+    assert reconstructor.secret == secret
+
+
+def test_byte_reconstructor_failed_share_leaves_state_intact():
+    secret = b"ceremony secret" * 20
+    shares = split(secret, 2, 3)
+    reconstructor = ByteReconstructor(2)
+    reconstructor.add_share(*shares[0])
+
+    corrupted = bytearray(encode_share(ShareHeader(2, 3, 2), shares[1][1]))
+    corrupted[-1] ^= 0xFF
+    with pytest.raises(IntegrityError):
+        reconstructor.add_share(2, ShareReader(corrupted).chunks(64))
+
+    with pytest.raises(ReconstructionError):
+        reconstructor.add_share(2, shares[1][1][:-1])
+
+    assert len(reconstructor) == 1
+    reconstructor.add_share(*shares[2])
+    assert reconstructor.secret == secret
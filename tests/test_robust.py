@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from shamir import robust
+from shamir.core import (
+    combine_robust,
+    reconstruct_secret_robust,
+    split,
+    split_secret,
+)
+from shamir.errors import DecodingError, ShamirError
+from shamir.exceptions import ReconstructionError
+
+
+def corrupt_prime(shares, positions):
+    return [
+        (x, y + 1 if i in positions else y) for i, (x, y) in enumerate(shares)
+    ]
+
+
+def test_prime_clean_shares_report_nothing():
+    shares = split_secret(123456789, 3, 7)
+    assert reconstruct_secret_robust(shares, 3) == (123456789, ())
+
+
+def test_prime_corrects_up_to_bound():
+    shares = split_secret(2024, 4, 10)
+
+    # floor((10 - 4) / 2) = 3 correctable errors.
+    damaged = corrupt_prime(shares, {0, 4, 9})
+    assert reconstruct_secret_robust(damaged, 4) == (2024, (1, 5, 10))
+
+    with pytest.raises(ReconstructionError):
+        reconstruct_secret_robust(corrupt_prime(shares, {0, 1, 2, 3}), 4)
+
+
+def test_prime_rejects_bad_input():
+    shares = split_secret(5, 3, 5)
+
+    with pytest.raises(ReconstructionError):
+        reconstruct_secret_robust(shares[:2], 3)
+
+    with pytest.raises(ReconstructionError):
+        reconstruct_secret_robust(shares + shares[:1], 3)
+
+
+def test_bytes_corrects_whole_and_partial_corruption():
+    secret = os.urandom(512)
+    shares = [(i, bytearray(p)) for i, p in split(secret, 3, 9)]
+
+    shares[1] = (shares[1][0], bytearray(os.urandom(512)))
+    shares[4][1][100] ^= 0x5A
+    shares[7][1][511] ^= 0x01
+
+    result, bad = combine_robust([(i, bytes(p)) for i, p in shares], 3)
+    assert result == secret
+    assert bad == (2, 5, 8)
+
+
+def test_bytes_clean_and_too_many_errors():
+    secret = b"robust reconstruction"
+    shares = split(secret, 3, 6)
+    assert combine_robust(dict(shares), 3) == (secret, ())
+
+    damaged = [(i, os.urandom(len(secret))) for i, _ in shares[:2]] + shares[2:]
+    with pytest.raises(ReconstructionError):
+        combine_robust(damaged, 3)
+
+
+def test_berlekamp_welch_over_gf256():
+    # P(x) = 7 + 3x over GF(256), evaluated at x = 1..6 with one error.
+    xs = [1, 2, 3, 4, 5, 6]
+    ys = [7 ^ robust.GF256_OPS.mul(3, x) for x in xs]
+    ys[2] ^= 0xFF
+
+    coefficients, bad = robust.berlekamp_welch(xs, ys, 2, robust.GF256_OPS)
+    assert coefficients == [7, 3]
+    assert bad == (2,)
+
+
+def test_decoder_failures_use_the_package_hierarchy():
+    with pytest.raises(DecodingError) as excinfo:
+        robust.berlekamp_welch([1, 2], [3, 4], 3, robust.GF256_OPS)
+
+    assert isinstance(excinfo.value, ReconstructionError)
+    assert isinstance(excinfo.value, ShamirError)
@@ -0,0 +1,243 @@
+import pytest
+
+from shamir import fields
+from shamir.core import (
+    combine,
+    extend,
+    extend_many,
+    extend_shares,
+    reconstruct_many,
+    reconstruct_secret,
+    refresh,
+    refresh_chunks,
+    refresh_many,
+    refresh_shares,
+    split,
+    split_many,
+    split_secret,
+)
+from shamir.errors import ReconstructionError, RefreshError
+from shamir.exceptions import InvalidShareCountError
+from shamir.format import ShareHeader, decode_share, encode_share
+from shamir.rotation import extend_encoded, refresh_batches, refresh_encoded
+
+
+def encode_split(shares, k, field_id=fields.FIELD_GF256, mac_key=None):
+    return [
+        encode_share(
+            ShareHeader(
+                threshold=k,
+                share_count=len(shares),
+                share_index=index,
+                field_id=field_id,
+            ),
+            payload,
+            mac_key,
+        )
+        for index, payload in shares
+    ]
+
+
+def decode_split(blobs, mac_key=None):
+    pairs = []
+    for blob in blobs:
+        header, payload = decode_share(blob, mac_key)
+        pairs.append((header.share_index, bytes(payload)))
+    return pairs
+
+
+def test_refresh_shares_preserves_secret():
+    shares = split_secret(4242, 3, 5)
+    refreshed = refresh_shares(shares, 3)
+
+    assert [x for x, _ in refreshed] == [x for x, _ in shares]
+    assert refreshed != shares
+    assert reconstruct_secret(refreshed[2:]) == 4242
+
+
+def test_refreshed_and_stale_shares_do_not_mix():
+    shares = split(b"rotate me", 2, 3)
+    refreshed = refresh(shares, 2)
+
+    assert combine(refreshed[:2]) == b"rotate me"
+    assert combine([shares[0], refreshed[1]]) != b"rotate me"
+
+
+def test_refresh_many_preserves_every_secret():
+    columns = split_many(range(20), 3, 4)
+    refreshed = refresh_many(
+        (1, 2, 3, 4), [columns[x] for x in (1, 2, 3, 4)], 3
+    )
+
+    assert reconstruct_many((2, 3, 4), refreshed[1:]) == list(range(20))
+
+
+def test_seeded_refresh_is_deterministic():
+    shares = split(b"seeded", 3, 4)
+    assert refresh(shares, 3, seed=b"s") == refresh(shares, 3, seed=b"s")
+
+
+def test_refresh_chunks_matches_secret():
+    secret = bytes(range(256)) * 3
+    shares = dict(split(secret, 2, 3))
+    streams = [
+        [shares[index][i : i + 100] for i in range(0, len(secret), 100)]
+        for index in (1, 2, 3)
+    ]
+
+    refreshed = {1: b"", 2: b"", 3: b""}
+    for step in refresh_chunks((1, 2, 3), streams, 2):
+        for index, chunk in step:
+            refreshed[index] += chunk
+
+    assert combine({1: refreshed[1], 3: refreshed[3]}) == secret
+
+
+def test_refresh_encoded_gf256_keeps_headers():
+    blobs = encode_split(split(b"blob secret", 3, 4), 3, mac_key=b"k")
+    refreshed = refresh_encoded(blobs, mac_key=b"k")
+
+    for old, new in zip(blobs, refreshed):
+        assert decode_share(old, b"k")[0] == decode_share(new, b"k")[0]
+    assert combine(decode_split(refreshed[1:], b"k")) == b"blob secret"
+
+
+def test_refresh_encoded_prime_field():
+    field = fields.get_field(fields.FIELD_M127)
+    shares = split_secret(10**30, 2, 3, field_id=fields.FIELD_M127)
+    blobs = encode_split(
+        [(x, field.to_bytes(y)) for x, y in shares], 2, fields.FIELD_M127
+    )
+
+    refreshed = [
+        (index, field.from_bytes(payload))
+        for index, payload in decode_split(refresh_encoded(blobs))
+    ]
+    assert refreshed != shares
+    assert reconstruct_secret(refreshed[:2], field_id=fields.FIELD_M127) == 10**30
+
+
+def test_refresh_encoded_requires_complete_split():
+    blobs = encode_split(split(b"partial", 2, 3), 2)
+
+    with pytest.raises(RefreshError):
+        refresh_encoded(blobs[:2])
+
+    with pytest.raises(RefreshError):
+        refresh_encoded([blobs[0], blobs[0], blobs[1]])
+
+
+def test_refresh_batches_decodes_each_blob_once(monkeypatch):
+    from shamir import rotation
+
+    calls = []
+    original = rotation.decode_share
+
+    def counting(blob, mac_key=None):
+        calls.append(blob)
+        return original(blob, mac_key)
+
+    monkeypatch.setattr(rotation, "decode_share", counting)
+
+    splits = [encode_split(split(secret, 2, 3), 2) for secret in (b"a", b"bc")]
+    results = list(refresh_batches(splits))
+
+    assert len(calls) == 6
+    assert combine(decode_split(results[1])[:2]) == b"bc"
+
+
+def test_refresh_batches_mixes_fields():
+    field = fields.get_field(fields.FIELD_M61)
+    secrets = [7, 8, 9]
+    splits = [
+        encode_split(
+            [(x, field.to_bytes(y)) for x, y in split_secret(s, 2, 3, field_id=fields.FIELD_M61)],
+            2,
+            fields.FIELD_M61,
+        )
+        for s in secrets
+    ]
+    splits.insert(1, encode_split(split(b"bytes", 2, 3), 2))
+
+    results = list(refresh_batches(splits, batch_size=2))
+    assert len(results) == 4
+
+    assert combine(decode_split(results[1])[:2]) == b"bytes"
+    for blobs, secret in zip(results[:1] + results[2:], secrets):
+        values = [(x, field.from_bytes(p)) for x, p in decode_split(blobs)]
+        assert reconstruct_secret(values[1:], field_id=fields.FIELD_M61) == secret
+
+
+def test_extend_shares_lie_on_the_same_polynomial():
+    shares = split_secret(31337, 3, 5)
+    extended = extend_shares(shares[1:4], 3, (6, 9))
+
+    assert [x for x, _ in extended] == [6, 9]
+    assert reconstruct_secret([shares[0]] + extended) == 31337
+    assert extend_shares(shares[:3], 3, (6,)) == extended[:1]
+
+
+def test_extend_rejects_issued_indices():
+    shares = split_secret(5, 2, 3)
+    with pytest.raises(ReconstructionError):
+        extend_shares(shares[:2], 2, (2,))
+    with pytest.raises(ReconstructionError):
+        extend(split(b"x", 2, 3)[:2], 2, (4, 4))
+
+
+def test_extend_requires_exactly_threshold_shares():
+    shares = split_secret(5, 3, 5)
+    with pytest.raises(InvalidShareCountError):
+        extend_shares(shares[:2], 3, (6,))
+    with pytest.raises(InvalidShareCountError):
+        extend_shares(shares[:4], 3, (6,))
+    with pytest.raises(InvalidShareCountError):
+        extend(split(b"x", 2, 3), 2, (4,))
+
+
+def test_extend_many_matches_single_extension():
+    columns = split_many(range(30), 2, 3)
+    extended = extend_many((1, 3), [columns[1], columns[3]], 2, (4, 5))
+
+    assert reconstruct_many((4, 5), [extended[4], extended[5]]) == list(range(30))
+    assert extended[4][7] == extend_shares(
+        [(1, columns[1][7]), (3, columns[3][7])], 2, (4,)
+    )[0][1]
+
+
+def test_extend_gf256_shares_combine_with_old_ones():
+    shares = split(b"new custodian", 3, 4)
+    extended = dict(extend(shares[:3], 3, (5, 200)))
+
+    assert combine({4: shares[3][1], 5: extended[5], 200: extended[200]}) == (
+        b"new custodian"
+    )
+
+
+def test_extend_encoded_grows_share_count():
+    blobs = encode_split(split(b"grow", 2, 3), 2)
+    new = extend_encoded(blobs, 2)
+
+    headers = [decode_share(blob)[0] for blob in new]
+    assert [(h.share_index, h.share_count) for h in headers] == [(4, 5), (5, 5)]
+    assert combine(decode_split([blobs[2], new[1]])) == b"grow"
+
+    rotated = refresh_encoded(blobs + new)
+    assert combine(decode_split(rotated[3:])) == b"grow"
+    with pytest.raises(RefreshError):
+        refresh_encoded(blobs[1:] + new)
+
+
+def test_extend_encoded_prime_field():
+    field = fields.get_field(fields.FIELD_M61)
+    shares = split_secret(12345, 2, 2, field_id=fields.FIELD_M61)
+    blobs = encode_split(
+        [(x, field.to_bytes(y)) for x, y in shares], 2, fields.FIELD_M61
+    )
+
+    (new,) = extend_encoded(blobs, 1)
+    header, payload = decode_share(new)
+    assert header.share_index == 3
+    assert reconstruct_secret(
+        [shares[0], (3, field.from_bytes(payload))], field_id=fields.FIELD_M61
+    ) == 12345
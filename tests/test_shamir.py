@@ -1,6 +1,11 @@
 import unittest
 
-from shamir.core import split_secret, reconstruct_secret
+from shamir.core import (
+    split_secret,
+    split_many,
+    reconstruct_secret,
+    reconstruct_many,
+)
 from shamir.encoding import encode_shares, decode_shares
 from shamir.exceptions import (
     InvalidThresholdError,
@@ -30,6 +35,44 @@ class TestShamirSecretSharing(unittest.TestCase):
         recovered = reconstruct_secret(decoded[:3])
         self.assertEqual(recovered, secret)
 
+    def test_reconstruct_rejects_duplicate_indices(self):
+        shares = split_secret(555, threshold=2, shares_count=3)
+
+        with self.assertRaises(ReconstructionError):
+            reconstruct_secret([shares[0], shares[0]])
+
+    def test_reconstruct_from_any_subset(self):
+        secret = 2024
+        shares = split_secret(secret, threshold=3, shares_count=6)
+
+        for subset in (shares[:3], shares[3:], shares[::2], shares):
+            self.assertEqual(reconstruct_secret(subset), secret)
+
+    def test_split_many_is_column_oriented(self):
+        secrets = [1, 22, 333, 4444]
+        columns = split_many(secrets, threshold=3, shares_count=5)
+
+        self.assertEqual(sorted(columns), [1, 2, 3, 4, 5])
+        for position, secret in enumerate(secrets):
+            shares = [(x, columns[x][position]) for x in (2, 4, 5)]
+            self.assertEqual(reconstruct_secret(shares), secret)
+
+    def test_split_many_validates_every_secret(self):
+        with self.assertRaises(InvalidSecretError):
+            split_many([1, -1], threshold=2, shares_count=3)
+
+    def test_reconstruct_many_roundtrip(self):
+        secrets = list(range(1000, 1100))
+        columns = split_many(secrets, threshold=3, shares_count=5)
+
+        x_values = (1, 3, 5)
+        recovered = reconstruct_many(x_values, [columns[x] for x in x_values])
+        self.assertEqual(recovered, secrets)
+
+    def test_reconstruct_many_rejects_ragged_columns(self):
+        with self.assertRaises(ReconstructionError):
+            reconstruct_many((1, 2), [[1, 2], [3]])
+
     def test_invalid_threshold(self):
         with self.assertRaises(InvalidThresholdError):
             split_secret(42, threshold=1, shares_count=5)
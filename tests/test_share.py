@@ -0,0 +1,124 @@
+import pytest
+
+from operations import lifecycle
+from operations.context import OperationContext
+from operations.errors import OperationError
+from operations.metrics import PrometheusTextSink, register_sink, unregister_sink
+from operations.verify import verify_shares
+from shamir.core import combine, reconstruct_secret, split, split_secret
+from shamir.errors import DuplicateShareError, ShareFormatError
+from shamir.format import ShareHeader, encode_share, load_share
+from shamir.share import Share, ShareSet
+
+
+def make_context():
+    return OperationContext(
+        session_id="session-1",
+        threshold=3,
+        total_shares=5,
+        algorithm_version="v1",
+    )
+
+
+def test_share_unpacks_and_hides_payload():
+    share = Share(3, b"secret", "session-1")
+
+    index, payload = share
+    assert (index, payload) == (3, b"secret")
+    assert share.id == 3
+    assert "secret" not in repr(share)
+    assert share == Share(3, b"secret", "session-1")
+    assert share != Share(3, b"secret", "other")
+
+
+def test_share_set_membership_and_duplicates():
+    share_set = ShareSet.from_shares(split(b"payload", 3, 5), "session-1")
+
+    assert len(share_set) == 5
+    assert share_set.indices == (1, 2, 3, 4, 5)
+    assert 5 in share_set and 6 not in share_set and 0 not in share_set
+    assert share_set.nbytes == 5 * len(b"payload")
+    assert share_set.get(2).session_id == "session-1"
+    assert share_set.get(9) is None
+
+    with pytest.raises(DuplicateShareError):
+        share_set.add(2, b"x" * 7)
+
+    with pytest.raises(ValueError):
+        share_set.add(6, b"short")
+
+
+def test_share_set_sparse_large_indices():
+    shares = ShareSet(2)
+    shares.add(0xFFFFFFFF, b"hi")
+    shares.add(7, b"lo")
+
+    assert 0xFFFFFFFF in shares and 8 not in shares
+    assert shares.get(0xFFFFFFFF).payload == b"hi"
+    assert shares.indices == (0xFFFFFFFF, 7)
+    with pytest.raises(DuplicateShareError):
+        shares.add(0xFFFFFFFF, b"xx")
+
+
+def test_share_set_lookup_after_out_of_order_inserts():
+    shares = ShareSet(1)
+    order = [3, 9, 5, 1, 12, 4]
+    for row, index in enumerate(order):
+        shares.add(index, bytes([row]))
+
+    assert shares.indices == tuple(order)
+    for row, index in enumerate(order):
+        assert shares.get(index).payload == bytes([row])
+    assert 2 not in shares and 13 not in shares
+    with pytest.raises(DuplicateShareError):
+        shares.add(5, b"x")
+
+
+def test_core_accepts_share_sets():
+    byte_set = ShareSet.from_shares(split(b"bytes secret", 3, 5))
+    assert combine(byte_set) == b"bytes secret"
+    assert combine(list(byte_set)[2:]) == b"bytes secret"
+
+    prime_set = ShareSet.from_shares(split_secret(987654321, 3, 5))
+    assert prime_set.integer
+    assert reconstruct_secret(prime_set) == 987654321
+    assert dict(prime_set.pairs())[4] == prime_set.get(4).payload
+
+
+def test_format_roundtrip_with_share():
+    header = ShareHeader(threshold=2, share_count=3, share_index=2)
+    blob = encode_share(header, Share(2, b"payload"))
+
+    decoded_header, share = load_share(blob, session_id="session-1")
+    assert decoded_header == header
+    assert share == Share(2, b"payload", "session-1")
+
+    with pytest.raises(ShareFormatError):
+        encode_share(header, Share(1, b"payload"))
+
+
+def test_verify_and_lifecycle_accept_share_sets():
+    context = make_context()
+    shares = ShareSet.from_shares(split(b"abc", 3, 5), "session-1")
+
+    assert verify_shares(shares, context) is None
+    assert verify_shares(list(shares), context) is None
+
+    sink = PrometheusTextSink()
+    register_sink(sink)
+    try:
+        result = lifecycle.verify(shares, context)
+    finally:
+        unregister_sink(sink)
+    assert result.success
+    assert result.share_count == 5
+    assert result.payload_bytes == 15
+
+    foreign = ShareSet.from_shares(split(b"abc", 3, 5), "session-2")
+    assert (
+        verify_shares(foreign, context)
+        == OperationError.SHARE_CONTEXT_MISMATCH.value
+    )
+
+    result, secret = lifecycle.reconstruct(shares, context, combine)
+    assert result.success and secret == b"abc"
@@ -1,6 +1,6 @@
 import pytest
 
-from shamir.core import split
+from shamir.core import split, split_chunks, combine
 from shamir.errors import ShamirError
 
 
@@ -45,3 +45,21 @@ def test_split_produces_distinct_shares():
     result = split(secret=secret, threshold=threshold, shares=shares)
 
     assert len(set(result)) == shares
+
+
+def test_split_chunks_matches_whole_secret_layout():
+    secret = bytes(range(256)) * 10
+    chunks = [secret[i : i + 1000] for i in range(0, len(secret), 1000)]
+
+    payloads = {}
+    for shares in split_chunks(chunks, threshold=3, shares=4):
+        for index, payload in shares:
+            payloads[index] = payloads.get(index, b"") + payload
+
+    assert sorted(payloads) == [1, 2, 3, 4]
+    assert combine({i: payloads[i] for i in (1, 3, 4)}) == secret
+
+
+def test_split_chunks_rejects_empty_stream():
+    with pytest.raises(ShamirError):
+        list(split_chunks(iter([b""]), threshold=2, shares=3))
@@ -0,0 +1,145 @@
+import pytest
+
+from operations.context import OperationContext
+from operations.errors import OperationError
+from operations.verify import verify_shares as verify_operation
+from shamir import fields, vss
+from shamir.core import reconstruct_secret
+from shamir.errors import ShareFormatError, VerificationError
+from shamir.format import ShareHeader, encode_share
+from shamir.integrity import IntegrityError
+from shamir.randomness import HmacDrbg
+from shamir.share import Share
+
+
+def test_generators_lie_in_the_prime_order_subgroup():
+    assert pow(vss.G, vss.Q, vss.P) == 1
+    assert pow(vss.H, vss.Q, vss.P) == 1
+    assert vss.H not in (1, vss.G)
+
+
+def test_legendre_symbol_matches_euler_criterion():
+    for value in (1, 2, 3, vss.H, vss.P - 1, vss.P - vss.H):
+        euler = pow(value, vss.Q, vss.P)
+        assert vss._in_subgroup(value) == (euler == 1)
+
+
+def test_commitments_with_order_two_component_are_rejected():
+    shares, commitments = vss.feldman_split(11, 3, 10)
+    # -C_0 = C_0 * (P - 1) keeps the subgroup part but adds an element of
+    # order 2, which random batch weights would cancel half the time.
+    forged = vss.Commitments(
+        vss.FELDMAN,
+        (vss.P - commitments.values[0],) + commitments.values[1:],
+    )
+
+    with pytest.raises(VerificationError):
+        vss.verify_shares(shares, forged)
+    with pytest.raises(VerificationError):
+        vss.verify_share(shares[0], forged)
+    with pytest.raises(ShareFormatError):
+        vss.decode_commitments(vss.encode_commitments(forged))
+
+
+def test_zero_secret_commitment_is_accepted():
+    shares, commitments = vss.feldman_split(0, 2, 3)
+    assert commitments.values[0] == 1
+    assert vss.decode_commitments(vss.encode_commitments(commitments)) == commitments
+    assert vss.verify_shares(shares, commitments) == []
+
+
+def test_fixed_base_and_multi_exponentiation_match_pow():
+    exponent = vss.Q - 12345
+    assert vss._generator_table(vss.G).pow(exponent) == pow(vss.G, exponent, vss.P)
+
+    bases = (3, 5, vss.H)
+    exponents = (2**200 + 7, 0, 123456789)
+    expected = 1
+    for base, power in zip(bases, exponents):
+        expected = expected * pow(base, power, vss.P) % vss.P
+    assert vss._multi_exp(bases, exponents) == expected
+
+
+def test_feldman_shares_verify_and_reconstruct():
+    shares, commitments = vss.feldman_split(2**100 + 1, 3, 6)
+
+    assert commitments.threshold == 3
+    assert commitments.values[0] == pow(vss.G, 2**100 + 1, vss.P)
+    assert all(vss.verify_share(share, commitments) for share in shares)
+    assert vss.verify_shares(shares, commitments) == []
+    assert reconstruct_secret(shares[2:5], field_id=fields.FIELD_MODP2048) == 2**100 + 1
+
+
+def test_pedersen_shares_verify():
+    shares, commitments = vss.pedersen_split(42, 4, 9, rng=HmacDrbg(b"pedersen"))
+
+    assert vss.verify_shares(shares, commitments) == []
+    x, y, t = shares[3]
+    assert not vss.verify_share((x, y, (t + 1) % vss.Q), commitments)
+
+    with pytest.raises(VerificationError):
+        vss.verify_shares([(x, y)], commitments)
+
+
+def test_batch_names_every_invalid_share():
+    shares, commitments = vss.feldman_split(7, 2, 40)
+    tampered = list(shares)
+    tampered[5] = (6, (shares[5][1] + 1) % vss.Q)
+    tampered[30] = (31, vss.Q)
+
+    assert vss.verify_shares(tampered, commitments) == [6, 31]
+    assert not vss.verify_share(tampered[5], commitments)
+
+
+def test_commitment_serialization_roundtrip_and_corruption():
+    _, commitments = vss.pedersen_split(1, 3, 3)
+    blob = vss.encode_commitments(commitments)
+    assert vss.decode_commitments(blob) == commitments
+
+    corrupted = bytearray(blob)
+    corrupted[20] ^= 1
+    with pytest.raises(IntegrityError):
+        vss.decode_commitments(corrupted)
+
+    with pytest.raises(ShareFormatError):
+        vss.decode_commitments(blob[:-1])
+    with pytest.raises(ShareFormatError):
+        vss.decode_commitments(b"XXXX" + blob[4:])
+
+
+def test_verify_encoded_feldman_shares():
+    shares, commitments = vss.feldman_split(99, 2, 3)
+    field = fields.MODP2048
+    blobs = [
+        encode_share(
+            ShareHeader(2, 3, x, fields.FIELD_MODP2048), field.to_bytes(y), b"mac"
+        )
+        for x, y in shares
+    ]
+    serialized = vss.encode_commitments(commitments)
+
+    assert vss.verify_encoded(blobs, serialized, mac_key=b"mac") == []
+
+    forged = encode_share(
+        ShareHeader(2, 3, 2, fields.FIELD_MODP2048), field.to_bytes(5), b"mac"
+    )
+    assert vss.verify_encoded([blobs[0], forged], serialized, b"mac") == [2]
+
+
+def test_operation_verify_checks_commitments():
+    context = OperationContext(
+        session_id="vss",
+        threshold=2,
+        total_shares=3,
+        algorithm_version="v1",
+    )
+    shares, commitments = vss.feldman_split(5, 2, 3)
+    wrapped = [Share(x, y, "vss") for x, y in shares]
+
+    assert verify_operation(wrapped, context, commitments) is None
+
+    wrapped[1] = Share(2, shares[1][1] ^ 1, "vss")
+    assert (
+        verify_operation(wrapped, context, commitments)
+        == OperationError.VERIFICATION_FAILED.value
+    )